@@ -1,16 +1,41 @@
-from .models import FunctionInfo, FunctionCall, CallTree, CallTreeBuilder, ProjectInfo, FileInfo
-from .analyzer import CallTreeAnalyzer, FileAnalyzer
-from .parsers import get_parser, get_supported_languages
+import time
+
+# CLI 시작 시간 예산 검사의 기준 시각 (패키지 import 시작 시점)
+_IMPORT_STARTED_AT = time.perf_counter()
+
+import importlib
+
+from .models import FunctionInfo, FunctionCall, FunctionMetrics, CallTree, CallTreeBuilder, ProjectInfo, FileInfo, FileResult
+
+# analyzer/parsers는 처음 접근할 때 import (CLI 시작 시간 단축)
+_LAZY_ATTRIBUTES = {
+    'CallTreeAnalyzer': '.analyzer',
+    'FileAnalyzer': '.analyzer',
+    'get_parser': '.parsers',
+    'get_supported_languages': '.parsers',
+    'register_parser': '.parsers',
+}
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'FunctionInfo',
     'FunctionCall', 
+    'FunctionMetrics',
     'CallTree',
     'CallTreeBuilder',
     'ProjectInfo',
     'FileInfo',
+    'FileResult',
     'CallTreeAnalyzer',
     'FileAnalyzer',
     'get_parser',
-    'get_supported_languages'
+    'get_supported_languages',
+    'register_parser'
 ]
\ No newline at end of file
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from pathlib import Path
+from concurrent.futures import Executor
+from typing import Optional, Iterable, Tuple, AsyncIterator, Callable, Any, Dict
+
+from .models import CallTree, ProjectInfo, FileResult
+from .analyzer import CallTreeAnalyzer
+from .config import ANALYSIS_CONFIG
+from .utils import ProgressTracker
+
+logger = logging.getLogger(__name__)
+
+_SENTINEL = object()
+
+class AsyncCallTreeAnalyzer:
+    """asyncio 서비스에 내장하기 위한 비동기 분석 API
+    
+    파일 분석은 executor(기본값: 이벤트 루프의 기본 executor)에서 실행하며,
+    요청마다 동시에 실행되는 작업 수를 concurrency로 제한한다. 결과를 소비하는
+    속도에 맞춰 다음 파일을 제출하므로 역압(backpressure)이 적용되고, 작업이
+    취소되면 아직 시작하지 않은 파일 분석도 함께 취소된다. 여러 요청이 하나의
+    executor와 파서 캐시를 공유할 수 있다.
+    """
+    
+    def __init__(self, concurrency: int = 4, executor: Optional[Executor] = None):
+        self.concurrency = max(1, concurrency)
+        self.executor = executor
+        self._parser_cache: Dict[str, object] = {}
+    
+    def create_analyzer(self) -> CallTreeAnalyzer:
+        """요청별 분석기 생성 (진행상황 출력 없음, 파서 캐시 공유)"""
+        return CallTreeAnalyzer(max_workers=self.concurrency,
+                                progress_tracker=ProgressTracker(show_progress=False),
+                                parser_cache=self._parser_cache)
+    
+    async def aiter_file_results(self, project_root: str,
+                                 analyzer: Optional[CallTreeAnalyzer] = None) -> AsyncIterator[FileResult]:
+        """프로젝트 파일을 분석하며 완료되는 순서대로 파일별 결과 반환
+        
+        CallTreeAnalyzer.iter_file_results와 같은 단계(파서 미리 로드, 내용이 같은 파일의
+        파싱 생략, deadline_seconds 전체 제한 시각)를 거치며, 스캔 결과는
+        analyzer.project_info에 기록된다.
+        """
+        loop = asyncio.get_running_loop()
+        analyzer = analyzer or self.create_analyzer()
+        
+        source_files = await loop.run_in_executor(self.executor, analyzer._start_run, project_root)
+        if not source_files:
+            return
+        
+        analyzer.progress_tracker.start(len(source_files))
+        collapse = ANALYSIS_CONFIG["deduplicate_files"] == "collapse"
+        try:
+            # 해시 계산은 executor 작업 하나에서 순차 실행 (공유 executor 안에서 다시 대기하지 않음)
+            duplicates, unique_files = await loop.run_in_executor(
+                self.executor, analyzer._split_duplicates, source_files)
+            async for file_path, result in self._bounded_map(analyzer, analyzer._analyze_file_tracked,
+                                                             unique_files):
+                for expanded in analyzer._expand_result(file_path, result, duplicates, collapse):
+                    yield expanded
+        finally:
+            analyzer._deadline = None
+            analyzer.progress_tracker.finish()
+    
+    async def aiter_source_results(self, sources: Iterable[Tuple[object, Optional[str], bytes]],
+                                   analyzer: Optional[CallTreeAnalyzer] = None) -> AsyncIterator[FileResult]:
+        """메모리 상의 (가상 경로, 언어, 바이트) 목록을 분석하며 파일별 결과 반환"""
+        analyzer = analyzer or self.create_analyzer()
+        
+        def analyze(source):
+            return analyzer.analyze_source(source[0], source[2], source[1])
+        
+        async for _, result in self._bounded_map(analyzer, analyze, sources):
+            if result is not None:
+                yield result
+    
+    async def analyze_project(self, project_root: str) -> CallTree:
+        """프로젝트 전체를 비동기로 분석하여 호출 트리 반환"""
+        analyzer = self.create_analyzer()
+        
+        async for result in self.aiter_file_results(project_root, analyzer):
+            analyzer._add_result(result)
+        
+        call_tree = analyzer.builder.build()
+        if analyzer.project_info.files:
+            analyzer._post_process(call_tree)
+        return call_tree
+    
+    async def analyze_sources(self, sources: Iterable[Tuple[object, Optional[str], bytes]],
+                              root_path: Optional[Path] = None) -> CallTree:
+        """메모리 상의 소스들을 비동기로 분석하여 병합된 호출 트리 반환"""
+        analyzer = self.create_analyzer()
+        analyzer.project_info = ProjectInfo(root_path=Path(root_path or "."))
+        
+        async for result in self.aiter_source_results(sources, analyzer):
+            analyzer.project_info.add_file(result.file_info)
+            analyzer._merge_result(result)
+        
+        call_tree = analyzer.builder.build()
+        analyzer._post_process(call_tree)
+        return call_tree
+    
+    async def _bounded_map(self, analyzer: CallTreeAnalyzer, func: Callable[[Any], Optional[FileResult]],
+                           items: Iterable[Any]) -> AsyncIterator[Tuple[Any, Optional[FileResult]]]:
+        """동시 실행 수를 제한하며 executor에서 func 실행, (입력, 결과)를 완료 순서대로 반환
+        
+        작업에서 예외가 발생하면 기록하고 결과를 None으로 반환한다.
+        """
+        loop = asyncio.get_running_loop()
+        items = iter(items)
+        pending = {}
+        exhausted = False
+        
+        try:
+            while True:
+                # 소비자가 결과를 가져갈 때만 새 작업을 제출 (역압)
+                while not exhausted and len(pending) < self.concurrency:
+                    item = next(items, _SENTINEL)
+                    if item is _SENTINEL:
+                        exhausted = True
+                        break
+                    pending[loop.run_in_executor(self.executor, func, item)] = item
+                
+                if not pending:
+                    break
+                
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        context = item[0] if isinstance(item, tuple) else item
+                        analyzer.error_handler.log_error("worker", str(e), str(context))
+                        result = None
+                    yield item, result
+        finally:
+            # 취소 또는 조기 종료 시 아직 시작하지 않은 작업 취소
+            for future in pending:
+                future.cancel()
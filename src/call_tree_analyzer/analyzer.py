@@ -1,61 +1,72 @@
 from pathlib import Path
-from typing import Optional, List, Dict, Set
+from typing import Optional, List, Dict, Set, Iterable, Iterator, Tuple, Callable, Any
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import mmap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-from .models import CallTree, CallTreeBuilder, ProjectInfo, FileInfo, FunctionInfo, FunctionCall
-from .parsers import get_parser, get_supported_languages
+from .models import (CallTree, CallTreeBuilder, ProjectInfo, FileInfo, FileResult, 
+                     FunctionInfo, FunctionCall, FunctionMetrics)
+from .parsers import get_parser
 from .config import get_language_by_extension, should_ignore_path, ANALYSIS_CONFIG
-from .utils import FileScanner, ProgressTracker, ErrorHandler
+from .utils import (FileScanner, ProgressTracker, ErrorHandler, find_duplicate_files,
+                    get_max_source_size, count_buffer_lines, get_peak_rss_mb)
+from .catalogs import CALL_EXTERNAL, CALL_BUILTIN
+from .shard import ShardSpec
+from .filters import AnalysisFilter
+from .serialization import function_fragment, get_json_encoder
 
 logger = logging.getLogger(__name__)
 
+# iter_file_results의 결과 반환 순서
+RESULT_ORDERS = ("completion", "path")
+
+_SENTINEL = object()
+
+class _BudgetExceeded(Exception):
+    """추출 단계가 노드 수 또는 시간 예산을 넘음 (그때까지 추출한 결과는 builder에 남음)"""
+    
+    def __init__(self, reason: str, function_count: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.function_count = function_count
+
 class CallTreeAnalyzer:
     """호출 트리 분석기 메인 클래스"""
     
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, 
+                 progress_tracker: Optional[ProgressTracker] = None,
+                 parser_cache: Optional[Dict[str, object]] = None):
         self.max_workers = max_workers
         self.builder = CallTreeBuilder()
         self.project_info = None
         self.error_handler = ErrorHandler()
-        self.progress_tracker = ProgressTracker()
+        self.progress_tracker = progress_tracker or ProgressTracker()
+        self.analysis_filter = AnalysisFilter.from_config(ANALYSIS_CONFIG)
         
-        # 파서 캐시
-        self._parser_cache: Dict[str, object] = {}
-    
-    def analyze_project(self, project_root: str) -> CallTree:
-        """프로젝트 전체 분석"""
-        root_path = Path(project_root).resolve()
+        # 동시에 스트리밍 분석하는 대용량 파일 수 제한 (트리 메모리 상한)
+        self._large_file_slots = threading.BoundedSemaphore(max(1, ANALYSIS_CONFIG["large_file_workers"]))
         
-        if not root_path.exists():
-            raise FileNotFoundError(f"프로젝트 경로가 존재하지 않습니다: {root_path}")
+        # 전체 분석 제한 시각 (time.perf_counter 기준, iter_file_results가 시작할 때 설정)
+        self._deadline: Optional[float] = None
         
-        if not root_path.is_dir():
-            raise ValueError(f"프로젝트 경로가 디렉터리가 아닙니다: {root_path}")
-        
-        logger.info(f"프로젝트 분석 시작: {root_path}")
-        
-        # 프로젝트 정보 초기화
-        self.project_info = ProjectInfo(root_path=root_path)
+        # 파서 캐시 (여러 분석기가 공유 가능)
+        self._parser_cache: Dict[str, object] = parser_cache if parser_cache is not None else {}
+    
+    def analyze_project(self, project_root: str, shard: Optional[ShardSpec] = None) -> CallTree:
+        """프로젝트 전체 분석 (shard를 지정하면 해당 샤드의 파일만 분석)"""
+        root_path = self._resolve_project_root(project_root)
         
         try:
-            # 1. 파일 스캔
-            scanner = FileScanner()
-            source_files = scanner.scan_directory(root_path)
+            # 파일별 결과를 받는 대로 호출 트리와 집계 그래프에 병합
+            for result in self.iter_file_results(root_path, shard=shard):
+                self._add_result(result)
             
-            if not source_files:
-                logger.warning("분석할 소스 파일을 찾을 수 없습니다.")
+            if not self.project_info.files:
                 return self.builder.build()
             
-            logger.info(f"발견된 소스 파일: {len(source_files)}개")
-            
-            # 2. 프로젝트 정보 구성
-            self._build_project_info(source_files)
-            
-            # 3. 병렬 파일 분석
-            self._analyze_files_parallel(source_files)
-            
-            # 4. 후처리
+            # 후처리
             call_tree = self.builder.build()
             self._post_process(call_tree)
             
@@ -68,57 +79,350 @@ class CallTreeAnalyzer:
             self.error_handler.log_error("project_analysis", str(e))
             raise
     
+    def iter_file_results(self, project_root: str, order: str = "completion",
+                          window: Optional[int] = None,
+                          shard: Optional[ShardSpec] = None) -> Iterator[FileResult]:
+        """프로젝트 파일을 분석하며 파일별 결과를 끝나는 대로 하나씩 반환
+        
+        결과는 이 분석기의 호출 트리에 병합되지 않으므로, 검색 색인이나 DB에 적재하는
+        소비자는 전체 그래프를 메모리에 두지 않고 분석과 적재를 겹쳐 실행할 수 있다.
+        order가 completion이면 끝나는 순서대로, path면 경로 순서대로 반환한다.
+        워커 풀에는 실행 중이거나 아직 소비되지 않은 파일이 window개(기본값: 워커 수의
+        2배)를 넘지 않도록 제출하므로 소비가 느리면 분석도 그만큼 기다린다.
+        내용이 같은 파일은 대표 파일의 결과를 복제하거나(replicate) duplicate_of만
+        기록한 결과(collapse)로 반환한다. 스캔한 파일 목록은 self.project_info에 기록된다.
+        deadline_seconds가 설정되어 있으면 그 시간이 지난 뒤 시작하는 파일은 skipped로,
+        분석 중이던 파일은 truncated로 표시한 결과를 반환하므로 실행 시간의 상한이 정해진다.
+        """
+        if order not in RESULT_ORDERS:
+            raise ValueError(f"지원하지 않는 결과 순서: {order}")
+        
+        # 1. 파일 스캔, 프로젝트 정보 구성, 파서 로드
+        source_files = self._start_run(project_root, shard, order)
+        if not source_files:
+            return
+        
+        # 2. 병렬 파일 분석
+        self.progress_tracker.start(len(source_files))
+        collapse = ANALYSIS_CONFIG["deduplicate_files"] == "collapse"
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                duplicates, unique_files = self._split_duplicates(source_files, executor)
+                analyzed = self._bounded_map(executor, self._analyze_file_tracked, unique_files, order, window)
+                yield from self._expand_duplicates(analyzed, source_files, duplicates, order, collapse=collapse)
+        finally:
+            self._deadline = None
+            self.progress_tracker.finish()
+    
+    def _start_run(self, project_root, shard: Optional[ShardSpec] = None,
+                   order: str = "completion") -> List[Path]:
+        """프로젝트 분석 준비 후 분석할 파일 목록 반환 (동기/비동기 API 공용)
+        
+        전체 제한 시각을 설정하고, 파일을 스캔해 self.project_info를 구성한 뒤 실제로
+        존재하는 언어의 파서만 미리 로드한다. 분석할 파일이 없으면 빈 목록을 반환한다.
+        """
+        deadline = ANALYSIS_CONFIG["deadline_seconds"]
+        self._deadline = time.perf_counter() + deadline if deadline is not None else None
+        
+        root_path = self._resolve_project_root(project_root)
+        logger.info(f"프로젝트 분석 시작: {root_path}")
+        
+        # 프로젝트 정보 초기화
+        self.project_info = ProjectInfo(root_path=root_path)
+        
+        source_files = self._scan_source_files(root_path, shard)
+        if not source_files:
+            self._deadline = None
+            return []
+        if order == "path":
+            # 중복 파일의 대표 파일(경로 문자열 순 첫 파일)이 항상 먼저 오도록 정렬
+            source_files = sorted(source_files, key=str)
+        
+        self._build_project_info(source_files)
+        self._preload_parsers(self.project_info.supported_languages)
+        return source_files
+    
+    def _split_duplicates(self, source_files: List[Path],
+                          executor=None) -> Tuple[Dict[Path, List[Path]], List[Path]]:
+        """내용이 같은 파일 묶기 -> ({대표 파일: [중복 파일들]}, 실제로 파싱할 파일 목록)"""
+        if ANALYSIS_CONFIG["deduplicate_files"] == "off":
+            return {}, source_files
+        
+        duplicates = find_duplicate_files(source_files, executor)
+        skipped = {path for paths in duplicates.values() for path in paths}
+        if skipped:
+            logger.info(f"중복 내용 파일 {len(skipped)}개 파싱 생략 (고유 내용 {len(duplicates)}개)")
+        return duplicates, [path for path in source_files if path not in skipped]
+    
+    def _add_result(self, result: FileResult):
+        """iter_file_results의 파일별 결과를 프로젝트 정보와 호출 트리에 반영"""
+        file_info = result.file_info
+        self.project_info.files[file_info.path] = file_info
+        if file_info.duplicate_of is not None:
+            # 합쳐진 중복 파일은 대표 파일에만 함수가 있음
+            self.project_info.duplicate_files[file_info.path] = file_info.duplicate_of
+            return
+        self._merge_result(result)
+    
     def analyze_file(self, file_path: Path) -> Optional[FileInfo]:
-        """단일 파일 분석"""
-        if should_ignore_path(file_path):
+        """단일 파일 분석 (무시 패턴은 분석 중인 프로젝트 루트 기준으로 검사)"""
+        root_path = self.project_info.root_path if self.project_info is not None else None
+        if should_ignore_path(file_path, root_path):
             return None
         
+        result = self._analyze_file(file_path)
+        if result is None:
+            return None
+        
+        self._merge_result(result)
+        return result.file_info
+    
+    def analyze_source(self, file_path, source_code: bytes, 
+                       language: Optional[str] = None) -> FileResult:
+        """메모리 상의 소스 코드 분석 (파일 시스템 접근 없음)
+        
+        file_path는 결과에 기록될 가상 경로이며, language를 생략하면 확장자로 결정한다.
+        결과는 이 분석기의 호출 트리에 병합되지 않는다.
+        """
+        file_path = Path(file_path)
+        language = language or get_language_by_extension(file_path.suffix)
+        
+        builder = CallTreeBuilder(edge_mode=ANALYSIS_CONFIG["edge_mode"])
+        if not language:
+            file_info = FileInfo(path=file_path, language="unknown",
+                                 errors=[("language", f"지원하지 않는 언어: {file_path}")])
+        else:
+            file_info = self._analyze_source(file_path, language, source_code, builder)
+        
+        return self._make_result(file_info, builder)
+    
+    def _make_result(self, file_info: FileInfo, builder: CallTreeBuilder) -> FileResult:
+        """파일별 결과 생성 (output_fragments가 설정되면 출력 조각도 워커에서 인코딩)"""
+        functions = builder.build().functions
+        result = FileResult(file_info=file_info, functions=list(functions.values()))
+        
+        fragment_format = ANALYSIS_CONFIG["output_fragments"]
+        if fragment_format:
+            encoder = get_json_encoder(ANALYSIS_CONFIG["json_encoder"])
+            result.fragments = {
+                full_name: function_fragment(full_name, func_info, fragment_format, encoder)
+                for full_name, func_info in functions.items()
+            }
+        return result
+    
+    def iter_source_results(self, sources: Iterable[Tuple[object, Optional[str], bytes]],
+                            window: Optional[int] = None) -> Iterator[FileResult]:
+        """(가상 경로, 언어, 바이트) 목록을 병렬 분석하여 입력 순서대로 파일별 결과 반환
+        
+        입력은 결과를 소비하는 속도에 맞춰 최대 window개씩만 미리 읽는다.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _, result in self._bounded_map(
+                executor, lambda source: self.analyze_source(source[0], source[2], source[1]),
+                sources, "path", window
+            ):
+                if result is not None:
+                    yield result
+    
+    def analyze_sources(self, sources: Iterable[Tuple[object, Optional[str], bytes]],
+                        root_path: Optional[Path] = None) -> CallTree:
+        """(가상 경로, 언어, 바이트) 목록을 분석하여 병합된 호출 트리 반환
+        
+        임시 파일 없이 메모리 상의 소스만으로 analyze_project와 같은 결과를 만든다.
+        파일별 결과는 project_info.files에 기록된다.
+        """
+        self.project_info = ProjectInfo(root_path=Path(root_path or "."))
+        
+        for result in self.iter_source_results(sources):
+            self.project_info.add_file(result.file_info)
+            self._merge_result(result)
+        
+        call_tree = self.builder.build()
+        self._post_process(call_tree)
+        return call_tree
+    
+    def _analyze_file(self, file_path: Path) -> Optional[FileResult]:
+        """스캐너가 이미 무시 규칙을 적용한 파일 분석"""
         language = get_language_by_extension(file_path.suffix)
         if not language:
             return None
         
+        if self._deadline_passed():
+            return FileResult(FileInfo(path=file_path, language=language, skipped=True))
+        
+        start = time.perf_counter()
         try:
             # 파일 크기 확인
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
+            file_size = file_path.stat().st_size
+            file_size_mb = file_size / (1024 * 1024)
             if file_size_mb > ANALYSIS_CONFIG["max_file_size_mb"]:
+                if ANALYSIS_CONFIG["large_file_mode"] == "stream" and file_size <= get_max_source_size():
+                    return self._analyze_large_file(file_path, language, file_size)
                 logger.warning(f"파일 크기가 너무 큽니다: {file_path} ({file_size_mb:.1f}MB)")
                 return None
             
-            # 파서 가져오기
-            parser = self._get_parser(language)
-            if not parser:
-                return None
-            
-            # 파일 파싱
-            tree = parser.parse_file(file_path)
-            if not tree:
-                return None
-            
-            # AST 순회 및 분석
+            # 파일 읽기
             source_code = file_path.read_bytes()
-            function_count = self._analyze_ast(
-                tree.root_node, 
-                source_code, 
-                parser, 
-                file_path, 
-                None
-            )
+        except OSError as e:
+            return FileResult(FileInfo(path=file_path, language=language, 
+                                       errors=[("file_io", str(e))]))
+        
+        result = self.analyze_source(file_path, source_code, language)
+        result.file_info.analysis_time = time.perf_counter() - start
+        return result
+    
+    def _analyze_large_file(self, file_path: Path, language: str, file_size: int) -> FileResult:
+        """최대 크기를 넘는 파일을 mmap과 읽기 콜백으로 분석 (large_file_mode=stream)
+        
+        파일 내용을 bytes로 읽지 않고 mmap 버퍼를 파서와 추출 단계에 그대로 넘기므로
+        메모리에는 구문 트리와 추출 결과만 남는다. 구문 트리가 파일 크기에 비례해
+        커지므로 동시에 분석하는 대용량 파일 수는 large_file_workers로 제한한다.
+        """
+        with self._large_file_slots:
+            if self._deadline_passed():
+                # 다른 대용량 파일을 기다리는 동안 제한 시간이 지남
+                return FileResult(FileInfo(path=file_path, language=language, skipped=True))
             
-            # 파일 정보 생성
-            line_count = len(source_code.decode('utf-8', errors='ignore').splitlines())
-            file_info = FileInfo(
-                path=file_path,
-                language=language,
-                line_count=line_count,
-                function_count=function_count
-            )
+            start = time.perf_counter()
+            builder = CallTreeBuilder(edge_mode=ANALYSIS_CONFIG["edge_mode"])
+            try:
+                with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    file_info = self._analyze_source(file_path, language, buffer, builder, streamed=True)
+            except (OSError, ValueError) as e:
+                return FileResult(FileInfo(path=file_path, language=language,
+                                           errors=[("file_io", str(e))]))
             
+            file_info.analysis_time = time.perf_counter() - start
+            file_info.peak_rss_mb = get_peak_rss_mb()
+        
+        rss = f"{file_info.peak_rss_mb:.0f}MB" if file_info.peak_rss_mb is not None else "측정 불가"
+        logger.info(f"대용량 파일 스트리밍 분석: {file_path} ({file_size / (1024 * 1024):.1f}MB, "
+                    f"{file_info.analysis_time:.2f}초, 함수 {file_info.function_count}개, 최대 RSS {rss})")
+        return self._make_result(file_info, builder)
+    
+    def _merge_result(self, result: FileResult):
+        """파일별 결과를 분석기의 호출 트리와 집계 그래프에 병합"""
+        self.builder.add_functions(result.functions)
+        if self.project_info is not None:
+            self.project_info.rollup.add_functions(result.file_info.path, result.file_info.language,
+                                                   result.functions)
+            if result.fragments:
+                self.project_info.output_fragments.update(result.fragments)
+        if result.file_info.errors:
+            self.error_handler.record_file_errors(result.file_info)
+    
+    def _analyze_source(self, file_path: Path, language: str, source_code: bytes,
+                        builder: CallTreeBuilder, streamed: bool = False) -> FileInfo:
+        """소스 코드를 파싱하고 추출한 함수를 builder에 추가
+        
+        streamed이면 source_code는 mmap 등 슬라이싱 가능한 버퍼이며 읽기 콜백으로 파싱한다.
+        """
+        # 파서 가져오기
+        parser = self._get_parser(language)
+        if not parser:
+            return FileInfo(path=file_path, language=language,
+                            errors=[("parser", f"파서 생성 실패: {language}")])
+        
+        if streamed:
+            line_count = count_buffer_lines(source_code)
+        else:
+            line_count = len(source_code.decode('utf-8', errors='ignore').splitlines())
+        file_info = FileInfo(
+            path=file_path,
+            language=language,
+            line_count=line_count,
+            streamed=streamed
+        )
+        
+        prefilter_mode = ANALYSIS_CONFIG["prefilter"]
+        if prefilter_mode != "off" and not parser.may_define_functions(source_code):
+            file_info.prefiltered = True
+            if prefilter_mode == "on":
+                return file_info
+        
+        parse_timeout = ANALYSIS_CONFIG["parse_timeout_seconds"]
+        try:
+            timed = parse_timeout is not None or self._deadline is not None
+            if streamed or timed:
+                # 시간 제한이 있으면 읽기 콜백으로 파싱하여 제한 시각에 입력을 끊음
+                # (시간은 조각을 요청할 때만 확인하므로 작은 조각을 넘겨 확인 간격을 줄임)
+                chunk_kb = ANALYSIS_CONFIG["timed_chunk_kb"] if timed else ANALYSIS_CONFIG["stream_chunk_kb"]
+                tree, cut_offset = parser.parse_until(source_code, chunk_kb * 1024,
+                                                      timeout=parse_timeout, deadline=self._deadline)
+            else:
+                tree, cut_offset = parser.parse_source(source_code), None
+        except Exception as e:
+            file_info.errors.append(("parse", str(e)))
             return file_info
-            
+        
+        if cut_offset is not None:
+            file_info.truncated = self._budget_reason("parse_timeout")
+            logger.warning(f"파싱 시간 제한 초과: {file_path} ({cut_offset}/{len(source_code)} 바이트까지만 분석)")
+        
+        try:
+            # AST 순회 및 분석
+            try:
+                file_info.function_count = self._analyze_ast(
+                    tree, 
+                    source_code, 
+                    parser, 
+                    file_path, 
+                    builder=builder,
+                    max_nodes=ANALYSIS_CONFIG["max_extract_nodes"],
+                    deadline=self._budget_deadline(ANALYSIS_CONFIG["extract_timeout_seconds"])
+                )
+            except _BudgetExceeded as e:
+                # 예산을 넘기 전까지 추출한 함수와 호출은 그대로 사용
+                file_info.function_count = e.function_count
+                file_info.truncated = file_info.truncated or self._budget_reason(e.reason)
+                logger.warning(f"추출 예산 초과 ({e.reason}): {file_path} (함수 {e.function_count}개까지만 추출)")
+            self._apply_call_policy(builder)
         except Exception as e:
-            logger.error(f"파일 분석 실패: {file_path} - {e}")
-            self.error_handler.log_error("file_analysis", str(e), str(file_path))
-            return None
+            file_info.errors.append(("file_analysis", str(e)))
+        finally:
+            del tree
+        
+        if file_info.prefiltered and file_info.function_count:
+            # validate 모드: 사전 필터가 결과가 있는 파일을 제외하려 함
+            file_info.errors.append(("prefilter", f"사전 필터가 함수 {file_info.function_count}개가 있는 파일을 "
+                                                  f"제외함 ({language} prefilter_pattern 확인 필요)"))
+        
+        return file_info
+    
+    def _deadline_passed(self) -> bool:
+        return self._deadline is not None and time.perf_counter() >= self._deadline
+    
+    def _budget_deadline(self, timeout: Optional[float]) -> Optional[float]:
+        """지금부터 timeout초 뒤와 전체 제한 시각 중 먼저 오는 시각 (둘 다 없으면 None)"""
+        file_deadline = time.perf_counter() + timeout if timeout is not None else None
+        deadlines = [deadline for deadline in (file_deadline, self._deadline) if deadline is not None]
+        return min(deadlines, default=None)
+    
+    def _budget_reason(self, reason: str) -> str:
+        """시간 예산 초과 사유 (전체 제한 시간이 지났으면 deadline)"""
+        return "deadline" if reason != "max_nodes" and self._deadline_passed() else reason
+    
+    @staticmethod
+    def _apply_call_policy(builder: CallTreeBuilder):
+        """파일 분석 직후 내장/외부 호출을 설정에 따라 제거
+        
+        카탈로그에 있는 이름이라도 같은 파일에 정의된 함수를 이름만으로 호출했으면 내부 호출로
+        본다 (예: 프로젝트가 직접 정의한 log()). 제거된 호출은 호출 트리에 들어가지 않는다.
+        """
+        include_builtin = ANALYSIS_CONFIG["include_builtin_calls"]
+        include_external = ANALYSIS_CONFIG["include_external_calls"]
+        functions = builder.call_tree.functions.values()
+        builder.localize_calls({func.name for func in functions})
+        
+        for func in functions:
+            calls = []
+            for call in func.calls:
+                if call.kind == CALL_BUILTIN and not include_builtin:
+                    continue
+                if call.kind == CALL_EXTERNAL and not include_external:
+                    continue
+                calls.append(call)
+            func.calls = calls
     
     def _build_project_info(self, source_files: List[Path]):
         """프로젝트 정보 구성"""
@@ -128,85 +432,283 @@ class CallTreeAnalyzer:
                 file_info = FileInfo(path=file_path, language=language)
                 self.project_info.add_file(file_info)
     
-    def _analyze_files_parallel(self, source_files: List[Path]):
-        """병렬로 파일들 분석"""
-        self.progress_tracker.start(len(source_files))
+    def _resolve_project_root(self, project_root) -> Path:
+        """프로젝트 경로 확인"""
+        root_path = Path(project_root).resolve()
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 작업 제출
-            future_to_file = {
-                executor.submit(self.analyze_file, file_path): file_path 
-                for file_path in source_files
-            }
+        if not root_path.exists():
+            raise FileNotFoundError(f"프로젝트 경로가 존재하지 않습니다: {root_path}")
+        
+        if not root_path.is_dir():
+            raise ValueError(f"프로젝트 경로가 디렉터리가 아닙니다: {root_path}")
+        
+        return root_path
+    
+    def _scan_source_files(self, root_path: Path, shard: Optional[ShardSpec] = None) -> List[Path]:
+        """분석할 소스 파일 목록 (shard를 지정하면 해당 샤드의 파일만)"""
+        scanner = FileScanner()
+        source_files = scanner.scan_directory(root_path)
+        
+        if not source_files:
+            logger.warning("분석할 소스 파일을 찾을 수 없습니다.")
+            return []
+        
+        logger.info(f"발견된 소스 파일: {len(source_files)}개")
+        
+        if shard is not None:
+            source_files = shard.select(source_files, root_path)
+            logger.info(f"샤드 {shard.index}/{shard.count} ({shard.strategy}): "
+                        f"{len(source_files)}개 파일 분석")
+        
+        return source_files
+    
+    def _bounded_map(self, executor, func: Callable[[Any], Optional[FileResult]], items: Iterable[Any],
+                     order: str = "completion", window: Optional[int] = None
+                     ) -> Iterator[Tuple[Any, Optional[FileResult]]]:
+        """실행 중이거나 소비되지 않은 작업을 window개 이하로 유지하며 executor에서 func 실행
+        
+        (입력, 결과)를 order에 따라 완료 순서 또는 입력 순서대로 반환하며, 작업에서
+        예외가 발생하면 기록하고 결과를 None으로 반환한다.
+        """
+        window = max(1, window or self.max_workers * 2)
+        items = iter(items)
+        pending = {}  # future -> 입력 (제출 순서 유지)
+        exhausted = False
+        
+        try:
+            while True:
+                # 소비자가 결과를 가져갈 때만 새 작업을 제출 (역압)
+                while not exhausted and len(pending) < window:
+                    item = next(items, _SENTINEL)
+                    if item is _SENTINEL:
+                        exhausted = True
+                        break
+                    pending[executor.submit(func, item)] = item
+                
+                if not pending:
+                    break
+                
+                if order == "path":
+                    done = [next(iter(pending))]
+                else:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    done = [future for future in pending if future in finished]
+                
+                for future in done:
+                    item = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        context = item[0] if isinstance(item, tuple) else item
+                        self.error_handler.log_error("worker", str(e), str(context))
+                        result = None
+                    yield item, result
+        finally:
+            # 조기 종료 시 아직 시작하지 않은 작업 취소
+            for future in pending:
+                future.cancel()
+    
+    def _expand_duplicates(self, analyzed: Iterator[Tuple[Path, Optional[FileResult]]],
+                           source_files: List[Path], duplicates: Dict[Path, List[Path]],
+                           order: str, collapse: bool = False) -> Iterator[FileResult]:
+        """대표 파일의 결과 뒤에 내용이 같은 파일의 결과를 끼워 넣음
+        
+        path 순서에서는 중복 파일이 경로 순서상 제자리에 오도록 대표 파일의 결과를
+        마지막 중복 파일을 반환할 때까지만 보관한다.
+        """
+        if order != "path":
+            for file_path, result in analyzed:
+                yield from self._expand_result(file_path, result, duplicates, collapse)
+            return
+        
+        representative_of = {path: rep for rep, paths in duplicates.items() for path in paths}
+        remaining = {rep: len(paths) for rep, paths in duplicates.items()}
+        held: Dict[Path, Optional[FileResult]] = {}
+        
+        for file_path in source_files:
+            rep = representative_of.get(file_path)
+            if rep is None:
+                _, result = next(analyzed)
+                if file_path in duplicates:
+                    self.progress_tracker.update(len(duplicates[file_path]))
+                    held[file_path] = result
+                if result is not None:
+                    yield result
+                continue
             
-            # 결과 처리
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    file_info = future.result()
-                    if file_info:
-                        self.project_info.files[file_path] = file_info
-                    
-                    self.progress_tracker.update()
-                    
-                except Exception as e:
-                    logger.error(f"파일 분석 중 예외 발생: {file_path} - {e}")
+            result = held[rep]
+            remaining[rep] -= 1
+            if not remaining[rep]:
+                del held[rep]
+            if result is not None:
+                yield self._duplicate_result(result, file_path, collapse)
+    
+    def _expand_result(self, file_path: Path, result: Optional[FileResult],
+                       duplicates: Dict[Path, List[Path]], collapse: bool = False) -> Iterator[FileResult]:
+        """대표 파일의 결과와 내용이 같은 파일들의 결과 (완료 순서 반환용)"""
+        duplicate_paths = duplicates.get(file_path, ())
+        self.progress_tracker.update(len(duplicate_paths))
+        if result is None:
+            return
+        yield result
+        for duplicate_path in duplicate_paths:
+            yield self._duplicate_result(result, duplicate_path, collapse)
+    
+    def _duplicate_result(self, result: FileResult, file_path: Path, collapse: bool = False) -> FileResult:
+        """대표 파일의 분석 결과를 내용이 같은 파일의 결과로 변환"""
+        source_info = result.file_info
+        file_info = FileInfo(path=file_path, language=source_info.language,
+                             line_count=source_info.line_count,
+                             function_count=source_info.function_count,
+                             errors=list(source_info.errors),
+                             prefiltered=source_info.prefiltered,
+                             truncated=source_info.truncated,
+                             skipped=source_info.skipped)
+        
+        if collapse:
+            # 함수는 대표 파일에만 두고 중복 관계만 기록
+            file_info.function_count = 0
+            file_info.duplicate_of = source_info.path
+            return FileResult(file_info=file_info)
         
-        self.progress_tracker.finish()
+        functions = [func.relocated(file_path) for func in result.functions]
+        duplicate = FileResult(file_info=file_info, functions=functions)
+        if result.fragments is not None:
+            fragment_format = ANALYSIS_CONFIG["output_fragments"]
+            encoder = get_json_encoder(ANALYSIS_CONFIG["json_encoder"])
+            duplicate.fragments = {
+                func.full_name: function_fragment(func.full_name, func, fragment_format, encoder)
+                for func in functions
+            }
+        return duplicate
     
-    def _analyze_ast(self, node, source_code: bytes, parser, file_path: Path, 
-                    current_func: Optional[str], depth: int = 0) -> int:
-        """AST 노드 재귀 분석"""
+    def _analyze_file_tracked(self, file_path: Path) -> Optional[FileResult]:
+        """워커에서 파일을 분석하고 진행 카운터 증가"""
+        try:
+            return self._analyze_file(file_path)
+        finally:
+            self.progress_tracker.update()
+    
+    def _analyze_ast(self, tree, source_code: bytes, parser, file_path: Path,
+                     builder: Optional[CallTreeBuilder] = None, max_nodes: Optional[int] = None,
+                     deadline: Optional[float] = None) -> int:
+        """커서로 AST를 순회하며 함수 정의와 호출 추출
         
-        # 재귀 깊이 제한
-        if depth > ANALYSIS_CONFIG["max_recursion_depth"]:
-            logger.warning(f"재귀 깊이 제한 도달: {file_path}")
-            return 0
+        노드 객체는 방문하는 동안만 만들어지므로 형제 노드 목록을 한꺼번에 들고 있지
+        않는다. 현재 함수(호출을 기록할 대상)는 깊이별 스택으로 관리한다.
+        max_nodes개를 넘게 방문하거나 deadline(time.perf_counter 기준)이 지나면
+        _BudgetExceeded를 발생시킨다. function_metrics가 켜져 있으면 같은 순회에서
+        함수별 분기 수와 제어 구조 중첩 깊이를 세어 FunctionInfo.metrics에 기록한다.
+        """
+        if builder is None:
+            builder = self.builder
         
+        max_depth = ANALYSIS_CONFIG["max_recursion_depth"]
+        collect_metrics = ANALYSIS_CONFIG["function_metrics"]
+        branch_types = parser.branch_node_types
+        nesting_types = parser.nesting_node_types
         function_count = 0
+        cursor = tree.walk()
+        # scopes[d]: 깊이 d의 노드가 속한 함수 (없으면 None)
+        scopes: List[Optional[str]] = [None]
+        # contexts[d]: 깊이 d의 노드가 속한 함수의 지표와 그 함수 안에서의 중첩 깊이 (function_metrics)
+        contexts: List[Tuple[Optional[FunctionMetrics], int]] = [(None, 0)]
+        visited = 0
         
-        # 함수 정의 처리
-        if parser.is_function_node(node):
-            func_name = parser.extract_function_name(node, source_code)
+        while True:
+            visited += 1
+            if max_nodes is not None and visited > max_nodes:
+                raise _BudgetExceeded("max_nodes", function_count)
+            if deadline is not None and not visited % 1024 and time.perf_counter() >= deadline:
+                raise _BudgetExceeded("extract_timeout", function_count)
+            
+            node = cursor.node
+            current_func = scopes[-1]
+            if collect_metrics:
+                metrics, nesting = contexts[-1]
+            descend = True
             
-            if func_name and parser.should_include_function(func_name):
-                line, column = parser.get_node_position(node)
+            # 재귀 깊이 제한
+            if len(scopes) - 1 > max_depth:
+                logger.warning(f"재귀 깊이 제한 도달: {file_path}")
+                descend = False
+            
+            # 함수 정의 처리
+            elif parser.is_function_node(node):
+                func_name = parser.extract_function_name(node, source_code)
                 
-                # 함수 정보 생성 및 추가
-                func_info = self.builder.add_function_definition(
-                    name=func_name,
-                    file_path=file_path,
-                    line=line,
-                    column=column
-                )
+                if func_name and not self.analysis_filter.allows_function(func_name):
+                    # 필터에서 제외된 함수: FunctionInfo를 만들지 않고 내부 호출도 기록하지 않음
+                    current_func = None
+                    metrics = None
                 
-                current_func = func_info.full_name
-                function_count += 1
-        
-        # 함수 호출 처리
-        elif parser.is_call_node(node):
-            call_name = parser.extract_call_target(node, source_code)
+                elif func_name and parser.should_include_function(func_name):
+                    line, column = parser.get_node_position(node)
+                    
+                    # 함수 정보 생성 및 추가
+                    func_info = builder.add_function_definition(
+                        name=func_name,
+                        file_path=file_path,
+                        line=line,
+                        column=column
+                    )
+                    
+                    current_func = func_info.full_name
+                    function_count += 1
+                    
+                    if collect_metrics:
+                        metrics = func_info.metrics = parser.function_metrics(node, source_code)
+                        nesting = 0
             
-            if (call_name and current_func and 
-                parser.should_include_call(call_name)):
-                
-                line, column = parser.get_node_position(node)
+            # 함수 호출 처리
+            elif parser.is_call_node(node):
+                call_name = parser.extract_call_target(node, source_code)
                 
-                # 함수 호출 추가
-                self.builder.add_function_call(
-                    caller_full_name=current_func,
-                    callee_name=call_name,
-                    line=line,
-                    column=column
-                )
-        
-        # 자식 노드 재귀 처리
-        for child in node.children:
-            function_count += self._analyze_ast(
-                child, source_code, parser, file_path, current_func, depth + 1
-            )
-        
-        return function_count
+                if (call_name and current_func and 
+                    parser.should_include_call(call_name)):
+                    
+                    line, column = parser.get_node_position(node)
+                    receiver = parser.extract_call_receiver(node, source_code)
+                    
+                    # 함수 호출 추가 (카탈로그 기준 분류 포함)
+                    builder.add_function_call(
+                        caller_full_name=current_func,
+                        callee_name=call_name,
+                        line=line,
+                        column=column,
+                        kind=parser.classify_call(call_name, receiver),
+                        unqualified=receiver is None
+                    )
+            
+            # 함수 지표 (분기 수, 제어 구조 중첩 깊이)
+            elif collect_metrics and metrics is not None:
+                node_type = node.type
+                if node_type in branch_types:
+                    metrics.branches += parser.branch_count(node)
+                if node_type in nesting_types and parser.increases_nesting(node):
+                    nesting += 1
+                    metrics.max_nesting = max(metrics.max_nesting, nesting)
+            
+            del node
+            
+            # 자식 노드로 내려가거나, 다음 형제 또는 부모의 형제로 이동
+            if descend and cursor.goto_first_child():
+                scopes.append(current_func)
+                if collect_metrics:
+                    contexts.append((metrics, nesting))
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return function_count
+                scopes.pop()
+                if collect_metrics:
+                    contexts.pop()
+    
+    def _preload_parsers(self, languages: Iterable[str]):
+        """워커 시작 전에 필요한 언어의 파서만 미리 생성"""
+        for language in sorted(languages):
+            self._get_parser(language)
+        logger.debug(f"로드된 파서: {', '.join(sorted(self._parser_cache)) or '없음'}")
     
     def _get_parser(self, language: str):
         """파서 캐시에서 가져오기"""
@@ -214,16 +716,20 @@ class CallTreeAnalyzer:
             try:
                 self._parser_cache[language] = get_parser(language)
             except Exception as e:
+                # 실패도 캐시하여 파일마다 다시 시도하지 않음
                 logger.error(f"파서 생성 실패: {language} - {e}")
-                return None
+                self._parser_cache[language] = None
         
         return self._parser_cache[language]
     
     def _post_process(self, call_tree: CallTree):
         """분석 후처리"""
+        # 완료 순서와 무관하게 같은 결과가 나오도록 함수 순서 정렬
+        call_tree.sort_functions()
+        
         # 통계 로깅
         total_functions = len(call_tree.functions)
-        total_calls = sum(len(func.calls) for func in call_tree.functions.values())
+        total_calls = sum(func.get_call_count() for func in call_tree.functions.values())
         orphaned_functions = len(call_tree.get_orphaned_functions())
         
         logger.info(f"분석 결과 통계:")
@@ -231,10 +737,21 @@ class CallTreeAnalyzer:
         logger.info(f"  - 전체 호출: {total_calls}개")
         logger.info(f"  - 고아 함수: {orphaned_functions}개")
         
-        # 에러 요약
-        if self.error_handler.has_errors():
-            error_summary = self.error_handler.get_summary()
-            logger.warning(f"분석 중 오류 발생: {error_summary}")
+        prefilter_mode = ANALYSIS_CONFIG["prefilter"]
+        if prefilter_mode != "off" and self.project_info is not None:
+            prefiltered = sum(1 for info in self.project_info.files.values() if info.prefiltered)
+            label = "파싱 생략" if prefilter_mode == "on" else "제외 대상 (검증 모드, 모두 파싱함)"
+            logger.info(f"  - 사전 필터 {label}: {prefiltered}/{len(self.project_info.files)}개 파일")
+        
+        if self.project_info is not None:
+            skipped = self.project_info.get_skipped_files()
+            truncated = self.project_info.get_truncated_files()
+            if skipped or truncated:
+                logger.warning(f"  - 예산 초과로 불완전한 결과: 건너뛴 파일 {len(skipped)}개, "
+                               f"일부만 분석한 파일 {len(truncated)}개")
+        
+        # 에러 요약 (한 번만 기록)
+        self.error_handler.log_summary()
 
 class FileAnalyzer:
     """단일 파일 전용 분석기"""
@@ -0,0 +1,83 @@
+"""언어별 외부 심볼 카탈로그
+
+표준 라이브러리/런타임이 제공하는 함수 이름을 버전이 붙은 frozenset으로 제공한다.
+카탈로그 모듈은 언어별로 처음 요청될 때 한 번만 로드된다.
+"""
+
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, FrozenSet, Tuple
+
+CALL_INTERNAL = "internal"
+CALL_EXTERNAL = "external"
+CALL_BUILTIN = "builtin"
+CALL_KINDS = (CALL_INTERNAL, CALL_EXTERNAL, CALL_BUILTIN)
+
+# 수신 객체가 리터럴(문자열, 리스트 등)인 호출의 receiver 표기
+LITERAL_RECEIVER = "<literal>"
+
+# 언어 -> 카탈로그 모듈
+CATALOG_MODULES = {
+    "c": ".c",
+    "python": ".python",
+    "javascript": ".javascript"
+}
+
+@dataclass(frozen=True)
+class SymbolCatalog:
+    """한 언어의 내장/외부 심볼 집합"""
+    language: str
+    version: str
+    builtins: FrozenSet[str] = frozenset()
+    builtin_prefixes: Tuple[str, ...] = ()
+    external: FrozenSet[str] = frozenset()
+    builtin_objects: FrozenSet[str] = frozenset()
+    external_objects: FrozenSet[str] = frozenset()
+    self_names: FrozenSet[str] = frozenset()
+    
+    def classify(self, name: str, receiver: Optional[str] = None) -> str:
+        """호출 이름과 수신 객체(최상위 이름)로 호출 종류 판별
+        
+        receiver가 None이면 이름만으로 호출된 것(func())이고, 그 외에는
+        obj.method() 형태에서 obj 경로의 최상위 이름이다.
+        """
+        if receiver is None:
+            if name in self.builtins or (self.builtin_prefixes and name.startswith(self.builtin_prefixes)):
+                return CALL_BUILTIN
+            if name in self.external:
+                return CALL_EXTERNAL
+            return CALL_INTERNAL
+        
+        if receiver in self.self_names:
+            return CALL_INTERNAL
+        if receiver == LITERAL_RECEIVER or receiver in self.builtin_objects:
+            return CALL_BUILTIN
+        if receiver in self.external_objects:
+            return CALL_EXTERNAL
+        return CALL_INTERNAL
+
+EMPTY_CATALOG = SymbolCatalog(language="", version="none")
+
+@lru_cache(maxsize=None)
+def load_catalog(language: str) -> SymbolCatalog:
+    """언어별 카탈로그 로드 (카탈로그가 없는 언어는 빈 카탈로그)"""
+    module_name = CATALOG_MODULES.get(language)
+    if module_name is None:
+        return EMPTY_CATALOG
+    
+    module = importlib.import_module(module_name, __name__)
+    return SymbolCatalog(
+        language=language,
+        version=module.CATALOG_VERSION,
+        builtins=module.BUILTINS,
+        builtin_prefixes=tuple(module.BUILTIN_PREFIXES),
+        external=module.EXTERNAL,
+        builtin_objects=module.BUILTIN_OBJECTS,
+        external_objects=module.EXTERNAL_OBJECTS,
+        self_names=module.SELF_NAMES
+    )
+
+def get_catalog_versions() -> dict:
+    """언어별 카탈로그 버전 (분석 결과 메타데이터용)"""
+    return {language: load_catalog(language).version for language in CATALOG_MODULES}
@@ -0,0 +1,91 @@
+"""C 표준 라이브러리(C11)와 POSIX.1-2008 함수 카탈로그"""
+
+CATALOG_VERSION = "c11-posix2008.1"
+
+# 언어 수준 매크로/연산자 (이름으로 호출되지만 라이브러리 함수가 아님)
+BUILTINS = frozenset({
+    '_Alignof', '_Generic', '_Static_assert', 'alignof', 'assert', 'offsetof', 'sizeof',
+    'static_assert', 'va_arg', 'va_copy', 'va_end', 'va_start'
+})
+
+# 이 접두사로 시작하는 이름은 컴파일러 내장 함수 (__builtin_expect, __sync_fetch_and_add 등)
+BUILTIN_PREFIXES = ("__builtin_", "__sync_", "__atomic_")
+
+# libc/POSIX 함수
+EXTERNAL = frozenset({
+    '_Exit', '_exit', 'abort', 'abs', 'accept', 'access', 'acos', 'acosf', 'acosh', 'alarm',
+    'aligned_alloc', 'asctime', 'asctime_r', 'asin', 'asinf', 'asinh', 'asprintf',
+    'at_quick_exit', 'atan', 'atan2', 'atan2f', 'atanf', 'atanh', 'atexit', 'atof', 'atoi',
+    'atol', 'atoll', 'bcmp', 'bcopy', 'bind', 'bsearch', 'btowc', 'bzero', 'calloc', 'cbrt',
+    'ceil', 'ceilf', 'cfgetispeed', 'cfgetospeed', 'cfsetispeed', 'cfsetospeed', 'chdir',
+    'chmod', 'chown', 'clearerr', 'clock', 'clock_getres', 'clock_gettime', 'clock_settime',
+    'close', 'closedir', 'closelog', 'connect', 'copysign', 'cos', 'cosf', 'cosh', 'creat',
+    'ctime', 'ctime_r', 'difftime', 'dirfd', 'div', 'dlclose', 'dlerror', 'dlopen', 'dlsym',
+    'dprintf', 'dup', 'dup2', 'epoll_create', 'epoll_create1', 'epoll_ctl', 'epoll_wait', 'erf',
+    'erfc', 'errno', 'execl', 'execle', 'execlp', 'execv', 'execve', 'execvp', 'exit', 'exp',
+    'exp2', 'expf', 'expm1', 'fabs', 'fabsf', 'fchdir', 'fchmod', 'fchown', 'fclose', 'fcntl',
+    'fdatasync', 'fdim', 'fdopen', 'fdopendir', 'feof', 'ferror', 'fflush', 'ffs', 'fgetc',
+    'fgetpos', 'fgets', 'fgetwc', 'fgetws', 'fileno', 'flockfile', 'floor', 'floorf', 'fma',
+    'fmax', 'fmemopen', 'fmin', 'fmod', 'fmodf', 'fnmatch', 'fopen', 'fork', 'fpathconf',
+    'fprintf', 'fputc', 'fputs', 'fputwc', 'fputws', 'fread', 'free', 'freeaddrinfo', 'freopen',
+    'frexp', 'fscanf', 'fseek', 'fseeko', 'fsetpos', 'fstat', 'fsync', 'ftell', 'ftello',
+    'ftruncate', 'funlockfile', 'futimes', 'fwide', 'fwprintf', 'fwrite', 'fwscanf',
+    'gai_strerror', 'getaddrinfo', 'getc', 'getc_unlocked', 'getchar', 'getcwd', 'getdelim',
+    'getegid', 'getenv', 'geteuid', 'getgid', 'getgrgid', 'getgrnam', 'getgroups',
+    'gethostbyaddr', 'gethostbyname', 'gethostname', 'getline', 'getlogin', 'getnameinfo',
+    'getopt', 'getpagesize', 'getpeername', 'getpgid', 'getpgrp', 'getpid', 'getppid',
+    'getpwnam', 'getpwuid', 'gets', 'getsid', 'getsockname', 'getsockopt', 'gettimeofday',
+    'getuid', 'getwc', 'getwchar', 'glob', 'globfree', 'gmtime', 'gmtime_r', 'htonl', 'htons',
+    'hypot', 'ilogb', 'index', 'inet_addr', 'inet_ntoa', 'inet_ntop', 'inet_pton', 'ioctl',
+    'isalnum', 'isalpha', 'isascii', 'isatty', 'isblank', 'iscntrl', 'isdigit', 'isgraph',
+    'islower', 'isprint', 'ispunct', 'isspace', 'isupper', 'isxdigit', 'kill', 'killpg', 'labs',
+    'lchown', 'ldexp', 'ldiv', 'lgamma', 'link', 'listen', 'llabs', 'lldiv', 'llrint',
+    'llround', 'localeconv', 'localtime', 'localtime_r', 'log', 'log10', 'log10f', 'log1p',
+    'log2', 'logb', 'logf', 'longjmp', 'lrint', 'lround', 'lseek', 'lstat', 'madvise', 'malloc',
+    'mblen', 'mbrlen', 'mbrtowc', 'mbsinit', 'mbsrtowcs', 'mbstowcs', 'mbtowc', 'memccpy',
+    'memchr', 'memcmp', 'memcpy', 'memmove', 'memset', 'mkdir', 'mkdtemp', 'mkfifo', 'mknod',
+    'mkstemp', 'mktime', 'mlock', 'mmap', 'modf', 'mprotect', 'msync', 'munlock', 'munmap',
+    'nan', 'nanosleep', 'nearbyint', 'nextafter', 'nexttoward', 'ntohl', 'ntohs', 'open',
+    'open_memstream', 'openat', 'opendir', 'openlog', 'pathconf', 'pause', 'pclose', 'perror',
+    'pipe', 'poll', 'popen', 'posix_memalign', 'pow', 'powf', 'pread', 'printf',
+    'pthread_attr_destroy', 'pthread_attr_init', 'pthread_attr_setdetachstate',
+    'pthread_attr_setstacksize', 'pthread_cancel', 'pthread_cond_broadcast',
+    'pthread_cond_destroy', 'pthread_cond_init', 'pthread_cond_signal',
+    'pthread_cond_timedwait', 'pthread_cond_wait', 'pthread_create', 'pthread_detach',
+    'pthread_equal', 'pthread_exit', 'pthread_getspecific', 'pthread_join',
+    'pthread_key_create', 'pthread_key_delete', 'pthread_kill', 'pthread_mutex_destroy',
+    'pthread_mutex_init', 'pthread_mutex_lock', 'pthread_mutex_trylock', 'pthread_mutex_unlock',
+    'pthread_once', 'pthread_rwlock_destroy', 'pthread_rwlock_init', 'pthread_rwlock_rdlock',
+    'pthread_rwlock_unlock', 'pthread_rwlock_wrlock', 'pthread_self', 'pthread_setname_np',
+    'pthread_setspecific', 'pthread_sigmask', 'putc', 'putc_unlocked', 'putchar', 'putenv',
+    'puts', 'putwc', 'putwchar', 'pwrite', 'qsort', 'quick_exit', 'raise', 'rand', 'read',
+    'readdir', 'readdir_r', 'readlink', 'realloc', 'realpath', 'recv', 'recvfrom', 'recvmsg',
+    'regcomp', 'regerror', 'regexec', 'regfree', 'remainder', 'remove', 'remquo', 'rename',
+    'rewind', 'rewinddir', 'rindex', 'rint', 'rmdir', 'round', 'roundf', 'scalbln', 'scalbn',
+    'scandir', 'scanf', 'seekdir', 'select', 'sem_close', 'sem_destroy', 'sem_init', 'sem_open',
+    'sem_post', 'sem_trywait', 'sem_unlink', 'sem_wait', 'send', 'sendmsg', 'sendto', 'setbuf',
+    'setenv', 'setgid', 'setjmp', 'setlocale', 'setpgid', 'setsid', 'setsockopt', 'setuid',
+    'setvbuf', 'shm_open', 'shm_unlink', 'shutdown', 'sigaction', 'sigaddset', 'sigdelset',
+    'sigemptyset', 'sigfillset', 'sigismember', 'siglongjmp', 'signal', 'sigprocmask',
+    'sigsetjmp', 'sigsuspend', 'sigwait', 'sin', 'sinf', 'sinh', 'sleep', 'snprintf', 'socket',
+    'socketpair', 'sprintf', 'sqrt', 'sqrtf', 'srand', 'sscanf', 'stat', 'stpcpy', 'stpncpy',
+    'strcasecmp', 'strcat', 'strchr', 'strcmp', 'strcoll', 'strcpy', 'strcspn', 'strdup',
+    'strerror', 'strftime', 'strlcat', 'strlcpy', 'strlen', 'strncasecmp', 'strncat', 'strncmp',
+    'strncpy', 'strndup', 'strnlen', 'strpbrk', 'strptime', 'strrchr', 'strsignal', 'strspn',
+    'strstr', 'strtod', 'strtof', 'strtok', 'strtok_r', 'strtol', 'strtold', 'strtoll',
+    'strtoul', 'strtoull', 'strxfrm', 'swprintf', 'swscanf', 'symlink', 'sync', 'sysconf',
+    'syslog', 'system', 'tan', 'tanf', 'tanh', 'tcgetattr', 'tcgetpgrp', 'tcsetattr',
+    'tcsetpgrp', 'telldir', 'tgamma', 'time', 'timespec_get', 'tmpfile', 'tmpnam', 'tmpnam_r',
+    'toascii', 'tolower', 'toupper', 'trunc', 'truncate', 'truncf', 'ttyname', 'umask',
+    'ungetc', 'ungetwc', 'unlink', 'unsetenv', 'usleep', 'utime', 'utimes', 'vasprintf',
+    'vdprintf', 'vfork', 'vfprintf', 'vfscanf', 'vfwprintf', 'vprintf', 'vscanf', 'vsnprintf',
+    'vsprintf', 'vsscanf', 'vswprintf', 'vwprintf', 'wait', 'waitid', 'waitpid', 'wcrtomb',
+    'wcscat', 'wcschr', 'wcscmp', 'wcscpy', 'wcslen', 'wcsncmp', 'wcsncpy', 'wcsrtombs',
+    'wcsstr', 'wcstod', 'wcstol', 'wcstombs', 'wcstoul', 'wctomb', 'wmemchr', 'wmemcmp',
+    'wmemcpy', 'wmemmove', 'wmemset', 'wprintf', 'write', 'wscanf'
+})
+
+# C에는 모듈 수신 객체가 없음 (구조체 멤버 호출은 함수 포인터이므로 내부 호출로 본다)
+BUILTIN_OBJECTS = frozenset()
+EXTERNAL_OBJECTS = frozenset()
+SELF_NAMES = frozenset()
@@ -0,0 +1,49 @@
+"""JavaScript 표준 전역 객체(ECMAScript 2022)와 Node.js/브라우저 전역 카탈로그"""
+
+CATALOG_VERSION = "es2022-node18-web.1"
+
+# 이름만으로 호출되는 ECMAScript 전역 함수와 생성자
+BUILTINS = frozenset({
+    'AggregateError', 'Array', 'ArrayBuffer', 'BigInt', 'BigInt64Array', 'BigUint64Array',
+    'Boolean', 'DataView', 'Date', 'Error', 'EvalError', 'FinalizationRegistry', 'Float32Array',
+    'Float64Array', 'Function', 'Int16Array', 'Int32Array', 'Int8Array', 'Map', 'Number',
+    'Object', 'Promise', 'Proxy', 'RangeError', 'ReferenceError', 'RegExp', 'Set',
+    'SharedArrayBuffer', 'String', 'Symbol', 'SyntaxError', 'TypeError', 'URIError',
+    'Uint16Array', 'Uint32Array', 'Uint8Array', 'Uint8ClampedArray', 'WeakMap', 'WeakRef',
+    'WeakSet', 'clearImmediate', 'clearInterval', 'clearTimeout', 'decodeURI',
+    'decodeURIComponent', 'encodeURI', 'encodeURIComponent', 'escape', 'eval', 'isFinite',
+    'isNaN', 'parseFloat', 'parseInt', 'queueMicrotask', 'setImmediate', 'setInterval',
+    'setTimeout', 'structuredClone', 'unescape'
+})
+
+BUILTIN_PREFIXES = ()
+
+# 호스트 환경(Node.js/브라우저)이 제공하는 전역 함수
+EXTERNAL = frozenset({
+    'AbortController', 'Audio', 'Blob', 'Buffer', 'CustomEvent', 'Event', 'EventSource', 'File',
+    'FileReader', 'FormData', 'Headers', 'Image', 'IntersectionObserver', 'MutationObserver',
+    'Request', 'ResizeObserver', 'Response', 'TextDecoder', 'TextEncoder', 'URL',
+    'URLSearchParams', 'WebSocket', 'Worker', 'XMLHttpRequest', 'alert', 'atob', 'btoa',
+    'cancelAnimationFrame', 'cancelIdleCallback', 'confirm', 'fetch', 'getComputedStyle',
+    'importScripts', 'matchMedia', 'postMessage', 'prompt', 'requestAnimationFrame',
+    'requestIdleCallback', 'require'
+})
+
+# 수신 객체가 이 이름이면 내장 (예: console.log, Math.max, Object.keys)
+BUILTIN_OBJECTS = frozenset({
+    'Array', 'ArrayBuffer', 'Atomics', 'BigInt', 'Boolean', 'Date', 'Function', 'Intl', 'JSON',
+    'Map', 'Math', 'Number', 'Object', 'Promise', 'Proxy', 'Reflect', 'RegExp', 'Set', 'String',
+    'Symbol', 'WeakMap', 'WeakSet', 'console', 'globalThis'
+})
+
+# 수신 객체가 이 이름이면 외부 호출 (예: document.querySelector, fs.readFileSync)
+EXTERNAL_OBJECTS = frozenset({
+    'Buffer', 'URL', 'URLSearchParams', 'assert', 'buffer', 'child_process', 'cluster',
+    'crypto', 'dgram', 'dns', 'document', 'events', 'exports', 'fs', 'history', 'http', 'http2',
+    'https', 'indexedDB', 'localStorage', 'location', 'module', 'navigator', 'net', 'os',
+    'path', 'performance', 'process', 'querystring', 'readline', 'screen', 'sessionStorage',
+    'stream', 'string_decoder', 'timers', 'tls', 'tty', 'url', 'util', 'v8', 'vm', 'window',
+    'worker_threads', 'zlib'
+})
+
+SELF_NAMES = frozenset({'this', 'super'})
@@ -0,0 +1,336 @@
+"""호출 그래프 중심성 분석
+
+호출 트리의 내부 호출을 정수 인덱스 그래프(CSR)로 한 번만 변환한 뒤 PageRank,
+표본 매개 중심성(betweenness), k-core 분해를 계산한다. numpy가 설치되어 있으면
+벡터화된 계산을 사용하고, 없으면 같은 결과를 내는 순수 Python 구현을 사용한다
+(핫스팟의 매개 중심성 표본 수는 간선 수에 맞춰 줄인다).
+"""
+
+import logging
+import random
+from collections import defaultdict
+from typing import Dict, List, Tuple, Optional, Sequence
+
+from .models import CallTree
+from .config import ANALYSIS_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 중심성 기반 핫스팟 항목
+CENTRALITY_CATEGORIES = ("central_functions", "bridge_functions", "core_functions")
+
+def _load_numpy():
+    """numpy가 설치되어 있으면 반환 (선택 의존성)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+class CallGraph:
+    """함수를 정수 인덱스로 바꾼 호출 그래프 (CSR 인접 구조)
+    
+    호출 대상은 이름으로 찾으며, 호출한 파일에 같은 이름이 정의되어 있으면 그 함수를,
+    아니면 그 이름을 정의한 모든 함수를 대상으로 보고 가중치를 나눈다. 같은 함수 쌍의
+    여러 호출 위치는 간선 하나로 합친다. 내부(internal) 호출만 포함한다.
+    """
+    
+    def __init__(self, names: List[str], indptr: List[int], indices: List[int], weights: List[float]):
+        self.names = names
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+    
+    @property
+    def node_count(self) -> int:
+        return len(self.names)
+    
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+    
+    @classmethod
+    def from_call_tree(cls, call_tree: CallTree) -> "CallGraph":
+        names = list(call_tree.functions)
+        by_name: Dict[str, List[int]] = defaultdict(list)
+        by_file_name: Dict[Tuple[object, str], int] = {}
+        for index, func_info in enumerate(call_tree.functions.values()):
+            by_name[func_info.name].append(index)
+            by_file_name[(func_info.file_path, func_info.name)] = index
+        
+        # 함수 순서대로 나가는 간선을 채우므로 전체 간선을 정렬할 필요가 없음
+        indptr = [0]
+        indices: List[int] = []
+        weights: List[float] = []
+        for func_info in call_tree.functions.values():
+            row: Dict[int, float] = {}
+            for callee_name in {call.name for call in func_info.calls if call.kind == "internal"}:
+                local = by_file_name.get((func_info.file_path, callee_name))
+                targets = (local,) if local is not None else by_name.get(callee_name, ())
+                if not targets:
+                    continue
+                share = 1.0 / len(targets)
+                for target in targets:
+                    row[target] = row.get(target, 0.0) + share
+            for target in sorted(row):
+                indices.append(target)
+                weights.append(row[target])
+            indptr.append(len(indices))
+        
+        return cls(names, indptr, indices, weights)
+
+class CentralityEngine:
+    """호출 그래프 중심성 계산기 (그래프는 생성 시 한 번만 구성)"""
+    
+    def __init__(self, call_tree: CallTree, use_numpy: Optional[bool] = None):
+        self.graph = CallGraph.from_call_tree(call_tree)
+        self.np = _load_numpy() if use_numpy is not False else None
+        if use_numpy and self.np is None:
+            raise ImportError("numpy가 설치되어 있지 않습니다 (pip install numpy)")
+        logger.debug(f"중심성 그래프: 노드 {self.graph.node_count}개, 간선 {self.graph.edge_count}개, "
+                     f"{'numpy' if self.np is not None else 'python'} 계산")
+    
+    def pagerank(self, damping: float = 0.85, tolerance: float = 1e-8,
+                 max_iterations: int = 100) -> List[float]:
+        """가중 PageRank (거듭제곱 반복, 나가는 간선이 없는 함수의 점수는 전체에 고르게 분배)"""
+        graph = self.graph
+        n = graph.node_count
+        if n == 0:
+            return []
+        
+        if self.np is not None:
+            np = self.np
+            indptr = np.asarray(graph.indptr, dtype=np.int64)
+            sources = np.repeat(np.arange(n), np.diff(indptr))
+            targets = np.asarray(graph.indices, dtype=np.int64)
+            out_weight = np.bincount(sources, weights=graph.weights, minlength=n)
+            transition = np.asarray(graph.weights) / out_weight[sources] if len(sources) else np.zeros(0)
+            dangling = out_weight == 0
+            
+            rank = np.full(n, 1.0 / n)
+            for _ in range(max_iterations):
+                flow = np.bincount(targets, weights=rank[sources] * transition, minlength=n)
+                updated = (1 - damping) / n + damping * (flow + rank[dangling].sum() / n)
+                converged = np.abs(updated - rank).sum() < tolerance
+                rank = updated
+                if converged:
+                    break
+            return rank.tolist()
+        
+        out_weight = [sum(graph.weights[graph.indptr[node]:graph.indptr[node + 1]]) for node in range(n)]
+        rank = [1.0 / n] * n
+        for _ in range(max_iterations):
+            flow = [0.0] * n
+            dangling_sum = 0.0
+            for node in range(n):
+                if not out_weight[node]:
+                    dangling_sum += rank[node]
+                    continue
+                share = rank[node] / out_weight[node]
+                for edge in range(graph.indptr[node], graph.indptr[node + 1]):
+                    flow[graph.indices[edge]] += share * graph.weights[edge]
+            
+            base = (1 - damping) / n + damping * dangling_sum / n
+            updated = [base + damping * value for value in flow]
+            converged = sum(abs(a - b) for a, b in zip(updated, rank)) < tolerance
+            rank = updated
+            if converged:
+                break
+        return rank
+    
+    def betweenness(self, samples: Optional[int] = None, seed: Optional[int] = 0) -> List[float]:
+        """표본 출발점 기반 매개 중심성 근사 (Brandes, 방향/비가중)
+        
+        samples개의 출발 함수에서만 최단 경로를 구하고 n/samples 배로 보정하므로
+        계산량은 O(samples * 간선 수)다. samples가 함수 수 이상이면 정확한 값이다.
+        """
+        graph = self.graph
+        n = graph.node_count
+        if n == 0:
+            return []
+        
+        samples = n if samples is None else max(1, min(samples, n))
+        pivots = random.Random(seed).sample(range(n), samples) if samples < n else list(range(n))
+        scale = n / samples
+        
+        if self.np is not None:
+            scores = self._betweenness_numpy(pivots)
+        else:
+            scores = self._betweenness_python(pivots)
+        return [score * scale for score in scores]
+    
+    def core_numbers(self) -> List[int]:
+        """방향을 무시한 호출 그래프의 k-core 번호 (Batagelj-Zaversnik, O(간선 수))"""
+        graph = self.graph
+        n = graph.node_count
+        neighbor_sets = [set() for _ in range(n)]
+        for source in range(n):
+            for edge in range(graph.indptr[source], graph.indptr[source + 1]):
+                target = graph.indices[edge]
+                if target != source:
+                    neighbor_sets[source].add(target)
+                    neighbor_sets[target].add(source)
+        neighbors = [list(items) for items in neighbor_sets]
+        del neighbor_sets
+        
+        degree = [len(items) for items in neighbors]
+        max_degree = max(degree, default=0)
+        
+        # 차수별 버킷 정렬
+        bins = [0] * (max_degree + 1)
+        for value in degree:
+            bins[value] += 1
+        start = 0
+        for value in range(max_degree + 1):
+            bins[value], start = start, start + bins[value]
+        position = [0] * n
+        vertices = [0] * n
+        for node in range(n):
+            position[node] = bins[degree[node]]
+            vertices[position[node]] = node
+            bins[degree[node]] += 1
+        for value in range(max_degree, 0, -1):
+            bins[value] = bins[value - 1]
+        if bins:
+            bins[0] = 0
+        
+        # 차수가 가장 작은 노드부터 제거하며 이웃의 차수를 낮춤
+        for index in range(n):
+            node = vertices[index]
+            for neighbor in neighbors[node]:
+                if degree[neighbor] > degree[node]:
+                    neighbor_degree = degree[neighbor]
+                    neighbor_position = position[neighbor]
+                    swap_position = bins[neighbor_degree]
+                    swap_node = vertices[swap_position]
+                    if neighbor != swap_node:
+                        position[neighbor], position[swap_node] = swap_position, neighbor_position
+                        vertices[neighbor_position], vertices[swap_position] = swap_node, neighbor
+                    bins[neighbor_degree] += 1
+                    degree[neighbor] -= 1
+        
+        return degree
+    
+    def hotspots(self, top: int = 10) -> Dict[str, List[str]]:
+        """중심성 기준 상위 함수 (central: PageRank, bridge: 매개 중심성, core: 최상위 k-core)"""
+        names = self.graph.names
+        if not names:
+            return {category: [] for category in CENTRALITY_CATEGORIES}
+        
+        pagerank = self.pagerank(damping=ANALYSIS_CONFIG["pagerank_damping"])
+        betweenness = self.betweenness(samples=self._betweenness_samples())
+        cores = self.core_numbers()
+        degree = [self.graph.indptr[node + 1] - self.graph.indptr[node] for node in range(len(names))]
+        
+        return {
+            "central_functions": _top_names(names, pagerank, top),
+            "bridge_functions": _top_names(names, betweenness, top),
+            "core_functions": [
+                names[node] for node in sorted(
+                    (node for node in range(len(names)) if cores[node] > 0),
+                    key=lambda node: (-cores[node], -degree[node], names[node])
+                )[:top]
+            ]
+        }
+    
+    def _betweenness_samples(self) -> int:
+        """핫스팟에 사용할 표본 수 (순수 Python 계산은 간선 수에 맞춰 표본을 줄임)"""
+        samples = ANALYSIS_CONFIG["betweenness_samples"]
+        edge_count = self.graph.edge_count
+        if self.np is not None or not edge_count:
+            return samples
+        
+        affordable = max(1, ANALYSIS_CONFIG["python_betweenness_edge_budget"] // edge_count)
+        if affordable < samples:
+            logger.warning(f"numpy가 없어 매개 중심성 표본을 {samples}개에서 {affordable}개로 줄입니다 "
+                           f"(간선 {edge_count}개, 정확도를 유지하려면 pip install numpy)")
+            return affordable
+        return samples
+    
+    def _betweenness_python(self, pivots: Sequence[int]) -> List[float]:
+        graph = self.graph
+        indptr, indices = graph.indptr, graph.indices
+        scores = [0.0] * graph.node_count
+        
+        for source in pivots:
+            distance = {source: 0}
+            paths = {source: 1.0}
+            predecessors = defaultdict(list)
+            order = []
+            queue = [source]
+            head = 0
+            while head < len(queue):
+                node = queue[head]
+                head += 1
+                order.append(node)
+                next_distance = distance[node] + 1
+                for edge in range(indptr[node], indptr[node + 1]):
+                    target = indices[edge]
+                    if target not in distance:
+                        distance[target] = next_distance
+                        paths[target] = 0.0
+                        queue.append(target)
+                    if distance[target] == next_distance:
+                        paths[target] += paths[node]
+                        predecessors[target].append(node)
+            
+            dependency = defaultdict(float)
+            for node in reversed(order):
+                coefficient = (1.0 + dependency[node]) / paths[node]
+                for predecessor in predecessors[node]:
+                    dependency[predecessor] += paths[predecessor] * coefficient
+                if node != source:
+                    scores[node] += dependency[node]
+        
+        return scores
+    
+    def _betweenness_numpy(self, pivots: Sequence[int]) -> List[float]:
+        """단계별 BFS를 배열 연산으로 수행하는 Brandes 알고리즘"""
+        np = self.np
+        graph = self.graph
+        n = graph.node_count
+        indptr = np.asarray(graph.indptr, dtype=np.int64)
+        indices = np.asarray(graph.indices, dtype=np.int64)
+        out_degree = np.diff(indptr)
+        scores = np.zeros(n)
+        
+        for source in pivots:
+            distance = np.full(n, -1, dtype=np.int64)
+            paths = np.zeros(n)
+            distance[source] = 0
+            paths[source] = 1.0
+            frontier = np.array([source], dtype=np.int64)
+            levels = []
+            depth = 0
+            
+            while frontier.size:
+                counts = out_degree[frontier]
+                total = int(counts.sum())
+                if not total:
+                    break
+                # frontier 노드들의 간선 구간을 이어 붙인 위치
+                block_starts = np.cumsum(counts) - counts
+                offsets = np.repeat(indptr[frontier] - block_starts, counts) + np.arange(total)
+                parents = np.repeat(frontier, counts)
+                children = indices[offsets]
+                
+                distance[children[distance[children] < 0]] = depth + 1
+                on_path = distance[children] == depth + 1
+                parents, children = parents[on_path], children[on_path]
+                frontier = np.flatnonzero(distance == depth + 1)
+                paths += np.bincount(children, weights=paths[parents], minlength=n)
+                levels.append((parents, children))
+                depth += 1
+            
+            dependency = np.zeros(n)
+            for parents, children in reversed(levels):
+                dependency += np.bincount(parents, weights=paths[parents] / paths[children] *
+                                          (1.0 + dependency[children]), minlength=n)
+            dependency[source] = 0.0
+            scores += dependency
+        
+        return scores.tolist()
+
+def _top_names(names: List[str], scores: List[float], top: int) -> List[str]:
+    ranked = sorted(range(len(names)), key=lambda node: (-scores[node], names[node]))
+    return [names[node] for node in ranked[:top] if scores[node] > 0]
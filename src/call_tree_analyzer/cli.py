@@ -1,13 +1,63 @@
 import sys
 import json
+import time
 import argparse
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List, Tuple, Dict
 
-from .analyzer import CallTreeAnalyzer, FileAnalyzer
-from .utils import setup_logging, validate_project_path, CodeFormatter, StatisticsCalculator
-from .models import CallTree
+# 무거운 모듈(analyzer, 파서, tree_sitter)은 실제로 필요한 시점에 import
+_DEFERRED_MODULES = ("tree_sitter", f"{__package__}.analyzer", f"{__package__}.parsers")
+
+from . import _IMPORT_STARTED_AT
+from .utils import (setup_logging, validate_project_path, CodeFormatter, StatisticsCalculator,
+                    ProgressTracker, ProgressEventWriter, ErrorHandler)
+from .models import CallTree, ProjectInfo, RollupGraph, RollupIndex
+from .config import ANALYSIS_CONFIG, get_language_by_extension
+from .serialization import (load_call_tree, function_fragment, assemble_json_document,
+                            get_json_encoder, JSON_ENCODERS, FRAGMENT_FORMATS)
+from .shard import ShardSpec, write_partial, merge_partials
+from .filters import AnalysisFilter
+from .profiling import PROFILE_FORMATS, ProfileOverlay, load_profile_overlay
+
+def check_startup_budget(strict: bool = False) -> float:
+    """작업을 시작하기 직전에 CLI 준비 시간과 지연 import를 검사하고 준비 시간(밀리초) 반환
+    
+    준비 시간은 패키지 import 시작부터 잰다. 지연 로드 대상 모듈이 이미 로드되어 있거나
+    준비 시간이 startup_budget_ms를 넘으면 경고하고, strict이면 오류로 종료한다 (CI용).
+    """
+    logger = logging.getLogger(__name__)
+    elapsed_ms = (time.perf_counter() - _IMPORT_STARTED_AT) * 1000
+    problems = []
+    eager = [name for name in _DEFERRED_MODULES if name in sys.modules]
+    if eager:
+        problems.append(f"지연 로드 대상 모듈이 작업 시작 전에 로드됨: {', '.join(eager)}")
+    
+    budget = ANALYSIS_CONFIG["startup_budget_ms"]
+    if budget is not None and elapsed_ms > budget:
+        problems.append(f"CLI 준비 시간 {elapsed_ms:.1f}ms가 예산 {budget}ms를 넘었습니다")
+    else:
+        logger.debug(f"CLI 준비 시간: {elapsed_ms:.1f}ms")
+    
+    for problem in problems:
+        (logger.error if strict else logger.warning)(problem)
+    if strict and problems:
+        sys.exit(1)
+    return elapsed_ms
+
+def positive_float(value: str) -> float:
+    """0보다 큰 실수 인자 (0 이하를 제한 없음으로 오해하지 않도록 거부)"""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"0보다 커야 합니다: {value}")
+    return number
+
+def positive_int(value: str) -> int:
+    """0보다 큰 정수 인자"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"0보다 커야 합니다: {value}")
+    return number
 
 def create_parser() -> argparse.ArgumentParser:
     """CLI 인자 파서 생성"""
@@ -20,6 +70,11 @@ def create_parser() -> argparse.ArgumentParser:
   %(prog)s /path/to/project -o output.json     # JSON 파일로 저장
   %(prog)s /path/to/project --format text      # 텍스트 형태로 출력
   %(prog)s /path/to/file.py --single-file      # 단일 파일 분석
+  %(prog)s /path/to/repo --since main..HEAD    # 변경된 호출 관계만 분석
+  %(prog)s diff old.json new.json              # 두 분석 결과 비교
+  %(prog)s /path/to/project --shard 2/8 -o part2.json  # 8개 중 2번째 샤드만 분석
+  %(prog)s merge part*.json -o output.json     # 샤드 부분 결과 병합
+  %(prog)s workspace repos.txt --output-dir out  # 여러 저장소를 한 번에 분석
         """
     )
     
@@ -35,9 +90,15 @@ def create_parser() -> argparse.ArgumentParser:
     
     parser.add_argument(
         "--format", "-f",
-        choices=["json", "text"],
+        choices=["json", "jsonl", "text", "sqlite"],
         default="json",
-        help="출력 형식 (기본값: json)"
+        help="출력 형식 (기본값: json, jsonl은 한 줄에 레코드 하나, sqlite는 --output 필요)"
+    )
+    
+    parser.add_argument(
+        "--json-encoder",
+        choices=JSON_ENCODERS,
+        help="JSON 인코더 (auto: orjson이 설치되어 있으면 사용, 기본값: auto)"
     )
     
     parser.add_argument(
@@ -46,6 +107,115 @@ def create_parser() -> argparse.ArgumentParser:
         help="단일 파일 분석 모드"
     )
     
+    parser.add_argument(
+        "--since",
+        metavar="REV_RANGE",
+        help="git 리비전 범위(BASE..HEAD, BASE...HEAD 또는 BASE)에서 변경된 파일만 분석하여 "
+             "추가/삭제된 함수와 호출 관계 출력"
+    )
+    
+    parser.add_argument(
+        "--base-snapshot",
+        metavar="FILE",
+        help="--since와 함께 사용할 기준 리비전의 JSON 분석 결과 (기준 파일 재분석 생략)"
+    )
+    
+    parser.add_argument(
+        "--update-snapshot",
+        metavar="FILE",
+        help="--base-snapshot에 변경 파일 분석 결과를 반영한 HEAD 기준 스냅샷을 저장할 경로"
+    )
+    
+    parser.add_argument(
+        "--shard",
+        metavar="K/N",
+        help="파일 목록을 N개로 나눈 중 K번째(1부터)만 분석하여 부분 결과(JSON) 출력"
+    )
+    
+    parser.add_argument(
+        "--shard-strategy",
+        choices=["hash", "size"],
+        default="hash",
+        help="샤드 분할 방식 (hash: 경로 해시, size: 파일 크기 균형, 기본값: hash)"
+    )
+    
+    parser.add_argument(
+        "--dedup",
+        choices=["replicate", "collapse", "off"],
+        help="내용이 같은 파일 처리 (replicate: 한 번 분석 후 각 경로에 복제, "
+             "collapse: 대표 파일로 합치고 중복 목록 출력, off: 모두 분석, 기본값: replicate)"
+    )
+    
+    parser.add_argument(
+        "--sample",
+        type=float,
+        metavar="N",
+        help="언어/디렉터리별 층화 표본만 분석하여 통계와 핫스팟을 신뢰구간과 함께 추정 "
+             "(1 미만이면 파일 비율, 1 이상이면 파일 수)"
+    )
+    
+    parser.add_argument(
+        "--sample-budget",
+        type=float,
+        metavar="SECONDS",
+        help="--sample과 함께 사용: 시간 예산을 다 쓸 때까지 표본을 계속 늘려 추정 정밀도 향상"
+    )
+    
+    parser.add_argument(
+        "--sample-seed",
+        type=int,
+        help="표본 추출 난수 시드 (지정하면 같은 표본을 다시 뽑음)"
+    )
+    
+    parser.add_argument(
+        "--large-files",
+        choices=["skip", "stream"],
+        help="최대 크기(max_file_size_mb)를 넘는 파일 처리 (skip: 건너뜀, "
+             "stream: mmap과 읽기 콜백으로 분석하고 파일별 시간/메모리 기록, 기본값: skip)"
+    )
+    
+    parser.add_argument(
+        "--large-file-limit",
+        type=float,
+        metavar="MB",
+        help="stream 모드에서도 건너뛸 파일 크기 상한 (MB, 기본값: 1024)"
+    )
+    
+    parser.add_argument(
+        "--parse-timeout",
+        type=positive_float,
+        metavar="SEC",
+        help="파일별 파싱 시간 제한 (초, 넘으면 그때까지 읽은 부분만 분석하고 truncated로 표시)"
+    )
+    
+    parser.add_argument(
+        "--extract-timeout",
+        type=positive_float,
+        metavar="SEC",
+        help="파일별 함수/호출 추출 시간 제한 (초)"
+    )
+    
+    parser.add_argument(
+        "--max-nodes",
+        type=positive_int,
+        metavar="N",
+        help="파일별 추출 단계에서 방문할 최대 AST 노드 수"
+    )
+    
+    parser.add_argument(
+        "--deadline",
+        type=positive_float,
+        metavar="SEC",
+        help="전체 분석 시간 제한 (초, 지나면 남은 파일은 skipped로 표시하고 부분 결과 출력)"
+    )
+    
+    parser.add_argument(
+        "--prefilter",
+        choices=["off", "on", "validate"],
+        help="파싱 전 바이트 사전 필터 (on: 언어별 prefilter_pattern이 없는 파일은 파싱 생략, "
+             "validate: 모두 파싱하고 필터가 결과가 있는 파일을 제외하려 하면 오류로 보고, 기본값: off)"
+    )
+    
     parser.add_argument(
         "--workers", "-w",
         type=int,
@@ -53,6 +223,104 @@ def create_parser() -> argparse.ArgumentParser:
         help="병렬 처리 워커 수 (기본값: 4)"
     )
     
+    parser.add_argument(
+        "--ignore",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="추가로 무시할 gitignore 형식 패턴 (여러 번 지정 가능)"
+    )
+    
+    parser.add_argument(
+        "--no-ignore-files",
+        action="store_true",
+        help=".gitignore/.ignore 파일을 적용하지 않음"
+    )
+    
+    parser.add_argument(
+        "--include-path",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="이 경로 glob과 일치하는 파일만 분석 (예: 'services/billing/**', 여러 번 지정 가능)"
+    )
+    
+    parser.add_argument(
+        "--exclude-path",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="이 경로 glob과 일치하는 파일/디렉터리 제외 (여러 번 지정 가능)"
+    )
+    
+    parser.add_argument(
+        "--language",
+        action="append",
+        default=[],
+        help="이 언어의 파일만 분석 (예: c, python, javascript, 여러 번 지정 가능)"
+    )
+    
+    parser.add_argument(
+        "--function",
+        action="append",
+        default=[],
+        metavar="REGEX",
+        help="이름이 정규식과 일치하는 함수만 추출 (여러 번 지정 가능)"
+    )
+    
+    parser.add_argument(
+        "--exclude-function",
+        action="append",
+        default=[],
+        metavar="REGEX",
+        help="이름이 정규식과 일치하는 함수 제외 (여러 번 지정 가능)"
+    )
+    
+    parser.add_argument(
+        "--min-fan-out",
+        type=int,
+        default=0,
+        help="서로 다른 피호출 함수가 이 수 이상인 함수만 출력"
+    )
+    
+    parser.add_argument(
+        "--include-builtins",
+        action="store_true",
+        help="언어 내장 함수 호출(print, len, console.log 등)도 호출 관계에 포함"
+    )
+    
+    parser.add_argument(
+        "--drop-external",
+        action="store_true",
+        help="외부 라이브러리 호출(libc, 표준 라이브러리, Node/브라우저 API)을 분석 시점에 제외"
+    )
+    
+    parser.add_argument(
+        "--edge-mode",
+        choices=["calls", "aggregated", "counts"],
+        help="호출 관계 저장 방식 (calls: 호출 위치마다, aggregated: 호출 대상마다 횟수와 위치 목록, "
+             "counts: 호출 대상마다 횟수만, 기본값: calls)"
+    )
+    
+    parser.add_argument(
+        "--progress",
+        choices=["auto", "always", "never"],
+        default="auto",
+        help="진행상황 표시 (auto: 터미널일 때만, 기본값: auto)"
+    )
+    
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=0.5,
+        help="진행상황 갱신 간격(초) (기본값: 0.5)"
+    )
+    
+    parser.add_argument(
+        "--progress-events",
+        help="진행상황 이벤트를 JSON Lines로 기록할 파일 경로"
+    )
+    
     parser.add_argument(
         "--stats",
         action="store_true",
@@ -65,6 +333,53 @@ def create_parser() -> argparse.ArgumentParser:
         help="핫스팟 분석 결과 표시"
     )
     
+    parser.add_argument(
+        "--centrality",
+        action="store_true",
+        help="호출 그래프 중심성(PageRank, 매개 중심성, k-core) 기준 핫스팟 포함 (--hotspots 포함)"
+    )
+    
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="함수별 지표(끝 줄/바이트 범위, 줄 수, 순환 복잡도, 중첩 깊이, 매개변수 수)를 같은 AST 순회에서 계산하여 출력"
+    )
+    
+    parser.add_argument(
+        "--profile",
+        action="append",
+        metavar="FILE",
+        help="런타임 프로파일(cProfile pstats, collapsed stack)을 함수와 호출 간선에 겹쳐 측정 비용, "
+             "실행되지 않은 정적 간선, 정적 분석이 놓친 동적 간선 출력 (여러 번 지정하면 합산)"
+    )
+    
+    parser.add_argument(
+        "--profile-format",
+        choices=list(PROFILE_FORMATS),
+        default="auto",
+        help="프로파일 형식 (기본값: auto - 확장자와 내용으로 판단)"
+    )
+    
+    parser.add_argument(
+        "--rollup",
+        action="append",
+        choices=["file", "directory", "language"],
+        default=[],
+        help="파일/디렉터리/언어 단위 의존성 그래프 출력 (여러 번 지정 가능)"
+    )
+    
+    parser.add_argument(
+        "--rollup-depth",
+        type=int,
+        help="디렉터리 의존성 그래프의 경로 깊이 (기본값: 1)"
+    )
+    
+    parser.add_argument(
+        "--rollup-only",
+        action="store_true",
+        help="함수 단위 호출 정보 없이 --rollup 그래프만 출력"
+    )
+    
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -83,62 +398,207 @@ def create_parser() -> argparse.ArgumentParser:
         help="최소한의 출력만 표시"
     )
     
+    parser.add_argument(
+        "--strict-startup",
+        action="store_true",
+        help="CLI 준비 시간이 startup_budget_ms를 넘거나 지연 로드 모듈이 미리 로드되면 오류로 종료 (CI용)"
+    )
+    
     return parser
 
-def analyze_project(args) -> CallTree:
-    """프로젝트 분석 실행"""
+def apply_config_overrides(args):
+    """CLI 옵션을 분석 설정에 반영"""
+    if args.ignore:
+        ANALYSIS_CONFIG["ignore_patterns"] = ANALYSIS_CONFIG["ignore_patterns"] + args.ignore
+    if args.no_ignore_files:
+        ANALYSIS_CONFIG["use_ignore_files"] = False
+    if args.include_builtins:
+        ANALYSIS_CONFIG["include_builtin_calls"] = True
+    if args.drop_external:
+        ANALYSIS_CONFIG["include_external_calls"] = False
+    if args.edge_mode:
+        ANALYSIS_CONFIG["edge_mode"] = args.edge_mode
+    if args.dedup:
+        ANALYSIS_CONFIG["deduplicate_files"] = args.dedup
+    if args.json_encoder:
+        ANALYSIS_CONFIG["json_encoder"] = args.json_encoder
+    if (args.format in FRAGMENT_FORMATS and not args.rollup_only and args.sample is None and
+            not (args.single_file or args.shard or args.since)):
+        # 함수별 출력은 워커에서 미리 인코딩하고 출력 단계에서는 이어 붙이기만 함
+        ANALYSIS_CONFIG["output_fragments"] = args.format
+    if args.large_files:
+        ANALYSIS_CONFIG["large_file_mode"] = args.large_files
+    if args.prefilter:
+        ANALYSIS_CONFIG["prefilter"] = args.prefilter
+    if args.parse_timeout is not None:
+        ANALYSIS_CONFIG["parse_timeout_seconds"] = args.parse_timeout
+    if args.extract_timeout is not None:
+        ANALYSIS_CONFIG["extract_timeout_seconds"] = args.extract_timeout
+    if args.max_nodes is not None:
+        ANALYSIS_CONFIG["max_extract_nodes"] = args.max_nodes
+    if args.deadline is not None:
+        ANALYSIS_CONFIG["deadline_seconds"] = args.deadline
+    if args.metrics:
+        ANALYSIS_CONFIG["function_metrics"] = True
+    if args.large_file_limit is not None:
+        ANALYSIS_CONFIG["large_file_limit_mb"] = args.large_file_limit
+    if args.include_path:
+        ANALYSIS_CONFIG["include_paths"] = args.include_path
+    if args.exclude_path:
+        ANALYSIS_CONFIG["exclude_paths"] = args.exclude_path
+    if args.language:
+        ANALYSIS_CONFIG["languages"] = args.language
+    if args.function:
+        ANALYSIS_CONFIG["include_functions"] = args.function
+    if args.exclude_function:
+        ANALYSIS_CONFIG["exclude_functions"] = args.exclude_function
+    if args.min_fan_out:
+        ANALYSIS_CONFIG["min_fan_out"] = args.min_fan_out
+    if args.rollup_depth is not None:
+        ANALYSIS_CONFIG["rollup_directory_depth"] = args.rollup_depth
+
+def create_progress_tracker(args, event_stream=None) -> ProgressTracker:
+    """CLI 옵션에 맞는 진행상황 추적기 생성"""
+    if args.quiet or args.progress == "never":
+        show_progress = False
+    elif args.progress == "always":
+        show_progress = True
+    else:
+        show_progress = None  # TTY 여부로 결정
+    
+    tracker = ProgressTracker(show_progress=show_progress, 
+                              refresh_interval=args.progress_interval)
+    if event_stream is not None:
+        tracker.add_listener(ProgressEventWriter(event_stream))
+    
+    return tracker
+
+def analyze_project(args, progress_tracker: Optional[ProgressTracker] = None,
+                    shard: Optional[ShardSpec] = None) -> Tuple[CallTree, Optional[ProjectInfo]]:
+    """프로젝트 분석 실행 (호출 트리와 프로젝트 정보 반환)"""
+    from .analyzer import CallTreeAnalyzer, FileAnalyzer
+    
     if args.single_file:
         analyzer = FileAnalyzer()
-        return analyzer.analyze_single_file(args.path)
+        return analyzer.analyze_single_file(args.path), None
     else:
         project_path = validate_project_path(args.path)
-        analyzer = CallTreeAnalyzer(max_workers=args.workers)
-        return analyzer.analyze_project(str(project_path))
+        analyzer = CallTreeAnalyzer(max_workers=args.workers, 
+                                    progress_tracker=progress_tracker)
+        call_tree = analyzer.analyze_project(str(project_path), shard=shard)
+        return call_tree, analyzer.project_info
 
-def format_output(call_tree: CallTree, format_type: str, include_stats: bool = False, 
-                 include_hotspots: bool = False) -> str:
-    """출력 포맷팅"""
+def analyze_sample(args, progress_tracker: Optional[ProgressTracker] = None):
+    """층화 표본 분석 실행 (추정 보고서 반환)"""
+    from .analyzer import CallTreeAnalyzer
+    from .sampling import analyze_sample as run_sample
+    
+    project_path = validate_project_path(args.path)
+    analyzer = CallTreeAnalyzer(max_workers=args.workers, progress_tracker=progress_tracker)
+    return run_sample(analyzer, str(project_path), args.sample,
+                      time_budget=args.sample_budget, seed=args.sample_seed)
+
+def analyze_incremental(args):
+    """git 리비전 범위 증분 분석 실행"""
+    from .incremental import IncrementalAnalyzer
+    
+    base_snapshot = load_call_tree(args.base_snapshot) if args.base_snapshot else None
+    analyzer = IncrementalAnalyzer(args.path)
+    return analyzer.analyze_range(args.since, base_snapshot)
+
+def format_incremental_output(result, format_type: str) -> str:
+    """증분 분석 결과 포맷팅"""
     if format_type == "json":
-        # CallTree를 JSON 직렬화 가능한 형태로 변환
-        data = {
-            "functions": {}
-        }
-        
-        for func_name, func_info in call_tree.functions.items():
-            data["functions"][func_name] = {
-                "name": func_info.name,
-                "file": str(func_info.file_path),
-                "line": func_info.line,
-                "column": func_info.column,
-                "calls": [
-                    {
-                        "name": call.name,
-                        "line": call.line,
-                        "column": call.column
-                    }
-                    for call in func_info.calls
-                ]
-            }
+        return json.dumps(result.to_dict(), indent=2, ensure_ascii=False)
+    return result.format_text()
+
+def build_rollups(call_tree: CallTree, project_info: Optional[ProjectInfo],
+                  granularities: List[str]) -> Dict[str, RollupGraph]:
+    """집계 그래프 생성 (병합 중 유지한 집계가 없으면 호출 트리에서 계산)"""
+    if project_info is not None:
+        rollup = project_info.rollup
+    else:
+        rollup = RollupIndex()
+        for func_info in call_tree.functions.values():
+            language = get_language_by_extension(func_info.file_path.suffix) or "unknown"
+            rollup.add_functions(func_info.file_path, language, [func_info])
+    
+    return rollup.graphs(dict.fromkeys(granularities), ANALYSIS_CONFIG["rollup_directory_depth"])
+
+def format_output(call_tree: CallTree, format_type: str, include_stats: bool = False, 
+                 include_hotspots: bool = False, rollups: Optional[Dict[str, RollupGraph]] = None,
+                 include_functions: bool = True,
+                 duplicate_files: Optional[Dict[Path, Path]] = None,
+                 fragments: Optional[Dict[str, str]] = None,
+                 include_centrality: bool = False,
+                 skipped_files: Optional[List[Path]] = None,
+                 truncated_files: Optional[Dict[Path, str]] = None,
+                 profile: Optional[ProfileOverlay] = None) -> str:
+    """출력 포맷팅
+    
+    fragments에 워커가 미리 인코딩한 함수별 조각이 있으면 다시 인코딩하지 않고 이어 붙인다.
+    예산을 넘어 건너뛰거나 일부만 분석한 파일이 있으면 incomplete_files 항목으로 표시한다.
+    profile이 주어지면 측정값 오버레이(profile 항목)와 측정 비용 핫스팟을 추가한다.
+    """
+    if format_type in FRAGMENT_FORMATS:
+        encoder = get_json_encoder(ANALYSIS_CONFIG["json_encoder"])
+        fragments = fragments if ANALYSIS_CONFIG["output_fragments"] == format_type else None
+        function_fragments = None
+        if include_functions:
+            function_fragments = [
+                (fragments or {}).get(func_name) or function_fragment(func_name, func_info, format_type, encoder)
+                for func_name, func_info in call_tree.functions.items()
+            ]
+        
+        sections = {}
         
         # 통계 추가
         if include_stats:
-            data["statistics"] = StatisticsCalculator.calculate_complexity_metrics(call_tree)
+            sections["statistics"] = StatisticsCalculator.calculate_complexity_metrics(call_tree)
         
         # 핫스팟 추가
         if include_hotspots:
-            data["hotspots"] = StatisticsCalculator.find_hotspots(call_tree)
+            sections["hotspots"] = StatisticsCalculator.find_hotspots(call_tree, include_centrality, profile)
+        
+        # 프로파일 오버레이 추가
+        if profile is not None:
+            sections["profile"] = profile.report()
+        
+        # 합쳐진 중복 파일 추가
+        if duplicate_files:
+            sections["duplicate_files"] = {
+                str(path): str(original) for path, original in sorted(duplicate_files.items())
+            }
+        
+        # 예산 초과로 불완전한 파일 추가
+        if skipped_files or truncated_files:
+            sections["incomplete_files"] = {
+                "skipped": [str(path) for path in skipped_files or []],
+                "truncated": {str(path): reason for path, reason in (truncated_files or {}).items()}
+            }
         
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        # 집계 그래프 추가
+        if rollups:
+            sections["rollups"] = {name: graph.to_dict() for name, graph in rollups.items()}
+        
+        if format_type == "json":
+            return assemble_json_document(function_fragments, sections, encoder)
+        
+        # jsonl: 함수 레코드 뒤에 나머지 항목을 종류별 레코드로 기록
+        lines = function_fragments or []
+        for key, value in sections.items():
+            lines.append(encoder.dumps({"type": key, "data": value}))
+        return "\n".join(lines)
     
     elif format_type == "text":
-        result = CodeFormatter.format_call_tree_text(call_tree)
+        result = CodeFormatter.format_call_tree_text(call_tree) if include_functions else ""
         
         if include_stats:
             stats = StatisticsCalculator.calculate_complexity_metrics(call_tree)
             result += "\n" + CodeFormatter.format_statistics(stats)
         
         if include_hotspots:
-            hotspots = StatisticsCalculator.find_hotspots(call_tree)
+            hotspots = StatisticsCalculator.find_hotspots(call_tree, include_centrality, profile)
             result += "\n=== Hotspots ===\n"
             
             result += "\nMost Called Functions:\n"
@@ -152,6 +612,36 @@ def format_output(call_tree: CallTree, format_type: str, include_stats: bool = F
             result += "\nOrphaned Functions:\n"
             for func in hotspots["orphaned_functions"][:5]:
                 result += f"  - {func}\n"
+            
+            for category, title in (("central_functions", "Central Functions (PageRank)"),
+                                    ("bridge_functions", "Bridge Functions (Betweenness)"),
+                                    ("core_functions", "Core Functions (k-core)"),
+                                    ("most_complex_functions", "Most Complex Functions (cyclomatic)"),
+                                    ("largest_functions", "Largest Functions (lines)"),
+                                    ("costliest_functions", "Costliest Functions (self, measured)"),
+                                    ("costliest_cumulative_functions", "Costliest Functions (cumulative, measured)")):
+                if category in hotspots:
+                    result += f"\n{title}:\n"
+                    for func in hotspots[category][:5]:
+                        result += f"  - {func}\n"
+        
+        if duplicate_files:
+            result += "\n=== Duplicate Files ===\n"
+            for path, original in sorted(duplicate_files.items()):
+                result += f"  {path} == {original}\n"
+        
+        if skipped_files or truncated_files:
+            result += "\n=== Incomplete Files ===\n"
+            for path in skipped_files or []:
+                result += f"  {path} (skipped: deadline)\n"
+            for path, reason in (truncated_files or {}).items():
+                result += f"  {path} (truncated: {reason})\n"
+        
+        if profile is not None:
+            result += "\n" + profile.format_text()
+        
+        for graph in (rollups or {}).values():
+            result += "\n" + graph.format_text()
         
         return result
     
@@ -167,10 +657,249 @@ def write_output(content: str, output_path: Optional[str]):
     else:
         print(content)
 
-def main():
+def create_diff_parser() -> argparse.ArgumentParser:
+    """diff 하위 명령 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog="call_tree_analyzer diff",
+        description="저장된 두 JSON 분석 결과의 호출 그래프 구조 비교"
+    )
+    parser.add_argument("old", help="이전 분석 결과 (JSON)")
+    parser.add_argument("new", help="새 분석 결과 (JSON)")
+    parser.add_argument("--output", "-o", help="출력 파일 경로")
+    parser.add_argument(
+        "--format", "-f",
+        choices=["json", "text"],
+        default="json",
+        help="출력 형식 (기본값: json)"
+    )
+    parser.add_argument(
+        "--fail-on-change",
+        action="store_true",
+        help="변경 사항이 있으면 종료 코드 1로 종료"
+    )
+    parser.add_argument("--strict-startup", action="store_true",
+                        help="CLI 준비 시간이 startup_budget_ms를 넘으면 오류로 종료 (CI용)")
+    return parser
+
+def diff_main(argv: List[str]):
+    """diff 하위 명령 실행"""
+    from .diff import diff_call_trees
+    
+    args = create_diff_parser().parse_args(argv)
+    setup_logging("ERROR")
+    check_startup_budget(args.strict_startup)
+    
+    try:
+        diff = diff_call_trees(load_call_tree(args.old), load_call_tree(args.new))
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        sys.exit(1)
+    
+    if args.format == "json":
+        output = json.dumps(diff.to_dict(), indent=2, ensure_ascii=False)
+    else:
+        output = diff.format_text()
+    write_output(output, args.output)
+    
+    if args.fail_on_change and not diff.is_empty():
+        sys.exit(1)
+
+def create_merge_parser() -> argparse.ArgumentParser:
+    """merge 하위 명령 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog="call_tree_analyzer merge",
+        description="--shard로 만든 부분 결과들을 하나의 분석 결과로 병합"
+    )
+    parser.add_argument("partials", nargs="+", help="샤드 부분 결과 파일 (JSON)")
+    parser.add_argument("--output", "-o", help="출력 파일 경로")
+    parser.add_argument(
+        "--format", "-f",
+        choices=["json", "jsonl", "text", "sqlite"],
+        default="json",
+        help="출력 형식 (기본값: json, sqlite는 --output 필요)"
+    )
+    parser.add_argument("--root", help="결과에 기록할 프로젝트 루트 (기본값: 첫 번째 부분 결과의 루트)")
+    parser.add_argument("--stats", action="store_true", help="통계 정보 표시")
+    parser.add_argument("--hotspots", action="store_true", help="핫스팟 분석 결과 표시")
+    parser.add_argument("--centrality", action="store_true",
+                        help="호출 그래프 중심성(PageRank, 매개 중심성, k-core) 핫스팟 포함")
+    parser.add_argument("--profile", action="append", metavar="FILE",
+                        help="런타임 프로파일(cProfile pstats, collapsed stack) 오버레이 (여러 번 지정 가능)")
+    parser.add_argument("--profile-format", choices=list(PROFILE_FORMATS), default="auto",
+                        help="프로파일 형식 (기본값: auto)")
+    parser.add_argument(
+        "--rollup",
+        action="append",
+        choices=["file", "directory", "language"],
+        default=[],
+        help="파일/디렉터리/언어 단위 의존성 그래프 출력 (여러 번 지정 가능)"
+    )
+    parser.add_argument("--function", action="append", default=[], metavar="REGEX",
+                        help="이름이 정규식과 일치하는 함수만 출력 (여러 번 지정 가능)")
+    parser.add_argument("--exclude-function", action="append", default=[], metavar="REGEX",
+                        help="이름이 정규식과 일치하는 함수 제외 (여러 번 지정 가능)")
+    parser.add_argument("--min-fan-out", type=int, default=0,
+                        help="서로 다른 피호출 함수가 이 수 이상인 함수만 출력")
+    parser.add_argument("--strict-startup", action="store_true",
+                        help="CLI 준비 시간이 startup_budget_ms를 넘으면 오류로 종료 (CI용)")
+    return parser
+
+def merge_main(argv: List[str]):
+    """merge 하위 명령 실행"""
+    parser = create_merge_parser()
+    args = parser.parse_args(argv)
+    setup_logging("ERROR")
+    
+    if args.format == "sqlite" and not args.output:
+        parser.error("--format sqlite에는 --output 경로가 필요합니다")
+    if args.profile and args.format == "sqlite":
+        parser.error("--profile은 json/jsonl/text 출력에서만 사용할 수 있습니다")
+    check_startup_budget(args.strict_startup)
+    
+    try:
+        call_tree, project_info = merge_partials(args.partials, Path(args.root) if args.root else None)
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        sys.exit(1)
+    
+    error_handler = ErrorHandler()
+    for file_info in project_info.files.values():
+        if file_info.errors:
+            error_handler.record_file_errors(file_info)
+    error_handler.log_summary()
+    
+    # 출력 단계 필터 (집계 그래프는 필터 전 전체 트리 기준)
+    analysis_filter = AnalysisFilter(include_functions=args.function, exclude_functions=args.exclude_function,
+                                     min_fan_out=args.min_fan_out)
+    output_tree = call_tree
+    if analysis_filter.has_output_filters:
+        output_tree = analysis_filter.filter_call_tree(call_tree)
+    
+    if args.format == "sqlite":
+        from .sqlite_store import write_sqlite
+        write_sqlite(output_tree, args.output, project_info)
+        print(f"결과가 저장되었습니다: {args.output}")
+        return
+    
+    rollups = build_rollups(call_tree, project_info, args.rollup) if args.rollup else None
+    call_tree = output_tree
+    profile = load_profile_overlay(call_tree, args.profile, args.profile_format) if args.profile else None
+    output = format_output(call_tree, args.format, include_stats=args.stats,
+                           include_hotspots=args.hotspots or args.centrality, rollups=rollups,
+                           include_centrality=args.centrality,
+                           duplicate_files=project_info.duplicate_files,
+                           skipped_files=project_info.get_skipped_files(),
+                           truncated_files=project_info.get_truncated_files(),
+                           profile=profile)
+    write_output(output, args.output)
+
+def create_workspace_parser() -> argparse.ArgumentParser:
+    """workspace 하위 명령 인자 파서 생성 (분석 옵션은 기본 명령과 같음)"""
+    parser = create_parser()
+    parser.prog = "call_tree_analyzer workspace"
+    parser.description = "매니페스트에 나열한 여러 저장소를 워커 풀과 캐시를 공유하며 한 번에 분석"
+    parser.epilog = None
+    for action in parser._actions:
+        if action.dest == "path":
+            action.help = "저장소 매니페스트 (JSON 목록 또는 한 줄에 경로 하나인 텍스트)"
+    
+    parser.add_argument(
+        "--output-dir",
+        required=True,
+        metavar="DIR",
+        help="저장소별 결과를 <이름>.<형식> 파일로 저장할 디렉터리"
+    )
+    parser.add_argument(
+        "--combined",
+        metavar="FILE",
+        help="모든 저장소를 합친 그래프(저장소 간 호출과 저장소 단위 의존성 포함)를 저장할 경로"
+    )
+    return parser
+
+def workspace_main(argv: List[str]):
+    """workspace 하위 명령 실행"""
+    parser = create_workspace_parser()
+    args = parser.parse_args(argv)
+    setup_logging("ERROR" if args.quiet else args.log_level, args.log_file)
+    
+    if args.single_file or args.since or args.shard or args.sample is not None or args.profile:
+        parser.error("workspace에서는 --single-file, --since, --shard, --sample, --profile을 사용할 수 없습니다")
+    if args.format == "sqlite" or args.output:
+        parser.error("workspace 결과는 --output-dir(저장소별)과 --combined(전체)로 저장합니다 (sqlite 미지원)")
+    if args.rollup_only and not args.rollup:
+        parser.error("--rollup-only에는 --rollup 단위 지정이 필요합니다")
+    
+    apply_config_overrides(args)
+    check_startup_budget(args.strict_startup)
+    from .workspace import WorkspaceAnalyzer, WorkspaceCombiner, load_manifest
+    
+    extension = {"json": "json", "jsonl": "jsonl", "text": "txt"}[args.format]
+    analysis_filter = AnalysisFilter.from_config(ANALYSIS_CONFIG)
+    
+    def render(call_tree: CallTree, project_info: ProjectInfo,
+               extra_rollups: Optional[Dict[str, RollupGraph]] = None) -> str:
+        rollups = build_rollups(call_tree, project_info, args.rollup) if args.rollup else {}
+        rollups.update(extra_rollups or {})
+        if analysis_filter.has_output_filters:
+            call_tree = analysis_filter.filter_call_tree(call_tree)
+        return format_output(
+            call_tree, args.format, include_stats=args.stats,
+            include_hotspots=args.hotspots or args.centrality, include_centrality=args.centrality,
+            rollups=rollups or None, include_functions=not args.rollup_only,
+            duplicate_files=project_info.duplicate_files, fragments=project_info.output_fragments,
+            skipped_files=project_info.get_skipped_files(),
+            truncated_files=project_info.get_truncated_files()
+        )
+    
+    try:
+        repositories = load_manifest(args.path)
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        workspace = WorkspaceAnalyzer(max_workers=args.workers, progress_tracker=create_progress_tracker(args))
+        combiner = WorkspaceCombiner() if args.combined else None
+        
+        # 저장소 결과는 끝나는 대로 저장 (합친 그래프가 필요 없으면 메모리에 남기지 않음)
+        for result in workspace.iter_repositories(repositories):
+            output_path = output_dir / f"{result.repository.name}.{extension}"
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(render(result.call_tree, result.project_info))
+            if combiner is not None:
+                combiner.add(result)
+        print(f"저장소 {len(repositories)}개의 결과가 저장되었습니다: {output_dir}")
+        
+        if combiner is not None:
+            call_tree, project_info = combiner.build()
+            content = render(call_tree, project_info, {"repository": combiner.repository_graph()})
+            write_output(content, args.combined)
+    except KeyboardInterrupt:
+        print("\n분석이 중단되었습니다.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        if args.log_level == "DEBUG":
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+# 첫 번째 인자로 선택하는 하위 명령 (그 외에는 기존 분석 명령)
+COMMANDS = {
+    "diff": diff_main,
+    "merge": merge_main,
+    "workspace": workspace_main,
+}
+
+def main(argv: Optional[List[str]] = None):
     """CLI 메인 함수"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        COMMANDS[argv[0]](argv[1:])
+        return
+    
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    logger = logging.getLogger(__name__)
     
     # 로깅 설정
     if not args.quiet:
@@ -178,16 +907,99 @@ def main():
     else:
         setup_logging("ERROR", args.log_file)
     
+    event_stream = None
+    apply_config_overrides(args)
+    
     try:
+        # 진행상황 추적기 구성
+        if args.progress_events:
+            event_stream = open(args.progress_events, 'w', encoding='utf-8')
+        progress_tracker = create_progress_tracker(args, event_stream)
+        
+        if args.profile and (args.since or args.shard or args.sample is not None or args.format == "sqlite"):
+            parser.error("--profile은 전체 분석의 json/jsonl/text 출력에서만 사용할 수 있습니다 "
+                         "(샤드 결과는 merge에서 적용)")
+        
+        check_startup_budget(args.strict_startup)
+        
+        if args.since:
+            result = analyze_incremental(args)
+            if args.update_snapshot and result.head_tree is not None:
+                write_output(format_output(result.head_tree, "json"), args.update_snapshot)
+            write_output(format_incremental_output(result, args.format), args.output)
+            return
+        
+        if args.format == "sqlite" and not args.output:
+            parser.error("--format sqlite에는 --output 경로가 필요합니다")
+        
+        shard = None
+        if args.shard:
+            if args.single_file or args.format != "json":
+                parser.error("--shard는 디렉터리 분석과 json 형식에서만 사용할 수 있습니다")
+            if args.min_fan_out:
+                parser.error("--min-fan-out은 샤드 부분 결과에 적용할 수 없습니다 (merge --min-fan-out으로 지정)")
+            try:
+                shard = ShardSpec.parse(args.shard, args.shard_strategy)
+            except ValueError as e:
+                parser.error(str(e))
+        
+        if args.sample is not None:
+            if args.single_file or shard is not None or args.format not in ("json", "text"):
+                parser.error("--sample은 디렉터리 분석과 json/text 형식에서만 사용할 수 있습니다")
+            report = analyze_sample(args, progress_tracker)
+            if args.format == "json":
+                output = get_json_encoder(ANALYSIS_CONFIG["json_encoder"]).dumps(report.to_dict(), indent=True)
+            else:
+                output = report.format_text()
+            write_output(output, args.output)
+            return
+        
         # 분석 실행
-        call_tree = analyze_project(args)
+        call_tree, project_info = analyze_project(args, progress_tracker, shard)
+        
+        if shard is not None:
+            # 부분 결과는 merge 명령으로 합친 뒤 통계/집계를 계산
+            content = write_partial(args.output, call_tree, project_info, shard)
+            if args.output:
+                print(f"샤드 {shard.index}/{shard.count} 부분 결과가 저장되었습니다: {args.output}")
+            else:
+                print(content)
+            return
+        
+        # 출력 단계 필터 (최소 팬아웃 등, 집계 그래프는 필터 전 전체 트리 기준)
+        analysis_filter = AnalysisFilter.from_config(ANALYSIS_CONFIG)
+        output_tree = call_tree
+        if analysis_filter.has_output_filters:
+            output_tree = analysis_filter.filter_call_tree(call_tree)
+        
+        if args.format == "sqlite":
+            from .sqlite_store import write_sqlite
+            write_sqlite(output_tree, args.output, project_info)
+            print(f"결과가 저장되었습니다: {args.output}")
+            return
+        
+        if args.rollup_only and not args.rollup:
+            parser.error("--rollup-only에는 --rollup 단위 지정이 필요합니다")
+        rollups = build_rollups(call_tree, project_info, args.rollup) if args.rollup else None
+        call_tree = output_tree
+        
+        # 런타임 프로파일 오버레이
+        profile = load_profile_overlay(call_tree, args.profile, args.profile_format) if args.profile else None
         
         # 결과 포맷팅
         output = format_output(
             call_tree, 
             args.format,
             include_stats=args.stats,
-            include_hotspots=args.hotspots
+            include_hotspots=args.hotspots or args.centrality,
+            include_centrality=args.centrality,
+            rollups=rollups,
+            include_functions=not args.rollup_only,
+            duplicate_files=project_info.duplicate_files if project_info else None,
+            fragments=project_info.output_fragments if project_info else None,
+            skipped_files=project_info.get_skipped_files() if project_info else None,
+            truncated_files=project_info.get_truncated_files() if project_info else None,
+            profile=profile
         )
         
         # 출력
@@ -202,6 +1014,9 @@ def main():
             import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        if event_stream is not None:
+            event_stream.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,5 +1,8 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple, Optional
 from pathlib import Path
+from functools import lru_cache
+
+from .ignore import IgnoreEngine
 
 # 언어별 설정
 LANGUAGE_CONFIG = {
@@ -8,34 +11,89 @@ LANGUAGE_CONFIG = {
         "parser_name": "c",
         "function_node_types": ["function_definition"],
         "call_node_types": ["call_expression"],
-        "comment_patterns": ["//", "/*", "*/"]
+        "comment_patterns": ["//", "/*", "*/"],
+        # 함수 정의가 있으려면 반드시 나타나야 하는 바이트 패턴 (사전 필터, 함수 본문의 중괄호)
+        "prefilter_pattern": rb"\{",
+        # 함수 지표: 순환 복잡도에 1씩 더하는 분기 노드 (binary_expression은 logical_operators일 때만)
+        "branch_node_types": ["if_statement", "for_statement", "while_statement", "do_statement",
+                              "case_statement", "conditional_expression", "binary_expression"],
+        "logical_operators": ["&&", "||"],
+        # 함수 지표: 중첩 깊이를 한 단계 늘리는 제어 구조 (else if는 같은 깊이)
+        "nesting_node_types": ["if_statement", "for_statement", "while_statement", "do_statement",
+                               "switch_statement"]
     },
     "python": {
         "extensions": [".py"],
         "parser_name": "python", 
         "function_node_types": ["function_definition"],
         "call_node_types": ["call"],
-        "comment_patterns": ["#", '"""', "'''"]
+        "comment_patterns": ["#", '"""', "'''"],
+        "prefilter_pattern": rb"\bdef\b",
+        "branch_node_types": ["if_statement", "elif_clause", "for_statement", "while_statement",
+                              "except_clause", "case_clause", "conditional_expression", "boolean_operator",
+                              "for_in_clause", "if_clause"],
+        "logical_operators": [],
+        "nesting_node_types": ["if_statement", "for_statement", "while_statement", "try_statement",
+                               "with_statement", "match_statement"]
     },
     "javascript": {
         "extensions": [".js", ".jsx", ".ts", ".tsx"],
         "parser_name": "javascript",
         "function_node_types": ["function_declaration", "function_expression", "arrow_function"],
         "call_node_types": ["call_expression"],
-        "comment_patterns": ["//", "/*", "*/"]
+        "comment_patterns": ["//", "/*", "*/"],
+        "prefilter_pattern": rb"function|=>",
+        "branch_node_types": ["if_statement", "for_statement", "for_in_statement", "while_statement",
+                              "do_statement", "switch_case", "catch_clause", "ternary_expression",
+                              "binary_expression"],
+        "logical_operators": ["&&", "||", "??"],
+        "nesting_node_types": ["if_statement", "for_statement", "for_in_statement", "while_statement",
+                               "do_statement", "switch_statement", "try_statement"]
     }
 }
 
 # 분석 설정
 ANALYSIS_CONFIG = {
     "max_file_size_mb": 10,  # 최대 파일 크기 (MB)
+    "large_file_mode": "skip",  # 최대 크기를 넘는 파일 처리 (skip: 건너뜀, stream: mmap과 읽기 콜백으로 분석)
+    "large_file_limit_mb": 1024,  # stream 모드에서도 분석하지 않는 파일 크기 상한 (MB)
+    "large_file_workers": 1,  # 동시에 분석할 대용량 파일 수
+    "stream_chunk_kb": 256,  # 읽기 콜백이 한 번에 파서에 넘기는 크기 (KB)
+    "timed_chunk_kb": 8,  # 파싱 시간 제한이 있을 때 넘기는 크기 (KB, 시간을 확인하는 간격)
+    "parse_timeout_seconds": None,  # 파일별 파싱 시간 제한 (초, 넘으면 그때까지 읽은 부분만 파싱)
+    "extract_timeout_seconds": None,  # 파일별 함수/호출 추출 시간 제한 (초)
+    "max_extract_nodes": None,  # 파일별 추출 단계에서 방문할 최대 AST 노드 수
+    "deadline_seconds": None,  # 전체 분석 시간 제한 (초, 지나면 남은 파일은 건너뛰고 부분 결과 출력)
+    "prefilter": "off",  # 파싱 전 바이트 사전 필터 (off, on: 함수 정의가 있을 수 없는 파일은 파싱 생략, validate: 모두 파싱하고 필터가 놓친 파일 보고)
     "max_recursion_depth": 1000,  # 최대 재귀 깊이
+    "function_metrics": False,  # 함수별 지표(줄 수, 순환 복잡도, 중첩 깊이, 매개변수 수) 계산 여부
     "ignore_patterns": [
         "*.pyc", "*.pyo", "__pycache__", ".git", ".svn", 
         "node_modules", "build", "dist", ".pytest_cache"
     ],
+    "use_ignore_files": True,  # 디렉터리별 무시 파일 적용 여부
+    "ignore_files": [".gitignore", ".ignore"],  # gitignore 형식 무시 파일 이름
     "include_anonymous_functions": False,  # 익명 함수 포함 여부
-    "include_builtin_calls": False  # 내장 함수 호출 포함 여부
+    "include_builtin_calls": False,  # 내장 함수 호출 포함 여부
+    "include_external_calls": True,  # 외부 라이브러리(libc, 표준 라이브러리 등) 호출 포함 여부
+    "edge_mode": "calls",  # 호출 관계 저장 방식 (calls: 호출 위치별, aggregated: 호출 대상별+위치 목록, counts: 호출 대상별 횟수만)
+    "rollup_directory_depth": 1,  # 디렉터리 집계 그래프의 경로 깊이 (프로젝트 루트 기준)
+    "pagerank_damping": 0.85,  # 중심성 핫스팟의 PageRank 감쇠 계수
+    "betweenness_samples": 64,  # 매개 중심성 근사에 사용할 출발 함수 수
+    "python_betweenness_edge_budget": 2_000_000,  # numpy가 없을 때 매개 중심성의 최대 탐색 간선 수 (표본 수 x 간선 수, 넘으면 표본을 줄임)
+    "sample_directory_depth": 1,  # 표본 분석의 층을 나누는 디렉터리 깊이 (언어와 함께 사용)
+    "sample_confidence": 0.95,  # 표본 분석 추정값의 신뢰수준
+    "output_fragments": None,  # 워커에서 함수별로 미리 인코딩할 출력 형식 (json, jsonl, None: 출력 단계에서 인코딩)
+    "json_encoder": "auto",  # JSON 인코더 (auto: orjson이 있으면 사용, orjson, json)
+    "startup_budget_ms": 200,  # CLI가 분석을 시작하기까지의 시간 예산 (밀리초, 넘으면 경고, None: 검사 안 함)
+    "deduplicate_files": "replicate",  # 내용이 같은 파일 처리 (replicate: 한 번 분석 후 복제, collapse: 대표 파일로 합침, off: 모두 분석)
+    # 분석 범위 필터 (비어 있으면 적용하지 않음)
+    "include_paths": [],  # 포함할 경로 glob (프로젝트 루트 기준)
+    "exclude_paths": [],  # 제외할 경로 glob
+    "languages": [],  # 분석할 언어
+    "include_functions": [],  # 포함할 함수 이름 정규식
+    "exclude_functions": [],  # 제외할 함수 이름 정규식
+    "min_fan_out": 0  # 출력할 함수의 최소 팬아웃 (서로 다른 피호출 함수 수)
 }
 
 def get_language_by_extension(extension: str) -> str:
@@ -52,10 +110,15 @@ def get_supported_extensions() -> List[str]:
         extensions.extend(config["extensions"])
     return list(set(extensions))
 
-def should_ignore_path(path: Path) -> bool:
-    """경로가 무시 패턴에 해당하는지 확인"""
-    path_str = str(path)
-    for pattern in ANALYSIS_CONFIG["ignore_patterns"]:
-        if pattern in path_str:
-            return True
-    return False
\ No newline at end of file
+def get_ignore_engine() -> IgnoreEngine:
+    """현재 설정으로 컴파일된 무시 엔진 반환 (패턴이 바뀌면 다시 컴파일)"""
+    ignore_files = ANALYSIS_CONFIG["ignore_files"] if ANALYSIS_CONFIG["use_ignore_files"] else []
+    return _compile_ignore_engine(tuple(ANALYSIS_CONFIG["ignore_patterns"]), tuple(ignore_files))
+
+@lru_cache(maxsize=8)
+def _compile_ignore_engine(patterns: Tuple[str, ...], ignore_files: Tuple[str, ...]) -> IgnoreEngine:
+    return IgnoreEngine(patterns, ignore_files)
+
+def should_ignore_path(path: Path, root: Optional[Path] = None) -> bool:
+    """경로의 경로 요소 중 무시 패턴에 해당하는 것이 있는지 확인 (절대 경로는 root 기준 상대 경로로 검사)"""
+    return get_ignore_engine().is_path_ignored(Path(path), Path(root) if root is not None else None)
\ No newline at end of file
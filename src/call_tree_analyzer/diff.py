@@ -0,0 +1,163 @@
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Iterable, Set, FrozenSet
+
+from .models import CallTree, FunctionInfo
+
+Edge = Tuple[str, str]  # (호출자 전체 이름, 피호출 함수 이름)
+
+def callee_names(func_info: FunctionInfo) -> FrozenSet[str]:
+    """함수가 호출하는 함수 이름 집합 (호출 위치/순서와 무관)"""
+    return frozenset(call.name for call in func_info.calls)
+
+@dataclass
+class CallTreeDiff:
+    """두 호출 트리의 구조적 차이"""
+    added_functions: List[str] = field(default_factory=list)
+    removed_functions: List[str] = field(default_factory=list)
+    moved_functions: List[Tuple[str, str]] = field(default_factory=list)  # (이전, 이후)
+    added_edges: List[Edge] = field(default_factory=list)
+    removed_edges: List[Edge] = field(default_factory=list)
+    fan_in_delta: Dict[str, int] = field(default_factory=dict)  # 피호출 이름 -> 호출자 수 변화
+    fan_out_delta: Dict[str, int] = field(default_factory=dict)  # 함수 -> 피호출 함수 수 변화
+    unchanged_functions: int = 0
+    
+    def is_empty(self) -> bool:
+        """변경 사항이 없는지 확인"""
+        return not (self.added_functions or self.removed_functions or self.moved_functions
+                    or self.added_edges or self.removed_edges)
+    
+    def to_dict(self) -> Dict[str, object]:
+        """JSON 직렬화 가능한 형태로 변환"""
+        return {
+            "added_functions": self.added_functions,
+            "removed_functions": self.removed_functions,
+            "moved_functions": [{"from": old, "to": new} for old, new in self.moved_functions],
+            "added_edges": [{"caller": caller, "callee": callee} for caller, callee in self.added_edges],
+            "removed_edges": [{"caller": caller, "callee": callee} for caller, callee in self.removed_edges],
+            "fan_in_delta": self.fan_in_delta,
+            "fan_out_delta": self.fan_out_delta,
+            "summary": {
+                "added_functions": len(self.added_functions),
+                "removed_functions": len(self.removed_functions),
+                "moved_functions": len(self.moved_functions),
+                "added_edges": len(self.added_edges),
+                "removed_edges": len(self.removed_edges),
+                "unchanged_functions": self.unchanged_functions
+            }
+        }
+    
+    def format_text(self) -> str:
+        """사람이 읽기 쉬운 텍스트로 포맷"""
+        lines = ["=== Call Graph Diff ===", ""]
+        summary = self.to_dict()["summary"]
+        lines.extend(f"{key}: {value}" for key, value in summary.items())
+        
+        sections = [
+            ("Added Functions", [f"  + {name}" for name in self.added_functions]),
+            ("Removed Functions", [f"  - {name}" for name in self.removed_functions]),
+            ("Moved Functions", [f"  ~ {old} -> {new}" for old, new in self.moved_functions]),
+            ("Added Edges", [f"  + {caller} -> {callee}" for caller, callee in self.added_edges]),
+            ("Removed Edges", [f"  - {caller} -> {callee}" for caller, callee in self.removed_edges]),
+            ("Fan-in Changes", [f"  {name}: {delta:+d}" for name, delta in self.fan_in_delta.items()]),
+            ("Fan-out Changes", [f"  {name}: {delta:+d}" for name, delta in self.fan_out_delta.items()]),
+        ]
+        for title, items in sections:
+            if items:
+                lines.append("")
+                lines.append(f"{title}:")
+                lines.extend(items)
+        
+        return "\n".join(lines)
+
+def diff_call_trees(old: CallTree, new: CallTree) -> CallTreeDiff:
+    """함수 식별자(전체 이름) 기준으로 두 호출 트리 비교
+    
+    양쪽에 모두 있는 함수는 호출 대상 집합이 같으면 변경 없음으로 센다. 한쪽에만 있는
+    함수 중 이름이 같은 쌍이 하나뿐이면 다른 파일로 이동한 것으로 본다.
+    """
+    return diff_functions(old.functions.values(), new.functions.values())
+
+def diff_functions(old_functions: Iterable[FunctionInfo],
+                   new_functions: Iterable[FunctionInfo]) -> CallTreeDiff:
+    """두 함수 집합 비교 (호출 트리 일부만 비교할 때 사용)
+    
+    함수마다 호출 대상 집합을 한 번만 만들어 비교, 간선 차이, 팬아웃 변화에 함께 쓴다.
+    """
+    old_map = {func.full_name: func for func in old_functions}
+    new_map = {func.full_name: func for func in new_functions}
+    result = CallTreeDiff()
+    
+    added_edges: Set[Edge] = set()
+    removed_edges: Set[Edge] = set()
+    
+    # 양쪽에 모두 있는 함수: 호출 대상 집합이 같으면 건너뜀
+    for full_name in old_map.keys() & new_map.keys():
+        old_callees, new_callees = callee_names(old_map[full_name]), callee_names(new_map[full_name])
+        if old_callees == new_callees:
+            result.unchanged_functions += 1
+            continue
+        
+        _diff_edges(full_name, old_callees, full_name, new_callees, added_edges, removed_edges)
+        _record_fan_out(result, full_name, old_callees, new_callees)
+    
+    removed = {name: old_map[name] for name in old_map.keys() - new_map.keys()}
+    added = {name: new_map[name] for name in new_map.keys() - old_map.keys()}
+    
+    # 이동 감지: 이름이 같은 삭제/추가 함수가 각각 하나뿐인 경우
+    removed_by_name = _group_by_name(removed.values())
+    added_by_name = _group_by_name(added.values())
+    for name in removed_by_name.keys() & added_by_name.keys():
+        if len(removed_by_name[name]) != 1 or len(added_by_name[name]) != 1:
+            continue
+        
+        old_func, new_func = removed_by_name[name][0], added_by_name[name][0]
+        result.moved_functions.append((old_func.full_name, new_func.full_name))
+        del removed[old_func.full_name]
+        del added[new_func.full_name]
+        
+        old_callees, new_callees = callee_names(old_func), callee_names(new_func)
+        if old_callees != new_callees:
+            # 호출자 이름이 바뀌었으므로 이전/이후 이름 기준으로 변경된 호출만 기록
+            _diff_edges(old_func.full_name, old_callees, new_func.full_name, new_callees,
+                        added_edges, removed_edges)
+            _record_fan_out(result, new_func.full_name, old_callees, new_callees)
+    
+    for func in added.values():
+        added_edges.update((func.full_name, call.name) for call in func.calls)
+    for func in removed.values():
+        removed_edges.update((func.full_name, call.name) for call in func.calls)
+    
+    result.added_functions = sorted(added)
+    result.removed_functions = sorted(removed)
+    result.moved_functions.sort()
+    result.added_edges = sorted(added_edges)
+    result.removed_edges = sorted(removed_edges)
+    
+    # 팬인 변화: 피호출 이름별로 추가/삭제된 호출 관계 수를 합산
+    fan_in = Counter()
+    for _, callee in added_edges:
+        fan_in[callee] += 1
+    for _, callee in removed_edges:
+        fan_in[callee] -= 1
+    result.fan_in_delta = {name: delta for name, delta in sorted(fan_in.items()) if delta}
+    result.fan_out_delta = dict(sorted(result.fan_out_delta.items()))
+    
+    return result
+
+def _diff_edges(old_name: str, old_callees: FrozenSet[str], new_name: str, new_callees: FrozenSet[str],
+                added_edges: Set[Edge], removed_edges: Set[Edge]):
+    added_edges.update((new_name, callee) for callee in new_callees - old_callees)
+    removed_edges.update((old_name, callee) for callee in old_callees - new_callees)
+
+def _record_fan_out(result: CallTreeDiff, full_name: str,
+                    old_callees: FrozenSet[str], new_callees: FrozenSet[str]):
+    delta = len(new_callees) - len(old_callees)
+    if delta:
+        result.fan_out_delta[full_name] = delta
+
+def _group_by_name(functions: Iterable[FunctionInfo]) -> Dict[str, List[FunctionInfo]]:
+    groups = defaultdict(list)
+    for func in functions:
+        groups[func.name].append(func)
+    return groups
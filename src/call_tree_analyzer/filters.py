@@ -0,0 +1,132 @@
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Any
+
+from .ignore import IgnoreRule, IgnoreMatcher, has_glob
+from .models import CallTree
+
+class AnalysisFilter:
+    """분석 범위를 좁히는 포함/제외 조건
+    
+    경로와 언어 조건은 스캔 단계(stat/파싱 전)에서, 함수 이름 조건은 AST 추출
+    단계에서, 최소 팬아웃은 출력 단계에서 적용한다. 경로 패턴은 프로젝트 루트
+    기준 gitignore 형식 glob이며 `/`가 없는 패턴은 파일/디렉터리 이름과 비교한다.
+    디렉터리와 일치하는 포함 패턴은 그 하위 전체를 포함한다.
+    """
+    
+    def __init__(self, include_paths: Iterable[str] = (), exclude_paths: Iterable[str] = (),
+                 languages: Iterable[str] = (), include_functions: Iterable[str] = (),
+                 exclude_functions: Iterable[str] = (), min_fan_out: int = 0):
+        self.include_rules = [IgnoreRule(pattern) for pattern in include_paths if pattern]
+        self.exclude_matcher = IgnoreMatcher([pattern for pattern in exclude_paths if pattern])
+        self.languages = frozenset(languages)
+        self.include_functions = _compile_any(include_functions)
+        self.exclude_functions = _compile_any(exclude_functions)
+        self.min_fan_out = min_fan_out or 0
+        
+        # 포함 패턴의 고정 경로 접두사 (이 접두사와 무관한 디렉터리는 내려가지 않음)
+        self._include_prefixes = [
+            _literal_prefix(rule.pattern.strip("/")) if rule.anchored else None
+            for rule in self.include_rules
+        ]
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "AnalysisFilter":
+        """ANALYSIS_CONFIG에서 필터 생성"""
+        return cls(
+            include_paths=config.get("include_paths", ()),
+            exclude_paths=config.get("exclude_paths", ()),
+            languages=config.get("languages", ()),
+            include_functions=config.get("include_functions", ()),
+            exclude_functions=config.get("exclude_functions", ()),
+            min_fan_out=config.get("min_fan_out", 0)
+        )
+    
+    def __bool__(self) -> bool:
+        return bool(self.include_rules or self.exclude_matcher or self.languages or
+                    self.include_functions or self.exclude_functions or self.min_fan_out)
+    
+    @property
+    def has_output_filters(self) -> bool:
+        """출력 단계에서 적용할 조건이 있는지 확인"""
+        return bool(self.min_fan_out or self.include_functions or self.exclude_functions)
+    
+    def allows_language(self, language: Optional[str]) -> bool:
+        return not self.languages or language in self.languages
+    
+    def is_excluded(self, name: str, rel_parts: Sequence[str], is_dir: bool) -> bool:
+        """제외 패턴과 일치하는지 확인 (스캔 중 경로 요소 단위)"""
+        return bool(self.exclude_matcher) and self.exclude_matcher.match(name, rel_parts, is_dir) is True
+    
+    def is_included(self, rel_parts: Sequence[str], is_dir: bool) -> bool:
+        """포함 패턴과 일치하는지 확인 (포함 패턴이 없으면 항상 True)"""
+        if not self.include_rules:
+            return True
+        rel_path = "/".join(rel_parts)
+        name = rel_parts[-1] if rel_parts else ""
+        return any(rule.matches(name, rel_path, is_dir) for rule in self.include_rules)
+    
+    def may_contain_included(self, rel_parts: Sequence[str]) -> bool:
+        """디렉터리 하위에 포함 패턴과 일치하는 경로가 있을 수 있는지 확인"""
+        for prefix in self._include_prefixes:
+            if prefix is None:
+                return True
+            depth = min(len(prefix), len(rel_parts))
+            if tuple(rel_parts[:depth]) == prefix[:depth]:
+                return True
+        return False
+    
+    def allows_path(self, rel_parts: Sequence[str]) -> bool:
+        """스캔을 거치지 않은 파일 경로(루트 기준 상대 경로 요소)의 포함 여부"""
+        included = not self.include_rules
+        for depth in range(1, len(rel_parts) + 1):
+            parts = rel_parts[:depth]
+            is_dir = depth < len(rel_parts)
+            if self.is_excluded(parts[-1], parts, is_dir):
+                return False
+            included = included or self.is_included(parts, is_dir)
+        return included
+    
+    def allows_function(self, name: str) -> bool:
+        """함수 이름 조건 확인 (포함 정규식 중 하나와 일치하고 제외 정규식과 불일치)"""
+        if self.include_functions is not None and not self.include_functions.search(name):
+            return False
+        if self.exclude_functions is not None and self.exclude_functions.search(name):
+            return False
+        return True
+    
+    def filter_call_tree(self, call_tree: CallTree, root_path: Optional[Path] = None) -> CallTree:
+        """출력 직전에 조건에 맞는 함수만 남긴 호출 트리 반환
+        
+        root_path가 주어지면 경로 조건도 다시 확인한다 (저장된 결과를 다시 출력하는 경우).
+        """
+        result = CallTree()
+        for func_info in call_tree.functions.values():
+            if not self.allows_function(func_info.name):
+                continue
+            if self.min_fan_out and len(func_info.get_callee_names()) < self.min_fan_out:
+                continue
+            if root_path is not None and (self.include_rules or self.exclude_matcher):
+                try:
+                    rel_parts = func_info.file_path.relative_to(root_path).parts
+                except ValueError:
+                    continue
+                if not self.allows_path(rel_parts):
+                    continue
+            result.add_function(func_info)
+        return result
+
+def _compile_any(patterns: Iterable[str]) -> Optional["re.Pattern"]:
+    patterns = [pattern for pattern in patterns if pattern]
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+def _literal_prefix(pattern: str) -> tuple:
+    """glob 문자가 나오기 전까지의 경로 요소"""
+    prefix = []
+    for part in pattern.split("/"):
+        if has_glob(part):
+            break
+        prefix.append(part)
+    return tuple(prefix)
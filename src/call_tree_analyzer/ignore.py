@@ -0,0 +1,223 @@
+import re
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Iterable
+
+logger = logging.getLogger(__name__)
+
+# glob 특수 문자와 이스케이프 문자
+GLOB_CHARS = frozenset("*?[\\")
+
+def has_glob(pattern: str) -> bool:
+    """패턴에 glob 특수 문자나 이스케이프가 있는지 확인 (없으면 문자열 그대로 비교 가능)"""
+    return any(c in GLOB_CHARS for c in pattern)
+
+def glob_to_regex(pattern: str) -> str:
+    """gitignore 스타일 glob 패턴을 정규식 문자열로 변환 (`/` 구분)"""
+    i, n = 0, len(pattern)
+    parts = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern[i:i + 2] == "**":
+                # "**/" -> 0개 이상의 디렉터리, "/**" 또는 끝의 "**" -> 모든 하위 경로
+                if pattern[i + 2:i + 3] == "/":
+                    parts.append("(?:.*/)?")
+                    i += 3
+                else:
+                    parts.append(".*")
+                    i += 2
+                continue
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            j = pattern.find("]", i + 1)
+            if j == -1:
+                parts.append(re.escape(c))
+            else:
+                body = pattern[i + 1:j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return "".join(parts)
+
+class IgnoreRule:
+    """컴파일된 단일 무시 규칙"""
+    
+    __slots__ = ("pattern", "negate", "dir_only", "anchored", "literal", "regex")
+    
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.negate = pattern.startswith("!")
+        if self.negate:
+            pattern = pattern[1:]
+        elif pattern.startswith("\\!") or pattern.startswith("\\#"):
+            pattern = pattern[1:]
+        
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        
+        # 중간에 "/"가 있으면 기준 디렉터리에 고정, 없으면 모든 경로 요소와 비교
+        self.anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        
+        self.literal = None if has_glob(pattern) else pattern
+        self.regex = re.compile(glob_to_regex(pattern) + r"\Z", re.DOTALL)
+    
+    def matches(self, name: str, rel_path: str, is_dir: bool) -> bool:
+        """경로 요소(name) 또는 기준 디렉터리 기준 상대 경로(rel_path)가 일치하는지 확인"""
+        if self.dir_only and not is_dir:
+            return False
+        if self.anchored:
+            return self.regex.match(rel_path) is not None
+        if self.literal is not None:
+            return self.literal == name
+        return self.regex.match(name) is not None
+
+class IgnoreMatcher:
+    """하나의 패턴 집합(설정 또는 .gitignore 파일)을 컴파일한 매처
+    
+    부정(`!`) 규칙이 없으면 리터럴 이름은 집합 조회로, 나머지 비고정 glob은
+    하나의 결합 정규식으로 검사하므로 규칙 수와 무관하게 거의 상수 비용이다.
+    """
+    
+    def __init__(self, patterns: Iterable[str], base_parts: Sequence[str] = ()):
+        self.base_parts = tuple(base_parts)
+        self.rules: List[IgnoreRule] = []
+        
+        for line in patterns:
+            line = _strip_pattern(line)
+            if line:
+                self.rules.append(IgnoreRule(line))
+        
+        self.has_negation = any(rule.negate for rule in self.rules)
+        
+        # 빠른 경로용 사전 컴파일 (부정 규칙이 없을 때만 사용)
+        self._names = frozenset(r.literal for r in self.rules
+                                if not r.anchored and not r.dir_only and r.literal is not None)
+        self._dir_names = frozenset(r.literal for r in self.rules
+                                    if not r.anchored and r.dir_only and r.literal is not None)
+        self._name_regex = _combine([r for r in self.rules
+                                     if not r.anchored and not r.dir_only and r.literal is None])
+        self._dir_name_regex = _combine([r for r in self.rules
+                                         if not r.anchored and r.dir_only and r.literal is None])
+        self._anchored = [r for r in self.rules if r.anchored]
+    
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+    
+    def match(self, name: str, rel_parts: Sequence[str], is_dir: bool) -> Optional[bool]:
+        """일치 여부 반환 (True: 무시, False: 명시적 포함, None: 판단 없음)"""
+        rel_path = None
+        if self._anchored or self.has_negation:
+            rel_path = "/".join(rel_parts[len(self.base_parts):])
+        
+        if self.has_negation:
+            # gitignore 규칙: 마지막으로 일치한 규칙이 우선
+            for rule in reversed(self.rules):
+                if rule.matches(name, rel_path, is_dir):
+                    return not rule.negate
+            return None
+        
+        if name in self._names:
+            return True
+        if self._name_regex is not None and self._name_regex.match(name):
+            return True
+        if is_dir:
+            if name in self._dir_names:
+                return True
+            if self._dir_name_regex is not None and self._dir_name_regex.match(name):
+                return True
+        for rule in self._anchored:
+            if rule.matches(name, rel_path, is_dir):
+                return True
+        return None
+    
+    @classmethod
+    def from_file(cls, file_path: Path, base_parts: Sequence[str] = ()) -> Optional["IgnoreMatcher"]:
+        """.gitignore 형식 파일에서 매처 생성"""
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                matcher = cls(f.read().splitlines(), base_parts)
+        except OSError as e:
+            logger.debug(f"무시 파일을 읽을 수 없습니다: {file_path} - {e}")
+            return None
+        return matcher if matcher else None
+
+class IgnoreEngine:
+    """설정 패턴과 디렉터리별 무시 파일(.gitignore, .ignore)을 결합한 무시 엔진
+    
+    스캐너가 디렉터리를 내려갈 때마다 해당 디렉터리의 무시 파일을 한 번만
+    읽어 매처 체인에 추가하고, 각 항목은 자신의 이름(경로 요소)으로만 검사한다.
+    무시된 디렉터리는 하위로 내려가지 않는다.
+    """
+    
+    def __init__(self, patterns: Iterable[str] = (), ignore_files: Iterable[str] = ()):
+        self.base_matcher = IgnoreMatcher(patterns)
+        self.ignore_files = tuple(ignore_files)
+    
+    def root_chain(self) -> Tuple[IgnoreMatcher, ...]:
+        """루트 디렉터리의 매처 체인"""
+        return (self.base_matcher,) if self.base_matcher else ()
+    
+    def enter_directory(self, dir_path: Path, rel_parts: Tuple[str, ...],
+                        chain: Tuple[IgnoreMatcher, ...]) -> Tuple[IgnoreMatcher, ...]:
+        """디렉터리 진입 시 해당 디렉터리의 무시 파일을 읽어 체인 확장"""
+        for file_name in self.ignore_files:
+            ignore_path = dir_path / file_name
+            if ignore_path.is_file():
+                matcher = IgnoreMatcher.from_file(ignore_path, rel_parts)
+                if matcher:
+                    chain = chain + (matcher,)
+        return chain
+    
+    @staticmethod
+    def is_ignored(chain: Tuple[IgnoreMatcher, ...], name: str,
+                   rel_parts: Tuple[str, ...], is_dir: bool) -> bool:
+        """가장 깊은 매처부터 검사하여 첫 판단을 따름"""
+        for matcher in reversed(chain):
+            decision = matcher.match(name, rel_parts, is_dir)
+            if decision is not None:
+                return decision
+        return False
+    
+    def is_path_ignored(self, path: Path, root: Optional[Path] = None) -> bool:
+        """설정 패턴만으로 임의 경로의 각 경로 요소를 검사
+        
+        상대 경로는 그대로, 절대 경로는 root(기본값: 파일이 있는 디렉터리) 기준 상대 경로의
+        요소만 검사하므로 체크아웃 위치의 상위 디렉터리 이름(/home/u/build/proj의 build 등)은
+        무시 패턴과 비교하지 않는다. root 밖의 절대 경로는 파일 이름만 검사한다.
+        """
+        if path.is_absolute():
+            try:
+                path = path.relative_to(root if root is not None else path.parent)
+            except ValueError:
+                path = Path(path.name)
+        parts = path.parts
+        for index, name in enumerate(parts):
+            is_dir = index < len(parts) - 1
+            if self.base_matcher.match(name, parts[:index + 1], is_dir):
+                return True
+        return False
+
+def _strip_pattern(line: str) -> str:
+    """주석/빈 줄 제거 및 이스케이프되지 않은 후행 공백 제거"""
+    if not line or line.startswith("#"):
+        return ""
+    stripped = line.rstrip()
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    return stripped
+
+def _combine(rules: List[IgnoreRule]) -> Optional["re.Pattern"]:
+    if not rules:
+        return None
+    return re.compile("|".join(f"(?:{r.regex.pattern})" for r in rules), re.DOTALL)
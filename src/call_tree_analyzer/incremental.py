@@ -0,0 +1,206 @@
+import subprocess
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Set, Iterable
+from dataclasses import dataclass, field
+
+from .models import CallTree, FunctionInfo
+from .config import get_language_by_extension, should_ignore_path, ANALYSIS_CONFIG
+from .analyzer import CallTreeAnalyzer
+from .diff import CallTreeDiff, diff_functions
+from .filters import AnalysisFilter
+
+logger = logging.getLogger(__name__)
+
+class GitError(RuntimeError):
+    """git 명령 실행 실패"""
+    pass
+
+class GitRepository:
+    """git 배관(plumbing) 명령으로 작업 트리 체크아웃 없이 리비전을 읽는 래퍼"""
+    
+    def __init__(self, path: str):
+        output = self._run_git(Path(path), ["rev-parse", "--show-toplevel"])
+        self.root = Path(output.decode("utf-8").strip()).resolve()
+    
+    @staticmethod
+    def _run_git(cwd: Path, args: List[str], input_data: Optional[bytes] = None) -> bytes:
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(cwd)] + args,
+                input=input_data,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=True
+            )
+        except FileNotFoundError as e:
+            raise GitError(f"git 실행 파일을 찾을 수 없습니다: {e}")
+        except subprocess.CalledProcessError as e:
+            message = e.stderr.decode("utf-8", errors="ignore").strip()
+            raise GitError(f"git {' '.join(args[:2])} 실패: {message}")
+        return result.stdout
+    
+    def run(self, args: List[str], input_data: Optional[bytes] = None) -> bytes:
+        """저장소 루트에서 git 명령 실행"""
+        return self._run_git(self.root, args, input_data)
+    
+    def resolve_commit(self, revision: str) -> str:
+        """리비전을 커밋 해시로 변환"""
+        return self.run(["rev-parse", "--verify", f"{revision}^{{commit}}"]).decode().strip()
+    
+    def resolve_range(self, revision_range: str) -> Tuple[str, str]:
+        """"BASE..HEAD", "BASE...HEAD"(merge-base 기준) 또는 "BASE"(HEAD까지)를 해석"""
+        if "..." in revision_range:
+            base, head = revision_range.split("...", 1)
+            head = self.resolve_commit(head or "HEAD")
+            base = self.run(["merge-base", self.resolve_commit(base or "HEAD"), head]).decode().strip()
+            return base, head
+        
+        if ".." in revision_range:
+            base, head = revision_range.split("..", 1)
+        else:
+            base, head = revision_range, "HEAD"
+        
+        return self.resolve_commit(base or "HEAD"), self.resolve_commit(head or "HEAD")
+    
+    def changed_files(self, base: str, head: str) -> List[Tuple[str, str]]:
+        """두 커밋 사이에 변경된 파일 목록 반환 [(상태, 상대 경로)]"""
+        output = self.run(["diff-tree", "-r", "-z", "--no-renames", "--name-status", base, head])
+        fields = output.split(b"\0")
+        
+        changes = []
+        for i in range(0, len(fields) - 1, 2):
+            status = fields[i].decode("ascii")
+            path = fields[i + 1].decode("utf-8", errors="surrogateescape")
+            changes.append((status[:1], path))
+        
+        return changes
+    
+    def read_blobs(self, revision: str, paths: Iterable[str]) -> Dict[str, Optional[bytes]]:
+        """cat-file --batch로 한 번에 여러 파일 내용 읽기 (없는 파일은 None)"""
+        paths = list(paths)
+        if not paths:
+            return {}
+        
+        request = "".join(f"{revision}:{path}\n" for path in paths).encode("utf-8", errors="surrogateescape")
+        output = self.run(["cat-file", "--batch"], request)
+        
+        blobs: Dict[str, Optional[bytes]] = {}
+        offset = 0
+        for path in paths:
+            header_end = output.index(b"\n", offset)
+            header = output[offset:header_end].split()
+            offset = header_end + 1
+            
+            if len(header) < 3 or header[-1] == b"missing" or header[1] != b"blob":
+                blobs[path] = None
+                if len(header) >= 3 and header[-1] != b"missing":
+                    offset += int(header[2]) + 1
+                continue
+            
+            size = int(header[2])
+            blobs[path] = output[offset:offset + size]
+            offset += size + 1  # 내용 뒤의 개행
+        
+        return blobs
+
+@dataclass
+class IncrementalResult:
+    """두 리비전 사이의 호출 그래프 변경 결과"""
+    base_revision: str
+    head_revision: str
+    changed_files: List[str] = field(default_factory=list)
+    diff: CallTreeDiff = field(default_factory=CallTreeDiff)
+    head_tree: Optional[CallTree] = None  # 기준 스냅샷이 주어진 경우 갱신된 전체 트리
+    
+    def to_dict(self) -> Dict[str, object]:
+        """JSON 직렬화 가능한 형태로 변환"""
+        data = {
+            "base": self.base_revision,
+            "head": self.head_revision,
+            "changed_files": self.changed_files
+        }
+        data.update(self.diff.to_dict())
+        return data
+    
+    def format_text(self) -> str:
+        """사람이 읽기 쉬운 텍스트로 포맷"""
+        header = (f"Revisions: {self.base_revision[:12]}..{self.head_revision[:12]}\n"
+                  f"Changed files: {len(self.changed_files)}\n\n")
+        return header + self.diff.format_text()
+
+class IncrementalAnalyzer:
+    """git 리비전 범위에서 변경된 파일만 다시 분석하는 증분 분석기"""
+    
+    def __init__(self, repo_path: str, analyzer: Optional[CallTreeAnalyzer] = None):
+        self.repo = GitRepository(repo_path)
+        self.analyzer = analyzer or CallTreeAnalyzer(max_workers=1)
+        self.analysis_filter = AnalysisFilter.from_config(ANALYSIS_CONFIG)
+    
+    def analyze_range(self, revision_range: str,
+                      base_snapshot: Optional[CallTree] = None) -> IncrementalResult:
+        """리비전 범위의 변경 파일을 분석하여 추가/삭제된 함수와 호출 관계 반환
+        
+        base_snapshot이 주어지면 기준 리비전의 함수 정보는 스냅샷에서 가져오고
+        (기준 리비전 파일은 파싱하지 않음), 갱신된 전체 트리를 head_tree로 반환한다.
+        스냅샷의 파일 경로는 저장소 루트 기준 절대 경로여야 한다.
+        """
+        base, head = self.repo.resolve_range(revision_range)
+        result = IncrementalResult(base_revision=base, head_revision=head)
+        
+        changes = [
+            (status, path) for status, path in self.repo.changed_files(base, head)
+            if self._is_analyzable(path)
+        ]
+        result.changed_files = [path for _, path in changes]
+        logger.info(f"변경된 소스 파일: {len(changes)}개 ({base[:12]}..{head[:12]})")
+        
+        head_paths = [path for status, path in changes if status != "D"]
+        head_functions = self._analyze_revision(head, head_paths)
+        
+        changed_abs = {self.repo.root / path for path in result.changed_files}
+        if base_snapshot is not None:
+            base_functions = [
+                func for func in base_snapshot.functions.values()
+                if func.file_path in changed_abs
+            ]
+            result.head_tree = self._apply_to_snapshot(base_snapshot, changed_abs, head_functions)
+        else:
+            base_paths = [path for status, path in changes if status != "A"]
+            base_functions = self._analyze_revision(base, base_paths)
+        
+        result.diff = diff_functions(base_functions, head_functions)
+        return result
+    
+    def _is_analyzable(self, rel_path: str) -> bool:
+        path = Path(rel_path)
+        language = get_language_by_extension(path.suffix)
+        return (bool(language) and self.analysis_filter.allows_language(language) and
+                self.analysis_filter.allows_path(path.parts) and not should_ignore_path(path))
+    
+    def _analyze_revision(self, revision: str, rel_paths: List[str]) -> List[FunctionInfo]:
+        """리비전의 파일 내용을 git에서 직접 읽어 분석"""
+        functions = []
+        max_size = ANALYSIS_CONFIG["max_file_size_mb"] * 1024 * 1024
+        
+        for rel_path, source_code in self.repo.read_blobs(revision, rel_paths).items():
+            if source_code is None or len(source_code) > max_size:
+                continue
+            
+            result = self.analyzer.analyze_source(self.repo.root / rel_path, source_code)
+            if result.file_info.errors:
+                self.analyzer.error_handler.record_file_errors(result.file_info)
+            functions.extend(result.functions)
+        
+        return functions
+    
+    @staticmethod
+    def _apply_to_snapshot(snapshot: CallTree, changed_paths: Set[Path],
+                           head_functions: List[FunctionInfo]) -> CallTree:
+        head_tree = CallTree()
+        for func in snapshot.functions.values():
+            if func.file_path not in changed_paths:
+                head_tree.add_function(func)
+        for func in head_functions:
+            head_tree.add_function(func)
+        return head_tree
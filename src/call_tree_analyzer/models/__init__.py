@@ -1,12 +1,17 @@
-from .function import FunctionInfo, FunctionCall
+from .function import FunctionInfo, FunctionCall, FunctionMetrics
 from .call_tree import CallTree, CallTreeBuilder
-from .project import ProjectInfo, FileInfo
+from .project import ProjectInfo, FileInfo, FileResult
+from .rollup import RollupGraph, RollupIndex
 
 __all__ = [
     'FunctionInfo',
     'FunctionCall', 
+    'FunctionMetrics',
     'CallTree',
     'CallTreeBuilder',
     'ProjectInfo',
-    'FileInfo'
+    'FileInfo',
+    'FileResult',
+    'RollupGraph',
+    'RollupIndex'
 ]
\ No newline at end of file
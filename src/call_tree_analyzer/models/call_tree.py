@@ -1,8 +1,14 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 from pathlib import Path
 from .function import FunctionInfo, FunctionCall
 
+# 호출 관계 저장 방식
+# calls: 호출 위치마다 FunctionCall 하나
+# aggregated: (호출자, 피호출 함수, 호출 종류)마다 하나, 호출 횟수와 모든 호출 위치 기록
+# counts: (호출자, 피호출 함수, 호출 종류)마다 하나, 호출 횟수와 첫 호출 위치만 기록
+EDGE_MODES = ("calls", "aggregated", "counts")
+
 @dataclass
 class CallTree:
     """호출 트리 전체 구조"""
@@ -31,6 +37,13 @@ class CallTree:
         func_info = self.get_function(function_name)
         return func_info.calls if func_info else []
     
+    def sort_functions(self):
+        """함수 순서를 (파일 경로, 이름) 순으로 정렬 (병렬 분석/샤드 병합 결과를 결정적으로 만듦)"""
+        self.functions = dict(sorted(
+            self.functions.items(),
+            key=lambda item: (str(item[1].file_path), item[1].name)
+        ))
+    
     def get_all_functions(self) -> List[str]:
         """모든 함수 이름 반환"""
         return list(self.functions.keys())
@@ -52,8 +65,14 @@ class CallTree:
 class CallTreeBuilder:
     """호출 트리 빌더 클래스"""
     
-    def __init__(self):
+    def __init__(self, edge_mode: str = "calls"):
+        if edge_mode not in EDGE_MODES:
+            raise ValueError(f"지원하지 않는 호출 관계 모드: {edge_mode}")
         self.call_tree = CallTree()
+        self.edge_mode = edge_mode
+        self._edges: Dict[Tuple[str, str, str, bool], FunctionCall] = {}
+        # 이름만으로 호출된 내장/외부 호출 (같은 파일에 정의된 함수면 내부 호출로 재분류)
+        self._unqualified_calls: List[Tuple[str, FunctionCall]] = []
     
     def add_function_definition(self, name: str, file_path: Path, 
                              line: int, column: Optional[int] = None) -> FunctionInfo:
@@ -67,13 +86,80 @@ class CallTreeBuilder:
         self.call_tree.add_function(func_info)
         return func_info
     
+    def add_functions(self, functions: List[FunctionInfo]):
+        """다른 빌더(예: 파일별 분석)에서 만든 함수들 병합"""
+        for func_info in functions:
+            self.call_tree.add_function(func_info)
+    
     def add_function_call(self, caller_full_name: str, callee_name: str, 
-                         line: int, column: Optional[int] = None):
-        """함수 호출 추가"""
+                         line: int, column: Optional[int] = None, kind: str = "internal",
+                         unqualified: bool = False):
+        """함수 호출 추가
+        
+        unqualified는 obj.method()가 아니라 이름만으로 호출했는지 여부이다.
+        """
         caller = self.call_tree.get_function(caller_full_name)
-        if caller:
-            call = FunctionCall(name=callee_name, line=line, column=column)
+        if not caller:
+            return
+        
+        local_candidate = unqualified and kind != "internal"
+        
+        if self.edge_mode == "calls":
+            call = FunctionCall(name=callee_name, line=line, column=column, kind=kind)
             caller.add_call(call)
+            if local_candidate:
+                self._unqualified_calls.append((caller_full_name, call))
+            return
+        
+        # 집계 모드: 같은 호출 관계는 기존 객체의 횟수만 증가
+        # (재분류 대상인 이름만으로 한 호출은 obj.method() 호출과 섞이지 않도록 따로 집계)
+        key = (caller_full_name, callee_name, kind, local_candidate)
+        call = self._edges.get(key)
+        if call is not None:
+            call.add_site(line, column)
+            return
+        
+        sites = [(line, column)] if self.edge_mode == "aggregated" else None
+        call = FunctionCall(name=callee_name, line=line, column=column, kind=kind, sites=sites)
+        self._edges[key] = call
+        caller.add_call(call)
+        if local_candidate:
+            self._unqualified_calls.append((caller_full_name, call))
+    
+    def localize_calls(self, local_names: Set[str]):
+        """이름만으로 호출한 내장/외부 호출 중 local_names에 있는 것을 내부 호출로 재분류
+        
+        os.path.join()이나 ",".join() 처럼 수신 객체가 있는 호출은 이름이 같아도 바꾸지 않는다.
+        집계 모드에서는 재분류된 호출을 같은 호출자의 기존 내부 호출 관계와 합친다.
+        """
+        for caller_full_name, call in self._unqualified_calls:
+            if call.name not in local_names:
+                continue
+            
+            if self.edge_mode != "calls":
+                del self._edges[(caller_full_name, call.name, call.kind, True)]
+                key = (caller_full_name, call.name, "internal", False)
+                existing = self._edges.get(key)
+                if existing is not None:
+                    call = self._merge_edges(self.call_tree.functions[caller_full_name], existing, call)
+                self._edges[key] = call
+            
+            call.kind = "internal"
+        self._unqualified_calls = []
+    
+    @staticmethod
+    def _merge_edges(caller: FunctionInfo, first: FunctionCall, second: FunctionCall) -> FunctionCall:
+        """같은 호출 관계의 두 호출을 호출 목록에서 먼저 나온 쪽으로 합치고 남은 쪽 반환"""
+        for call in caller.calls:
+            if call is second:
+                first, second = second, first
+                break
+            if call is first:
+                break
+        
+        first.merge(second)
+        caller.calls = [call for call in caller.calls if call is not second]
+        return first
     
     def build(self) -> CallTree:
         """완성된 호출 트리 반환"""
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from pathlib import Path
 
 @dataclass
@@ -8,10 +8,43 @@ class FunctionCall:
     name: str
     line: int
     column: Optional[int] = None
+    kind: str = "internal"  # internal, external(라이브러리), builtin(언어 내장)
+    count: int = 1  # 이 호출 관계로 합쳐진 호출 위치 수 (집계 모드)
+    sites: Optional[List[Tuple[int, Optional[int]]]] = None  # 집계 모드의 (line, column) 목록
+    
+    def add_site(self, line: int, column: Optional[int] = None):
+        """같은 호출 대상의 호출 위치 추가 (집계 모드)"""
+        self.count += 1
+        if self.sites is not None:
+            self.sites.append((line, column))
+    
+    def merge(self, other: "FunctionCall"):
+        """따로 집계된 같은 호출 관계를 합침 (집계 모드, 호출 위치는 위치 순으로 정렬)"""
+        self.count += other.count
+        if self.sites is not None and other.sites is not None:
+            self.sites = sorted(self.sites + other.sites)
     
     def __str__(self) -> str:
+        if self.count > 1:
+            return f"{self.name} (line {self.line}, {self.count} calls)"
         return f"{self.name} (line {self.line})"
 
+@dataclass
+class FunctionMetrics:
+    """함수 크기/복잡도 지표 (함수 정의를 찾는 AST 순회에서 함께 계산)"""
+    end_line: int
+    start_byte: int
+    end_byte: int
+    lines: int = 0  # 빈 줄을 제외한 줄 수
+    branches: int = 0  # 분기 수 (조건문, 반복문, case, 예외 처리, 논리 연산자)
+    max_nesting: int = 0  # 제어 구조의 최대 중첩 깊이
+    parameters: int = 0  # 매개변수 수
+    
+    @property
+    def complexity(self) -> int:
+        """순환 복잡도 (분기 수 + 1)"""
+        return self.branches + 1
+
 @dataclass
 class FunctionInfo:
     """함수 정의 정보"""
@@ -20,6 +53,7 @@ class FunctionInfo:
     line: int
     column: Optional[int] = None
     calls: List[FunctionCall] = None
+    metrics: Optional[FunctionMetrics] = None  # function_metrics 설정이 켜져 있을 때만 계산
     
     def __post_init__(self):
         if self.calls is None:
@@ -30,10 +64,19 @@ class FunctionInfo:
         """파일 경로를 포함한 전체 함수 이름"""
         return f"{self.file_path}::{self.name}"
     
+    def relocated(self, file_path: Path) -> "FunctionInfo":
+        """같은 함수를 다른 파일 경로로 복제 (호출 정보 객체는 공유)"""
+        return FunctionInfo(name=self.name, file_path=file_path, line=self.line,
+                            column=self.column, calls=list(self.calls), metrics=self.metrics)
+    
     def add_call(self, call: FunctionCall):
         """함수 호출 추가"""
         self.calls.append(call)
     
     def get_call_count(self) -> int:
-        """호출 횟수 반환"""
-        return len(self.calls)
\ No newline at end of file
+        """호출 횟수(호출 위치 수) 반환"""
+        return sum(call.count for call in self.calls)
+    
+    def get_callee_names(self) -> Set[str]:
+        """호출하는 서로 다른 함수 이름 집합 (팬아웃)"""
+        return {call.name for call in self.calls}
\ No newline at end of file
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple, Optional
 from pathlib import Path
+from .function import FunctionInfo
+from .rollup import RollupIndex
 
 @dataclass
 class FileInfo:
@@ -9,17 +11,39 @@ class FileInfo:
     language: str
     line_count: int = 0
     function_count: int = 0
+    errors: List[Tuple[str, str]] = field(default_factory=list)  # (category, message)
+    duplicate_of: Optional[Path] = None  # 중복 파일을 합쳐서 보고하는 경우 대표 파일 경로
+    analysis_time: float = 0.0  # 파일 분석에 걸린 시간 (초)
+    streamed: bool = False  # 대용량 파일을 mmap과 읽기 콜백으로 분석했는지 여부
+    peak_rss_mb: Optional[float] = None  # 스트리밍 분석 직후의 프로세스 최대 상주 메모리 (MB)
+    prefiltered: bool = False  # 바이트 사전 필터가 함수 정의가 없다고 판단한 파일인지 여부
+    truncated: Optional[str] = None  # 예산을 넘어 일부만 분석한 경우 그 사유 (parse_timeout, extract_timeout, max_nodes, deadline)
+    skipped: bool = False  # 전체 분석 제한 시간(deadline)이 지나 분석하지 않은 파일인지 여부
     
     @property
     def extension(self) -> str:
         return self.path.suffix
 
+@dataclass
+class FileResult:
+    """파일 하나의 분석 결과 (파일 정보와 추출된 함수들)"""
+    file_info: FileInfo
+    functions: List[FunctionInfo] = field(default_factory=list)
+    fragments: Optional[Dict[str, str]] = None  # 워커에서 미리 인코딩한 출력 조각 (full_name -> 텍스트)
+
 @dataclass  
 class ProjectInfo:
     """프로젝트 전체 정보"""
     root_path: Path
     files: Dict[Path, FileInfo] = field(default_factory=dict)
     supported_languages: Set[str] = field(default_factory=set)
+    rollup: RollupIndex = None  # 병합 중에 유지하는 파일/디렉터리/언어 단위 호출 집계
+    duplicate_files: Dict[Path, Path] = field(default_factory=dict)  # 합쳐진 중복 파일 -> 대표 파일
+    output_fragments: Dict[str, str] = field(default_factory=dict)  # 병합된 함수별 출력 조각 (full_name -> 텍스트)
+    
+    def __post_init__(self):
+        if self.rollup is None:
+            self.rollup = RollupIndex(self.root_path)
     
     def add_file(self, file_info: FileInfo):
         """파일 정보 추가"""
@@ -35,6 +59,15 @@ class ProjectInfo:
         """전체 라인 수 반환"""
         return sum(info.line_count for info in self.files.values())
     
+    def get_skipped_files(self) -> List[Path]:
+        """제한 시간이 지나 분석하지 않은 파일 목록"""
+        return sorted((info.path for info in self.files.values() if info.skipped), key=str)
+    
+    def get_truncated_files(self) -> Dict[Path, str]:
+        """예산을 넘어 일부만 분석한 파일과 그 사유"""
+        return {info.path: info.truncated for info in sorted(self.files.values(), key=lambda info: str(info.path))
+                if info.truncated}
+    
     def get_total_function_count(self) -> int:
         """전체 함수 수 반환"""
         return sum(info.function_count for info in self.files.values())
\ No newline at end of file
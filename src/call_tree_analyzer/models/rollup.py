@@ -0,0 +1,158 @@
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Set, Tuple, Optional, Iterable, Callable, Union
+
+from .function import FunctionInfo
+
+ROLLUP_GRANULARITIES = ("file", "directory", "language")
+
+@dataclass
+class RollupGraph:
+    """파일/디렉터리/언어 단위로 집계한 의존성 그래프"""
+    granularity: str
+    nodes: Dict[str, int] = field(default_factory=dict)  # 노드 -> 함수 수
+    edges: Dict[Tuple[str, str], float] = field(default_factory=dict)  # (호출 노드, 피호출 노드) -> 호출 위치 수 (대상이 여럿이면 나눈 값)
+    unresolved_calls: int = 0  # 프로젝트 안에서 정의를 찾지 못한 내부 호출 위치 수
+    
+    def get_statistics(self) -> Dict[str, float]:
+        """그래프 통계 (자기 자신으로의 호출은 노드 내부 호출로 따로 집계)"""
+        fan_in = Counter()
+        fan_out = Counter()
+        internal_calls = 0
+        cross_calls = 0
+        
+        for (source, target), count in self.edges.items():
+            if source == target:
+                internal_calls += count
+                continue
+            cross_calls += count
+            fan_out[source] += 1
+            fan_in[target] += 1
+        
+        cross_edges = sum(fan_out.values())
+        return {
+            "nodes": len(self.nodes),
+            "edges": cross_edges,
+            "internal_calls": _round_count(internal_calls),
+            "cross_calls": _round_count(cross_calls),
+            "unresolved_calls": self.unresolved_calls,
+            "max_fan_in": max(fan_in.values()) if fan_in else 0,
+            "max_fan_out": max(fan_out.values()) if fan_out else 0,
+            "avg_fan_out": cross_edges / len(self.nodes) if self.nodes else 0
+        }
+    
+    def to_dict(self) -> Dict[str, object]:
+        """JSON 직렬화 가능한 형태로 변환"""
+        return {
+            "granularity": self.granularity,
+            "nodes": {name: {"functions": count} for name, count in sorted(self.nodes.items())},
+            "edges": [
+                {"from": source, "to": target, "count": _round_count(count)}
+                for (source, target), count in sorted(self.edges.items())
+            ],
+            "statistics": self.get_statistics()
+        }
+    
+    def format_text(self) -> str:
+        """사람이 읽기 쉬운 텍스트로 포맷"""
+        lines = [f"=== {self.granularity.capitalize()} Dependencies ==="]
+        for key, value in self.get_statistics().items():
+            lines.append(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
+        
+        lines.append("")
+        for (source, target), count in sorted(self.edges.items(), key=lambda item: (-item[1], item[0])):
+            if source != target:
+                lines.append(f"  {source} -> {target} ({_round_count(count)})")
+        
+        return "\n".join(lines) + "\n"
+
+def _round_count(value: float) -> Union[int, float]:
+    """나눠 더한 호출 수의 부동소수점 오차 제거 (정수가 되면 int로 출력)"""
+    value = round(value, 6)
+    return int(value) if value == int(value) else value
+
+class RollupIndex:
+    """결과 병합 중에 유지하는 파일 단위 호출 집계
+    
+    파일마다 (피호출 이름 -> 호출 위치 수)와 각 이름을 정의한 파일만 보관하므로
+    함수 단위 그래프 없이 파일/디렉터리/언어 그래프를 만들 수 있다. 호출 대상은
+    이름으로 찾으며, 호출한 파일에 같은 이름이 정의되어 있으면 그 파일을, 아니면
+    그 이름을 정의한 모든 파일을 대상으로 보고 호출 위치 수를 대상 수로 나눈다
+    (중심성 그래프와 같은 규칙). 내부(internal) 호출만 집계한다.
+    """
+    
+    def __init__(self, root_path: Optional[Path] = None):
+        self.root_path = Path(root_path) if root_path is not None else None
+        self._languages: Dict[Path, str] = {}
+        self._function_counts: Dict[Path, int] = defaultdict(int)
+        self._definitions: Dict[str, Set[Path]] = defaultdict(set)
+        self._file_calls: Dict[Path, Counter] = defaultdict(Counter)
+    
+    def add_functions(self, file_path: Path, language: str, functions: Iterable[FunctionInfo]):
+        """한 파일의 분석 결과 반영"""
+        self._languages[file_path] = language
+        calls = self._file_calls[file_path]
+        
+        for func in functions:
+            self._function_counts[file_path] += 1
+            self._definitions[func.name].add(file_path)
+            for call in func.calls:
+                if call.kind == "internal":
+                    calls[call.name] += call.count
+    
+    def file_graph(self) -> RollupGraph:
+        """파일 -> 파일 의존성 그래프"""
+        return self.graph("file")
+    
+    def graph(self, granularity: str, directory_depth: int = 1) -> RollupGraph:
+        """지정한 단위(file, directory, language)의 의존성 그래프 생성"""
+        node_key = self._node_key_function(granularity, directory_depth)
+        keys = {path: node_key(path) for path in self._languages}
+        result = RollupGraph(granularity=granularity)
+        
+        nodes = defaultdict(int)
+        for path, key in keys.items():
+            nodes[key] += self._function_counts.get(path, 0)
+        result.nodes = dict(nodes)
+        
+        edges = Counter()
+        for caller_path, calls in self._file_calls.items():
+            source = keys[caller_path]
+            for name, count in calls.items():
+                targets = self._definitions.get(name)
+                if not targets:
+                    result.unresolved_calls += count
+                elif caller_path in targets:
+                    edges[(source, source)] += count
+                else:
+                    share = count / len(targets)
+                    for target_path in targets:
+                        edges[(source, keys[target_path])] += share
+        result.edges = dict(edges)
+        
+        return result
+    
+    def graphs(self, granularities: Iterable[str], directory_depth: int = 1) -> Dict[str, RollupGraph]:
+        """여러 단위의 그래프를 한 번에 생성"""
+        return {granularity: self.graph(granularity, directory_depth) for granularity in granularities}
+    
+    def _node_key_function(self, granularity: str, directory_depth: int) -> Callable[[Path], str]:
+        if granularity == "file":
+            return self._relative_path
+        if granularity == "directory":
+            def directory_key(path: Path) -> str:
+                parts = Path(self._relative_path(path)).parent.parts[:max(1, directory_depth)]
+                return "/".join(parts) if parts else "."
+            return directory_key
+        if granularity == "language":
+            return lambda path: self._languages.get(path) or "unknown"
+        raise ValueError(f"지원하지 않는 집계 단위: {granularity}")
+    
+    def _relative_path(self, path: Path) -> str:
+        if self.root_path is not None:
+            try:
+                return path.relative_to(self.root_path).as_posix()
+            except ValueError:
+                pass
+        return path.as_posix()
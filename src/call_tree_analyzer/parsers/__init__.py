@@ -1,32 +1,81 @@
+import importlib
+import logging
+from typing import Dict, List, Union, Iterable, Optional
+
 from .base import BaseParser
-from .c_parser import CParser
-from .python_parser import PythonParser
-from .javascript_parser import JavaScriptParser
+from ..config import LANGUAGE_CONFIG
+
+logger = logging.getLogger(__name__)
 
 # 언어별 파서 매핑
-PARSER_CLASSES = {
-    "c": CParser,
-    "python": PythonParser,
-    "javascript": JavaScriptParser,
+# "모듈:클래스" 문자열은 해당 언어를 처음 사용할 때 import한다 (tree_sitter 로딩 지연)
+PARSER_CLASSES: Dict[str, Union[str, type]] = {
+    "c": ".c_parser:CParser",
+    "python": ".python_parser:PythonParser",
+    "javascript": ".javascript_parser:JavaScriptParser",
 }
 
-def get_parser(language: str) -> BaseParser:
-    """언어에 맞는 파서 인스턴스 반환"""
-    parser_class = PARSER_CLASSES.get(language)
-    if not parser_class:
+# 기존 `from .parsers import CParser` 형태의 import 호환용
+_LAZY_EXPORTS = {
+    "CParser": "c",
+    "PythonParser": "python",
+    "JavaScriptParser": "javascript",
+}
+
+def _resolve_parser_class(language: str) -> type:
+    """등록된 파서 클래스를 (필요하면 import하여) 반환"""
+    entry = PARSER_CLASSES.get(language)
+    if entry is None:
         raise ValueError(f"지원하지 않는 언어: {language}")
     
+    if isinstance(entry, str):
+        module_name, _, class_name = entry.partition(":")
+        module = importlib.import_module(module_name, __name__)
+        entry = getattr(module, class_name)
+        PARSER_CLASSES[language] = entry
+        logger.debug(f"파서 로드: {language}")
+    
+    return entry
+
+def get_parser(language: str) -> BaseParser:
+    """언어에 맞는 파서 인스턴스 반환"""
+    parser_class = _resolve_parser_class(language)
     return parser_class()
 
 def get_supported_languages() -> list[str]:
     """지원하는 언어 목록 반환"""
     return list(PARSER_CLASSES.keys())
 
+def get_loaded_languages() -> List[str]:
+    """파서 모듈이 실제로 로드된 언어 목록 반환"""
+    return [language for language, entry in PARSER_CLASSES.items() if not isinstance(entry, str)]
+
+def register_parser(language: str, parser_class: Union[str, type], 
+                    extensions: Optional[Iterable[str]] = None, **config):
+    """새 언어 파서 등록
+    
+    parser_class는 BaseParser 하위 클래스 또는 지연 로딩용 "패키지.모듈:클래스" 문자열이다.
+    extensions를 주면 LANGUAGE_CONFIG에 언어 설정도 추가한다 (config는 추가 설정 항목).
+    """
+    PARSER_CLASSES[language] = parser_class
+    
+    if extensions is not None:
+        language_config = LANGUAGE_CONFIG.setdefault(language, {"parser_name": language})
+        language_config["extensions"] = [ext.lower() for ext in extensions]
+        language_config.update(config)
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        return _resolve_parser_class(_LAZY_EXPORTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'BaseParser',
     'CParser', 
     'PythonParser',
     'JavaScriptParser',
     'get_parser',
-    'get_supported_languages'
-]
\ No newline at end of file
+    'get_supported_languages',
+    'get_loaded_languages',
+    'register_parser'
+]
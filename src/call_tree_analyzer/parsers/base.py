@@ -1,18 +1,49 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Tuple, Any, TYPE_CHECKING
 from pathlib import Path
-from tree_sitter import Node, Tree
 
-from ..models import FunctionInfo, FunctionCall
+from ..models import FunctionInfo, FunctionCall, FunctionMetrics
 from ..config import LANGUAGE_CONFIG
+from ..catalogs import load_catalog, LITERAL_RECEIVER
+
+if TYPE_CHECKING:
+    # tree_sitter는 import 비용이 크므로 실제 파서 모듈에서만 로드
+    from tree_sitter import Node, Tree
+
+logger = logging.getLogger(__name__)
 
 class BaseParser(ABC):
     """언어별 파서의 기본 클래스"""
     
+    # obj.method() 형태의 멤버 접근 노드 타입과 수신 객체 필드 (언어별로 지정)
+    member_node_types: frozenset = frozenset()
+    member_object_field: str = "object"
+    receiver_name_types: frozenset = frozenset({"identifier"})
+    literal_node_types: frozenset = frozenset()
+    # 매개변수 목록의 자식 중 매개변수가 아닌 노드 타입
+    non_parameter_types: frozenset = frozenset({"comment"})
+    
     def __init__(self, language: str):
         self.language = language
         self.config = LANGUAGE_CONFIG.get(language, {})
+        self.catalog = load_catalog(language)
         self.tree_sitter_parser = None
+        # 읽기 콜백을 호출하는 동안에는 다른 스레드가 같은 파서에 들어올 수 있으므로 파싱을 직렬화
+        self._parse_lock = threading.Lock()
+        
+        pattern = self.config.get("prefilter_pattern")
+        self.prefilter = re.compile(pattern) if pattern else None
+        
+        # 함수 지표 계산에 사용하는 노드 타입
+        self.branch_node_types = frozenset(self.config.get("branch_node_types", ()))
+        self.nesting_node_types = frozenset(self.config.get("nesting_node_types", ()))
+        self.logical_operators = frozenset(self.config.get("logical_operators", ()))
     
     @abstractmethod
     def extract_function_name(self, node: Node, source_code: bytes) -> Optional[str]:
@@ -34,6 +65,44 @@ class BaseParser(ABC):
         """함수 호출 노드인지 확인"""
         pass
     
+    def extract_call_receiver(self, node: Node, source_code: bytes) -> Optional[str]:
+        """obj.method() 호출에서 수신 객체 경로의 최상위 이름 추출
+        
+        이름만으로 호출하면 None, 수신 객체가 리터럴이면 LITERAL_RECEIVER,
+        최상위 이름을 알 수 없는 식(다른 호출의 결과 등)이면 빈 문자열을 반환한다.
+        예: os.path.join() -> "os", ",".join() -> LITERAL_RECEIVER
+        """
+        func_node = node.child_by_field_name("function")
+        if func_node is None or func_node.type not in self.member_node_types:
+            return None
+        
+        current = func_node.child_by_field_name(self.member_object_field)
+        while current is not None:
+            if current.type in self.member_node_types:
+                current = current.child_by_field_name(self.member_object_field)
+            elif current.type in self.receiver_name_types:
+                return self.get_node_text(source_code, current)
+            elif current.type in self.literal_node_types:
+                return LITERAL_RECEIVER
+            elif self.is_call_node(current):
+                # super().method() 처럼 자기 자신을 가리키는 호출만 따라감
+                callee = current.child_by_field_name("function")
+                if (callee is not None and callee.type in self.receiver_name_types and
+                        self.get_node_text(source_code, callee) in self.catalog.self_names):
+                    return self.get_node_text(source_code, callee)
+                break
+            else:
+                break
+        
+        return ""
+    
+    def classify_call(self, call_name: str, receiver: Optional[str]) -> str:
+        """호출을 internal/external/builtin으로 분류 (언어별 카탈로그 기준)
+        
+        receiver는 extract_call_receiver()의 결과이다.
+        """
+        return self.catalog.classify(call_name, receiver)
+    
     def get_node_text(self, source_code: bytes, node: Node) -> str:
         """노드의 텍스트 추출"""
         return source_code[node.start_byte:node.end_byte].decode("utf-8")
@@ -42,16 +111,101 @@ class BaseParser(ABC):
         """노드의 위치 (line, column) 반환"""
         return node.start_point[0] + 1, node.start_point[1]
     
+    def parse_source(self, source_code: bytes) -> Tree:
+        """메모리 상의 소스 코드 파싱 (실패 시 예외 발생)"""
+        with self._parse_lock:
+            return self.tree_sitter_parser.parse(source_code)
+    
+    def parse_buffer(self, buffer, chunk_size: int = 256 * 1024) -> Tree:
+        """슬라이싱 가능한 버퍼(mmap 등)를 읽기 콜백으로 파싱
+        
+        파서가 필요한 위치의 조각만 요청하므로 파일 전체를 bytes로 복사하지 않으며,
+        트리에 소스 텍스트를 보관하지 않는다 (keep_text=False).
+        """
+        return self.parse_until(buffer, chunk_size)[0]
+    
+    def parse_until(self, buffer, chunk_size: int = 256 * 1024, timeout: Optional[float] = None,
+                    deadline: Optional[float] = None) -> Tuple[Tree, Optional[int]]:
+        """읽기 콜백으로 파싱하되 시간 제한이 지나면 그때까지 읽은 부분만 파싱
+        
+        제한 시각은 파싱을 시작한 뒤 timeout초와 deadline(time.perf_counter 기준) 중 먼저
+        오는 시각이다. tree-sitter 0.20 바인딩에는 파싱 시간 제한이 없으므로 파서가 다음
+        조각을 요청할 때 시간을 확인하고, 지났으면 입력이 끝난 것으로 알려 부분 트리를 받는다.
+        따라서 한 조각(chunk_size)을 파싱하는 동안은 제한을 넘을 수 있으므로 시간 제한이
+        있을 때는 작은 조각을 넘겨야 하며, chunk_size보다 작은 파일은 끊을 수 없다.
+        잘린 경우 입력을 끊은 바이트 위치를, 아니면 None을 트리와 함께 반환한다.
+        """
+        limit = len(buffer)
+        cut_offset = None
+        
+        def read(byte_offset: int, point) -> bytes:
+            nonlocal limit, cut_offset
+            if byte_offset >= limit:
+                return b""
+            if deadline is not None and cut_offset is None and time.perf_counter() >= deadline:
+                # 이후 요청은 모두 이 위치를 파일 끝으로 봄
+                limit = cut_offset = byte_offset
+                return b""
+            return buffer[byte_offset:min(byte_offset + chunk_size, limit)]
+        
+        with self._parse_lock:
+            if timeout is not None:
+                deadline = min(time.perf_counter() + timeout, deadline or float("inf"))
+            tree = self.tree_sitter_parser.parse(read, keep_text=False)
+        return tree, cut_offset
+    
     def parse_file(self, file_path: Path) -> Optional[Tree]:
         """파일 파싱"""
         try:
             with open(file_path, 'rb') as f:
                 source_code = f.read()
-            return self.tree_sitter_parser.parse(source_code)
+            return self.parse_source(source_code)
         except Exception as e:
-            print(f"파일 파싱 실패: {file_path} - {e}")
+            logger.debug(f"파일 파싱 실패: {file_path} - {e}")
             return None
     
+    def may_define_functions(self, source_code) -> bool:
+        """바이트 사전 필터 (False이면 함수 정의 노드가 있을 수 없으므로 파싱할 필요가 없음)
+        
+        언어별 prefilter_pattern이 없으면 항상 True를 반환한다. mmap 버퍼도 복사 없이 검사한다.
+        """
+        return self.prefilter is None or self.prefilter.search(source_code) is not None
+    
+    def function_metrics(self, node: Node, source_code: bytes) -> FunctionMetrics:
+        """함수 정의 노드의 범위, 줄 수, 매개변수 수 (분기 수와 중첩 깊이는 AST 순회 중에 채움)"""
+        start_byte, end_byte = node.start_byte, node.end_byte
+        lines = sum(1 for line in source_code[start_byte:end_byte].splitlines() if line.strip())
+        return FunctionMetrics(end_line=node.end_point[0] + 1, start_byte=start_byte, end_byte=end_byte,
+                               lines=lines, parameters=self.count_parameters(node, source_code))
+    
+    def get_parameters_node(self, node: Node) -> Optional[Node]:
+        """함수 정의 노드의 매개변수 목록 노드"""
+        return node.child_by_field_name("parameters")
+    
+    def count_parameters(self, node: Node, source_code: bytes) -> int:
+        """함수 정의의 매개변수 수 (가변 인자도 하나로 셈)"""
+        parameters = self.get_parameters_node(node)
+        if parameters is None:
+            return 0
+        return sum(1 for child in parameters.named_children if child.type not in self.non_parameter_types)
+    
+    def branch_count(self, node: Node) -> int:
+        """branch_node_types에 속한 노드가 순환 복잡도에 더하는 값
+        
+        이항 연산 노드는 logical_operators(&&, || 등)일 때만 분기로 센다.
+        """
+        if node.type == "binary_expression":
+            operator = node.child_by_field_name("operator")
+            return 1 if operator is not None and operator.type in self.logical_operators else 0
+        return 1
+    
+    def increases_nesting(self, node: Node) -> bool:
+        """nesting_node_types에 속한 노드가 중첩 깊이를 늘리는지 (else if는 같은 깊이로 봄)"""
+        if node.type != "if_statement":
+            return True
+        parent = node.parent
+        return parent is None or parent.type != "else_clause"
+    
     def should_include_function(self, func_name: str) -> bool:
         """함수를 분석 결과에 포함할지 결정"""
         # 언어별로 오버라이드 가능
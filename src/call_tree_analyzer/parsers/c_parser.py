@@ -4,9 +4,15 @@ from tree_sitter_languages import get_parser
 
 from .base import BaseParser
 
+# 함수 정의로도 분석에서 제외할 시스템 함수
+SYSTEM_FUNCTIONS = frozenset({'printf', 'scanf', 'malloc', 'free', 'strlen', 'strcpy'})
+
 class CParser(BaseParser):
     """C 언어 파서"""
     
+    member_node_types = frozenset({"field_expression"})
+    member_object_field = "argument"
+    
     def __init__(self):
         super().__init__("c")
         self.tree_sitter_parser = get_parser("c")
@@ -41,6 +47,30 @@ class CParser(BaseParser):
         
         return None
     
+    def get_parameters_node(self, node: Node) -> Optional[Node]:
+        # function_definition -> (pointer_declarator ->) function_declarator -> parameter_list
+        current = node.child_by_field_name("declarator")
+        while current is not None and current.type != "function_declarator":
+            current = current.child_by_field_name("declarator")
+        return current.child_by_field_name("parameters") if current is not None else None
+    
+    def count_parameters(self, node: Node, source_code: bytes) -> int:
+        count = super().count_parameters(node, source_code)
+        if count == 1:
+            # f(void)는 매개변수가 없음
+            declaration = self.get_parameters_node(node).named_children[0]
+            type_node = declaration.child_by_field_name("type")
+            if (declaration.child_by_field_name("declarator") is None and type_node is not None and
+                    self.get_node_text(source_code, type_node) == "void"):
+                return 0
+        return count
+    
+    def branch_count(self, node: Node) -> int:
+        # default: 레이블은 분기로 세지 않음
+        if node.type == "case_statement" and node.child_by_field_name("value") is None:
+            return 0
+        return super().branch_count(node)
+    
     def extract_call_target(self, node: Node, source_code: bytes) -> Optional[str]:
         if not self.is_call_node(node):
             return None
@@ -63,5 +93,4 @@ class CParser(BaseParser):
             return False
         
         # 시스템 함수들은 제외
-        system_functions = {'printf', 'scanf', 'malloc', 'free', 'strlen', 'strcpy'}
-        return func_name not in system_functions
\ No newline at end of file
+        return func_name not in SYSTEM_FUNCTIONS
\ No newline at end of file
@@ -7,6 +7,10 @@ from .base import BaseParser
 class JavaScriptParser(BaseParser):
     """JavaScript 언어 파서"""
     
+    member_node_types = frozenset({"member_expression"})
+    receiver_name_types = frozenset({"identifier", "this", "super"})
+    literal_node_types = frozenset({"string", "template_string", "number", "regex", "array", "object"})
+    
     def __init__(self):
         super().__init__("javascript")
         self.tree_sitter_parser = get_parser("javascript")
@@ -17,6 +21,12 @@ class JavaScriptParser(BaseParser):
     def is_call_node(self, node: Node) -> bool:
         return node.type == "call_expression"
     
+    def count_parameters(self, node: Node, source_code: bytes) -> int:
+        # 괄호 없는 화살표 함수의 단일 매개변수 (x => ...)
+        if node.child_by_field_name("parameter") is not None:
+            return 1
+        return super().count_parameters(node, source_code)
+    
     def extract_function_name(self, node: Node, source_code: bytes) -> Optional[str]:
         if node.type == "function_declaration":
             name_node = node.child_by_field_name("name")
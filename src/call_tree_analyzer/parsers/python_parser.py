@@ -7,6 +7,13 @@ from .base import BaseParser
 class PythonParser(BaseParser):
     """Python 언어 파서"""
     
+    member_node_types = frozenset({"attribute"})
+    literal_node_types = frozenset({
+        "string", "concatenated_string", "integer", "float", "list", "dictionary", "set", "tuple",
+        "list_comprehension", "dictionary_comprehension", "set_comprehension"
+    })
+    non_parameter_types = frozenset({"comment", "positional_separator", "keyword_separator"})
+    
     def __init__(self):
         super().__init__("python")
         self.tree_sitter_parser = get_parser("python")
@@ -58,13 +65,5 @@ class PythonParser(BaseParser):
         return True
     
     def should_include_call(self, call_name: str) -> bool:
-        if not call_name:
-            return False
-        
-        # 내장 함수들 제외
-        builtin_functions = {
-            'print', 'len', 'str', 'int', 'float', 'bool', 'list', 'dict', 
-            'set', 'tuple', 'range', 'enumerate', 'zip', 'map', 'filter'
-        }
-        
-        return call_name not in builtin_functions
\ No newline at end of file
+        # 내장 함수 제외는 카탈로그 분류(include_builtin_calls)로 처리
+        return bool(call_name)
\ No newline at end of file
@@ -0,0 +1,378 @@
+"""런타임 프로파일 오버레이
+
+cProfile의 pstats 파일과 collapsed stack(perf script | stackcollapse, py-spy raw 등)을
+정적 호출 트리의 함수에 파일/이름/줄 기준으로 대응시켜 함수와 호출 간선에 측정된
+호출 횟수와 비용을 붙인다. 비용 단위는 pstats면 초, collapsed stack이면 표본 수다.
+"""
+
+import logging
+import pstats
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path, PurePath
+from typing import Dict, List, Tuple, Optional, Iterable, Any
+
+from .models import CallTree, FunctionInfo
+from .centrality import CallGraph
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FORMATS = ("auto", "pstats", "collapsed")
+PROFILE_UNITS = {"pstats": "seconds", "collapsed": "samples"}
+
+# 확장자로 형식을 정할 수 있는 파일
+_PSTATS_SUFFIXES = {".prof", ".pstats", ".cprof"}
+_COLLAPSED_SUFFIXES = {".folded", ".collapsed", ".stacks", ".txt"}
+
+# py-spy raw 형식의 "함수 (파일:줄)" 프레임
+_FRAME_LOCATION = re.compile(r"^(?P<name>.*?) \((?P<file>[^()]+):(?P<line>\d+)\)$")
+# perf 프레임 이름의 꾸밈 (커널/JIT 표시, 오프셋, 인자 목록)
+_FRAME_DECORATION = re.compile(r"(_\[[kwij]\]|\+0x[0-9a-fA-F]+|\(.*\))$")
+# 함수 정의가 아닌 코드 객체의 프레임 (<module>, <listcomp>, <lambda>, Class.<genexpr>, <built-in ...>)
+_PSEUDO_FRAME = re.compile(r"(^|\.)<[^>]*>$")
+
+Edge = Tuple[str, str]  # (호출하는 함수, 호출되는 함수) full_name
+FrameTarget = Tuple[str, str]  # 프레임에 대응한 함수의 (full_name, 파일 경로 문자열)
+
+@dataclass
+class FunctionCost:
+    """함수 하나의 측정값"""
+    calls: int = 0  # 호출 횟수 (collapsed stack에서는 알 수 없으므로 0)
+    self_cost: float = 0.0  # 함수 자체에서 쓴 비용
+    cumulative_cost: float = 0.0  # 호출한 함수까지 포함한 비용
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "self": self.self_cost, "cumulative": self.cumulative_cost}
+
+@dataclass
+class EdgeCost:
+    """호출 간선 하나의 측정값"""
+    calls: int = 0  # 이 간선으로 호출한 횟수 (collapsed stack에서는 0)
+    cost: float = 0.0  # 이 간선을 거쳐 호출된 함수에서 쓴 누적 비용
+
+class FunctionIndex:
+    """프로파일 프레임(파일, 이름, 줄)을 호출 트리의 함수로 대응
+    
+    프로파일을 수집한 위치와 분석한 체크아웃 위치가 다를 수 있으므로 파일은 경로 뒤쪽
+    구성 요소가 가장 길게 일치하는 분석 파일로 찾는다. 파일 정보가 없는 프레임(perf의 C
+    함수 등)은 이름이 하나뿐일 때, 또는 같은 이름이 여럿이면 이웃 프레임(near)과 같은
+    파일에 정의된 것이 있을 때만 대응시킨다.
+    """
+    
+    def __init__(self, call_tree: CallTree):
+        self.by_file: Dict[Path, Dict[str, FunctionInfo]] = defaultdict(dict)
+        self.by_name: Dict[str, List[FunctionInfo]] = defaultdict(list)
+        self._files_by_basename: Dict[str, List[Path]] = defaultdict(list)
+        self._resolved_files: Dict[str, Optional[Path]] = {}
+        
+        for func_info in call_tree.functions.values():
+            functions = self.by_file[func_info.file_path]
+            if not functions:
+                self._files_by_basename[func_info.file_path.name].append(func_info.file_path)
+            functions[func_info.name] = func_info
+            self.by_name[func_info.name].append(func_info)
+    
+    def resolve_file(self, file_name: str) -> Optional[Path]:
+        """프로파일의 파일 경로에 해당하는 분석 파일 (경로 뒤쪽이 가장 길게 일치하는 파일)"""
+        if file_name not in self._resolved_files:
+            parts = PurePath(file_name).parts
+            best, best_length, tied = None, 0, False
+            for candidate in self._files_by_basename.get(parts[-1] if parts else "", ()):
+                length = _common_suffix_length(parts, candidate.parts)
+                if length > best_length:
+                    best, best_length, tied = candidate, length, False
+                elif length == best_length:
+                    tied = True
+            self._resolved_files[file_name] = None if tied else best
+        return self._resolved_files[file_name]
+    
+    def match(self, name: str, file_name: Optional[str] = None, line: Optional[int] = None,
+              near: Optional[str] = None) -> Optional[FunctionInfo]:
+        """프레임에 해당하는 함수 (찾지 못하거나 후보를 고를 수 없으면 None)
+        
+        파일을 알면 그 파일의 같은 이름 함수를, 없으면 line을 범위 안에 포함하는 가장 안쪽
+        함수를 찾는다 (범위는 함수 지표의 end_line을 쓰므로 지표가 없는 함수는 제외).
+        <module>, <lambda> 등 함수 정의가 아닌 프레임은 대응시키지 않는다.
+        """
+        if _PSEUDO_FRAME.search(name):
+            return None
+        
+        names = [name, name.rpartition(".")[2]] if "." in name else [name]
+        
+        if file_name is not None:
+            file_path = self.resolve_file(file_name)
+            if file_path is None:
+                return None
+            functions = self.by_file[file_path]
+            for candidate in names:
+                if candidate in functions:
+                    return functions[candidate]
+            if line is not None:
+                enclosing = [func for func in functions.values()
+                             if func.metrics is not None and func.line <= line <= func.metrics.end_line]
+                return max(enclosing, key=lambda func: func.line, default=None)
+            return None
+        
+        for candidate in names:
+            functions = self.by_name.get(candidate, ())
+            if len(functions) == 1:
+                return functions[0]
+            for func_info in functions:
+                if str(func_info.file_path) == near:
+                    return func_info
+        return None
+
+class ProfileOverlay:
+    """정적 호출 트리에 겹친 런타임 프로파일
+    
+    여러 프로파일을 불러오면 측정값을 합산한다. 단위가 다른 형식(초와 표본 수)은 섞을 수 없다.
+    """
+    
+    def __init__(self, call_tree: CallTree):
+        self.call_tree = call_tree
+        self.index = FunctionIndex(call_tree)
+        self.unit: Optional[str] = None
+        self.sources: List[str] = []
+        self.functions: Dict[str, FunctionCost] = defaultdict(FunctionCost)
+        self.edges: Dict[Edge, EdgeCost] = defaultdict(EdgeCost)
+        self.unmatched: Counter = Counter()  # 대응하지 못한 프레임 -> 누적 비용
+        self._frame_cache: Dict[Tuple[str, Optional[str]], Optional[FrameTarget]] = {}
+    
+    def load(self, path, profile_format: str = "auto"):
+        """프로파일 파일 불러오기 (auto면 확장자와 내용으로 형식 판단)"""
+        path = Path(path)
+        if profile_format not in PROFILE_FORMATS:
+            raise ValueError(f"지원하지 않는 프로파일 형식: {profile_format}")
+        
+        stats = None
+        if profile_format == "auto":
+            suffix = path.suffix.lower()
+            if suffix in _PSTATS_SUFFIXES:
+                profile_format = "pstats"
+            elif suffix in _COLLAPSED_SUFFIXES:
+                profile_format = "collapsed"
+            else:
+                try:
+                    stats = pstats.Stats(str(path)).stats
+                    profile_format = "pstats"
+                except Exception:
+                    profile_format = "collapsed"
+        
+        self._set_unit(PROFILE_UNITS[profile_format], path)
+        if profile_format == "pstats":
+            self.add_pstats(stats if stats is not None else pstats.Stats(str(path)).stats)
+        else:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                self.add_collapsed(f)
+        
+        self.sources.append(str(path))
+        logger.info(f"프로파일 적용: {path} ({profile_format}, 함수 {len(self.functions)}개 대응, "
+                    f"대응 실패 프레임 {len(self.unmatched)}개)")
+    
+    def add_pstats(self, stats: Dict[Tuple[str, int, str], tuple]):
+        """pstats.Stats.stats 사전 적용 ((파일, 줄, 이름) -> (cc, nc, tt, ct, callers))"""
+        for (file_name, line, name), (_, calls, self_time, cumulative_time, callers) in stats.items():
+            func_info = self.index.match(name, file_name, line)
+            if func_info is None:
+                self.unmatched[_frame_label(name, file_name, line)] += cumulative_time
+                continue
+            
+            cost = self.functions[func_info.full_name]
+            cost.calls += calls
+            cost.self_cost += self_time
+            cost.cumulative_cost += cumulative_time
+            
+            for (caller_file, caller_line, caller_name), value in callers.items():
+                caller = self.index.match(caller_name, caller_file, caller_line)
+                if caller is None:
+                    continue
+                edge = self.edges[(caller.full_name, func_info.full_name)]
+                if isinstance(value, tuple):
+                    # cProfile: (nc, cc, tt, ct)
+                    edge.calls += value[0]
+                    edge.cost += value[3]
+                else:
+                    # profile 모듈: 호출 횟수만 기록
+                    edge.calls += value
+    
+    def add_collapsed(self, lines: Iterable[str]):
+        """collapsed stack 적용 (한 줄에 "바깥;...;안쪽 표본수")"""
+        for line_number, line in enumerate(lines, 1):
+            stack, _, count = line.rstrip().rpartition(" ")
+            try:
+                samples = float(count)
+            except ValueError:
+                if line.strip():
+                    logger.debug(f"collapsed stack 형식이 아닌 줄 무시: {line_number}번째 줄")
+                continue
+            
+            frames = stack.split(";")
+            matched = [self._match_frame(frame) for frame in frames]
+            if None in matched:
+                # 이름이 여럿인 프레임은 이웃 프레임(호출한 함수, 호출된 함수)의 파일로 고름
+                for position, frame in enumerate(frames):
+                    if matched[position] is not None:
+                        continue
+                    neighbors = matched[max(0, position - 1):position] + matched[position + 1:position + 2]
+                    for neighbor in neighbors:
+                        if neighbor is not None:
+                            matched[position] = self._match_frame(frame, neighbor[1])
+                            if matched[position] is not None:
+                                break
+            
+            # 재귀 호출은 스택 하나에서 한 번만 누적 비용에 더함
+            names = [target[0] if target is not None else None for target in matched]
+            seen = set()
+            for frame, name in zip(frames, names):
+                if name is None:
+                    if frame not in seen:
+                        seen.add(frame)
+                        self.unmatched[frame] += samples
+                elif name not in seen:
+                    seen.add(name)
+                    self.functions[name].cumulative_cost += samples
+            if names[-1] is not None:
+                self.functions[names[-1]].self_cost += samples
+            
+            for caller, callee in zip(names, names[1:]):
+                if caller is not None and callee is not None:
+                    self.edges[(caller, callee)].cost += samples
+    
+    def static_edges(self) -> set:
+        """정적 분석으로 찾은 내부 호출 간선 (호출 대상 해석은 중심성 그래프와 같음)"""
+        graph = CallGraph.from_call_tree(self.call_tree)
+        return {
+            (graph.names[source], graph.names[graph.indices[edge]])
+            for source in range(graph.node_count)
+            for edge in range(graph.indptr[source], graph.indptr[source + 1])
+        }
+    
+    def ranked_functions(self, key: str = "self", top: Optional[int] = None) -> List[str]:
+        """측정 비용 순 함수 (key: self 또는 cumulative)"""
+        attribute = "self_cost" if key == "self" else "cumulative_cost"
+        ranked = sorted(
+            (name for name, cost in self.functions.items() if getattr(cost, attribute) > 0),
+            key=lambda name: (-getattr(self.functions[name], attribute), name)
+        )
+        return ranked[:top] if top is not None else ranked
+    
+    def report(self, top: int = 10) -> Dict[str, Any]:
+        """함수/간선 측정값과 정적 분석과의 차이
+        
+        cold_static_edges는 실행된 함수의 정적 호출 간선 중 프로파일에서 한 번도 관측되지
+        않은 간선, missed_dynamic_edges는 프로파일에서 관측됐지만 정적 분석이 찾지 못한
+        간선(콜백, 동적 디스패치 등)이며 비용 순으로 정렬한다.
+        """
+        static = self.static_edges()
+        fired = {edge for edge, cost in self.edges.items() if cost.calls or cost.cost}
+        executed = {name for name, cost in self.functions.items() if cost.calls or cost.cumulative_cost}
+        
+        cold = sorted(edge for edge in static if edge[0] in executed and edge not in fired)
+        missed = sorted((edge for edge in fired if edge not in static),
+                        key=lambda edge: (-self.edges[edge].cost, -self.edges[edge].calls, edge))
+        
+        return {
+            "unit": self.unit,
+            "sources": self.sources,
+            "matched_functions": len(self.functions),
+            "functions": {name: self.functions[name].to_dict() for name in sorted(self.functions)},
+            "edges": [
+                {"caller": caller, "callee": callee, "calls": cost.calls, "cost": cost.cost,
+                 "static": (caller, callee) in static}
+                for (caller, callee), cost in sorted(self.edges.items())
+            ],
+            "hot_functions": [
+                dict(function=name, **self.functions[name].to_dict())
+                for name in self.ranked_functions("self", top)
+            ],
+            "cold_static_edges": [list(edge) for edge in cold],
+            "missed_dynamic_edges": [
+                {"caller": caller, "callee": callee, "calls": self.edges[(caller, callee)].calls,
+                 "cost": self.edges[(caller, callee)].cost}
+                for caller, callee in missed
+            ],
+            "unmatched_frames": [
+                {"frame": frame, "cost": cost} for frame, cost in self.unmatched.most_common(top)
+            ],
+            "unmatched_frame_count": len(self.unmatched)
+        }
+    
+    def format_text(self, top: int = 10) -> str:
+        """텍스트 보고서"""
+        report = self.report(top)
+        unit = report["unit"]
+        lines = [f"=== Profile Overlay ({unit}) ===",
+                 f"Sources: {', '.join(report['sources'])}",
+                 f"Matched functions: {report['matched_functions']}, "
+                 f"unmatched frames: {report['unmatched_frame_count']}",
+                 "",
+                 "Hot Functions (self / cumulative / calls):"]
+        for entry in report["hot_functions"]:
+            lines.append(f"  - {entry['function']}: {_format_cost(entry['self'])} / "
+                         f"{_format_cost(entry['cumulative'])} / {entry['calls']}")
+        
+        lines.append("")
+        lines.append(f"Missed Dynamic Edges ({len(report['missed_dynamic_edges'])}):")
+        for entry in report["missed_dynamic_edges"][:top]:
+            lines.append(f"  - {entry['caller']} -> {entry['callee']} "
+                         f"({_format_cost(entry['cost'])} {unit}, {entry['calls']} calls)")
+        
+        lines.append("")
+        lines.append(f"Cold Static Edges ({len(report['cold_static_edges'])}):")
+        for caller, callee in report["cold_static_edges"][:top]:
+            lines.append(f"  - {caller} -> {callee}")
+        
+        if report["unmatched_frames"]:
+            lines.append("")
+            lines.append("Unmatched Frames:")
+            for entry in report["unmatched_frames"]:
+                lines.append(f"  - {entry['frame']} ({_format_cost(entry['cost'])} {unit})")
+        
+        return "\n".join(lines) + "\n"
+    
+    def _match_frame(self, frame: str, near: Optional[str] = None) -> Optional[FrameTarget]:
+        key = (frame, near)
+        target = self._frame_cache.get(key, key)
+        if target is key:
+            func_info = self._resolve_frame(frame, near)
+            target = (func_info.full_name, str(func_info.file_path)) if func_info is not None else None
+            self._frame_cache[key] = target
+        return target
+    
+    def _resolve_frame(self, frame: str, near: Optional[str]) -> Optional[FunctionInfo]:
+        located = _FRAME_LOCATION.match(frame)
+        if located:
+            return self.index.match(located.group("name"), located.group("file"),
+                                    int(located.group("line")), near)
+        
+        # perf 프레임: "모듈`함수", "함수+0x1f", "함수_[k]" 등에서 함수 이름만 사용
+        name = _FRAME_DECORATION.sub("", frame.rpartition("`")[2]).strip()
+        if not name or name.startswith("["):
+            return None
+        return self.index.match(name, near=near)
+    
+    def _set_unit(self, unit: str, path: Path):
+        if self.unit is not None and self.unit != unit:
+            raise ValueError(f"단위가 다른 프로파일은 함께 적용할 수 없습니다: {path} ({unit}, 기존 {self.unit})")
+        self.unit = unit
+
+def load_profile_overlay(call_tree: CallTree, paths: Iterable[str],
+                         profile_format: str = "auto") -> ProfileOverlay:
+    """프로파일 파일들을 호출 트리에 적용한 오버레이 생성"""
+    overlay = ProfileOverlay(call_tree)
+    for path in paths:
+        overlay.load(path, profile_format)
+    return overlay
+
+def _common_suffix_length(left: Tuple[str, ...], right: Tuple[str, ...]) -> int:
+    length = 0
+    while length < min(len(left), len(right)) and left[-1 - length] == right[-1 - length]:
+        length += 1
+    return length
+
+def _frame_label(name: str, file_name: str, line: int) -> str:
+    return f"{name} ({file_name}:{line})"
+
+def _format_cost(value: float) -> str:
+    return f"{value:.6g}"
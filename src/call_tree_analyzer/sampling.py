@@ -0,0 +1,352 @@
+import heapq
+import logging
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import NormalDist
+from typing import Dict, List, Tuple, Optional, Iterable, Callable, Any
+
+from .models import FileResult
+from .config import ANALYSIS_CONFIG, get_language_by_extension
+from .utils import FileScanner
+
+logger = logging.getLogger(__name__)
+
+# 파일별 값을 합산해 전체 값을 추정하는 통계 항목
+TOTAL_METRICS = ("total_functions", "total_calls", "total_edges",
+                 "internal_calls", "external_calls", "builtin_calls")
+# 두 합계의 비율로 추정하는 통계 항목 -> (분자, 분모)
+RATIO_METRICS = {
+    "avg_calls_per_function": ("total_calls", "total_functions"),
+    "avg_fan_out": ("total_edges", "total_functions")
+}
+# 파일 경계를 넘는 값이라 표본에서 관측한 값만 보고하는 항목
+OBSERVED_METRICS = ("max_fan_in", "max_fan_out", "avg_fan_in")
+
+Stratum = Tuple[str, str]  # (언어, 디렉터리)
+
+@dataclass
+class SamplePlan:
+    """층화 표본 추출 순서
+    
+    파일을 (언어, 상위 디렉터리) 층으로 나누고 층마다 무작위로 섞은 뒤, 앞에서부터
+    몇 개를 잘라도 층별 파일 수가 층의 전체 바이트 수에 비례하도록(층마다 최소 1개)
+    한 줄로 배치한다. 함수/호출 수의 층별 편차가 대략 층의 바이트 수에 비례하므로
+    바이트 비례 배분이 파일 수 비례 배분보다 분산이 작다.
+    """
+    order: List[Path]
+    strata: Dict[Path, Stratum]
+    population: Dict[Stratum, int]
+    
+    @classmethod
+    def build(cls, files: Iterable[Path], sizes: Dict[Path, int], root_path: Path,
+              seed: Optional[int] = None, directory_depth: int = 1) -> "SamplePlan":
+        rng = random.Random(seed)
+        by_stratum: Dict[Stratum, List[Path]] = defaultdict(list)
+        for file_path in sorted(files, key=str):
+            by_stratum[_stratum_key(file_path, root_path, directory_depth)].append(file_path)
+        
+        keyed = []
+        strata = {}
+        for stratum in sorted(by_stratum):
+            paths = by_stratum[stratum]
+            rng.shuffle(paths)
+            weight = sum(max(1, sizes.get(path, 0)) for path in paths)
+            for index, path in enumerate(paths):
+                keyed.append((index / weight, stratum, index, path))
+                strata[path] = stratum
+        keyed.sort()
+        
+        return cls(order=[path for _, _, _, path in keyed], strata=strata,
+                   population={stratum: len(paths) for stratum, paths in by_stratum.items()})
+
+@dataclass
+class SampleReport:
+    """표본 분석으로 추정한 통계와 핫스팟"""
+    population_files: int
+    sampled_files: int
+    population_strata: int
+    sampled_strata: int
+    confidence: float
+    elapsed: float
+    statistics: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    hotspots: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    
+    @property
+    def complete(self) -> bool:
+        """모든 파일을 분석했는지 여부 (이 경우 추정값이 정확한 값)"""
+        return self.sampled_files >= self.population_files
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 형태로 변환"""
+        return {
+            "sample": {
+                "population_files": self.population_files,
+                "sampled_files": self.sampled_files,
+                "population_strata": self.population_strata,
+                "sampled_strata": self.sampled_strata,
+                "confidence": self.confidence,
+                "elapsed": round(self.elapsed, 3),
+                "complete": self.complete
+            },
+            "statistics": self.statistics,
+            "hotspots": self.hotspots
+        }
+    
+    def format_text(self) -> str:
+        """사람이 읽기 쉬운 텍스트로 포맷"""
+        percent = self.sampled_files / self.population_files * 100 if self.population_files else 0
+        lines = [
+            "=== Sampled Estimates ===",
+            f"sampled files: {self.sampled_files}/{self.population_files} ({percent:.1f}%), "
+            f"strata: {self.sampled_strata}/{self.population_strata}, elapsed: {self.elapsed:.1f}s",
+            f"confidence: {self.confidence:.0%}",
+            ""
+        ]
+        for name, value in self.statistics.items():
+            if value["low"] is None:
+                lines.append(f"{name}: {_format_number(value['estimate'])} ({value['method']})")
+            else:
+                lines.append(f"{name}: {_format_number(value['estimate'])} "
+                             f"[{_format_number(value['low'])}, {_format_number(value['high'])}]")
+        
+        lines.append("\nMost Called Functions (estimated calls):")
+        for item in self.hotspots.get("most_called_functions", [])[:5]:
+            lines.append(f"  - {item['name']}: {item['estimate']:.0f} "
+                         f"[{item['low']:.0f}, {item['high']:.0f}]")
+        
+        lines.append("\nMost Calling Functions (sampled):")
+        for item in self.hotspots.get("most_calling_functions", [])[:5]:
+            lines.append(f"  - {item['name']}: {item['calls']}")
+        
+        return "\n".join(lines) + "\n"
+
+class StratifiedEstimator:
+    """층화 표본의 파일별 관측값으로 전체 통계 추정
+    
+    합계는 층별 평균에 층의 파일 수를 곱해 더하고(유한 모집단 보정 포함), 비율은
+    선형화한 분산으로 신뢰구간을 구한다. 표본이 1개뿐인 층은 전체 표본의 분산을,
+    표본이 없는 층은 전체 표본의 평균과 분산을 빌려 쓴다.
+    """
+    
+    def __init__(self, population: Dict[Stratum, int], confidence: float = 0.95):
+        self.population = population
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.samples: Dict[Stratum, List[Dict[str, Any]]] = defaultdict(list)
+        self.sampled_files = 0
+        
+        # 파일 경계를 넘는 값은 관측값만 유지
+        self._caller_counts = Counter()  # 피호출 이름 -> 서로 다른 호출 함수 수
+        self._max_fan_out = 0
+        self._most_calling: List[Tuple[int, str]] = []  # 호출 수 상위 함수 (최소 힙)
+    
+    def add(self, stratum: Stratum, result: Optional[FileResult]):
+        """파일 하나의 분석 결과 반영 (결과가 없는 파일은 함수가 없는 파일로 관측)"""
+        values: Dict[str, Any] = dict.fromkeys(TOTAL_METRICS, 0)
+        called = Counter()
+        
+        for func in (result.functions if result is not None else ()):
+            callee_names = func.get_callee_names()
+            call_count = func.get_call_count()
+            values["total_functions"] += 1
+            values["total_calls"] += call_count
+            values["total_edges"] += len(callee_names)
+            for call in func.calls:
+                values[f"{call.kind}_calls"] += call.count
+                if call.kind == "internal":
+                    called[call.name] += call.count
+            
+            self._caller_counts.update(callee_names)
+            self._max_fan_out = max(self._max_fan_out, len(callee_names))
+            heapq.heappush(self._most_calling, (call_count, func.full_name))
+            if len(self._most_calling) > 10:
+                heapq.heappop(self._most_calling)
+        
+        values["called"] = called
+        self.samples[stratum].append(values)
+        self.sampled_files += 1
+    
+    def estimate_total(self, value: Callable[[Dict[str, Any]], float]) -> Tuple[float, float, float]:
+        """파일별 값 합계의 추정값, 분산, 표본에서 관측한 합 반환"""
+        observed = [value(obs) for samples in self.samples.values() for obs in samples]
+        if not observed:
+            return 0.0, 0.0, 0.0
+        pooled_mean = sum(observed) / len(observed)
+        pooled_var = _variance(observed, pooled_mean)
+        
+        estimate = 0.0
+        variance = 0.0
+        for stratum, size in self.population.items():
+            values = [value(obs) for obs in self.samples.get(stratum, ())]
+            count = len(values)
+            if count == 0:
+                estimate += size * pooled_mean
+                variance += size * size * pooled_var
+                continue
+            
+            mean = sum(values) / count
+            stratum_var = _variance(values, mean) if count > 1 else pooled_var
+            estimate += size * mean
+            variance += size * size * (1 - count / size) * stratum_var / count
+        
+        return estimate, variance, float(sum(observed))
+    
+    def interval(self, estimate: float, variance: float, floor: float = 0.0) -> Tuple[float, float]:
+        """정규 근사 신뢰구간 (하한은 floor 이상)"""
+        half_width = self.z * math.sqrt(max(variance, 0.0))
+        return max(floor, estimate - half_width), estimate + half_width
+    
+    def report(self, elapsed: float = 0.0, top: int = 10) -> SampleReport:
+        """현재까지의 표본으로 통계와 핫스팟 추정"""
+        report = SampleReport(
+            population_files=sum(self.population.values()),
+            sampled_files=self.sampled_files,
+            population_strata=len(self.population),
+            sampled_strata=len(self.samples),
+            confidence=self.confidence,
+            elapsed=elapsed
+        )
+        
+        totals = {}
+        for metric in TOTAL_METRICS:
+            estimate, variance, observed = self.estimate_total(lambda obs, metric=metric: obs[metric])
+            totals[metric] = estimate
+            low, high = self.interval(estimate, variance, floor=observed)
+            report.statistics[metric] = _estimate_entry(estimate, low, high, "stratified_total")
+        
+        for metric, (numerator, denominator) in RATIO_METRICS.items():
+            if not totals[denominator]:
+                report.statistics[metric] = _estimate_entry(0.0, 0.0, 0.0, "ratio")
+                continue
+            ratio = totals[numerator] / totals[denominator]
+            _, variance, _ = self.estimate_total(
+                lambda obs: obs[numerator] - ratio * obs[denominator]
+            )
+            low, high = self.interval(ratio, variance / (totals[denominator] ** 2))
+            report.statistics[metric] = _estimate_entry(ratio, low, high, "ratio")
+        
+        # 최대값과 호출 대상 기준 평균은 표본에서 관측한 값 (최대값은 하한)
+        caller_counts = self._caller_counts
+        report.statistics["max_fan_in"] = _estimate_entry(
+            max(caller_counts.values()) if caller_counts else 0, None, None, "observed_lower_bound")
+        report.statistics["max_fan_out"] = _estimate_entry(self._max_fan_out, None, None, "observed_lower_bound")
+        report.statistics["avg_fan_in"] = _estimate_entry(
+            sum(caller_counts.values()) / len(caller_counts) if caller_counts else 0, None, None, "observed")
+        
+        report.hotspots = {
+            "most_called_functions": self._estimate_most_called(top),
+            "most_calling_functions": [
+                {"name": name, "calls": count}
+                for count, name in sorted(self._most_calling, key=lambda item: (-item[0], item[1]))[:top]
+            ]
+        }
+        return report
+    
+    def _estimate_most_called(self, top: int) -> List[Dict[str, Any]]:
+        """피호출 이름별 내부 호출 수 추정 (층별 가중 합으로 상위 이름을 고른 뒤 신뢰구간 계산)"""
+        weighted = Counter()
+        for stratum, samples in self.samples.items():
+            weight = self.population[stratum] / len(samples)
+            for obs in samples:
+                for name, count in obs["called"].items():
+                    weighted[name] += count * weight
+        
+        result = []
+        for name, _ in sorted(weighted.items(), key=lambda item: (-item[1], item[0]))[:top]:
+            estimate, variance, observed = self.estimate_total(lambda obs: obs["called"].get(name, 0))
+            low, high = self.interval(estimate, variance, floor=observed)
+            result.append({"name": name, **_estimate_entry(estimate, low, high, "stratified_total")})
+        return result
+
+def sample_size(sample: float, population: int) -> int:
+    """--sample 값을 파일 수로 변환 (1 미만이면 비율, 1 이상이면 파일 수)"""
+    if sample <= 0:
+        raise ValueError(f"표본 크기는 0보다 커야 합니다: {sample}")
+    count = math.ceil(sample * population) if sample < 1 else int(sample)
+    return max(1, min(population, count))
+
+def analyze_sample(analyzer, project_root: str, sample: float,
+                   time_budget: Optional[float] = None, seed: Optional[int] = None) -> SampleReport:
+    """층화 표본 파일만 분석하여 통계와 핫스팟을 신뢰구간과 함께 추정
+    
+    sample 크기만큼 분석한 뒤 멈추며, time_budget(초)이 주어지면 예산을 다 쓸 때까지
+    (또는 모든 파일을 분석할 때까지) 같은 순서로 표본을 계속 늘린다. 표본 수가 두 배가
+    될 때마다 중간 추정값을 로그로 남긴다. 내용이 같은 파일도 각각 분석한다.
+    """
+    start = time.perf_counter()
+    deadline = start + time_budget if time_budget else None
+    root_path = analyzer._resolve_project_root(project_root)
+    
+    scanner = FileScanner()
+    source_files = scanner.scan_directory(root_path)
+    if not source_files:
+        raise ValueError("분석할 소스 파일을 찾을 수 없습니다")
+    
+    plan = SamplePlan.build(source_files, scanner.file_sizes, root_path, seed,
+                            ANALYSIS_CONFIG["sample_directory_depth"])
+    target = sample_size(sample, len(source_files))
+    limit = len(source_files) if deadline is not None else target
+    logger.info(f"표본 분석: 전체 {len(source_files)}개 파일, {len(plan.population)}개 층, "
+                f"목표 {target}개" + (f", 시간 예산 {time_budget:g}초" if deadline is not None else ""))
+    
+    estimator = StratifiedEstimator(plan.population, ANALYSIS_CONFIG["sample_confidence"])
+    analyzer._preload_parsers({language for language, _ in plan.population})
+    analyzer.progress_tracker.start(limit)
+    next_checkpoint = target
+    
+    try:
+        with ThreadPoolExecutor(max_workers=analyzer.max_workers) as executor:
+            # 추출 순서대로 결과를 받으므로 중간에 멈춰도 층별로 무작위 표본이 유지됨
+            results = analyzer._bounded_map(executor, analyzer._analyze_file, plan.order[:limit], "path")
+            try:
+                for file_path, result in results:
+                    estimator.add(plan.strata[file_path], result)
+                    analyzer.progress_tracker.update()
+                    
+                    if estimator.sampled_files >= next_checkpoint and estimator.sampled_files < limit:
+                        _log_checkpoint(estimator, time.perf_counter() - start)
+                        next_checkpoint *= 2
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+            finally:
+                results.close()
+    finally:
+        analyzer.progress_tracker.finish()
+    
+    if estimator.sampled_files < target:
+        logger.warning(f"시간 예산 안에 목표 표본을 채우지 못했습니다: {estimator.sampled_files}/{target}개")
+    
+    report = estimator.report(elapsed=time.perf_counter() - start)
+    logger.info(f"표본 분석 완료: {report.sampled_files}/{report.population_files}개 파일, "
+                f"{report.elapsed:.1f}초")
+    return report
+
+def _log_checkpoint(estimator: StratifiedEstimator, elapsed: float):
+    estimate, variance, observed = estimator.estimate_total(lambda obs: obs["total_calls"])
+    low, high = estimator.interval(estimate, variance, floor=observed)
+    logger.info(f"중간 추정 ({estimator.sampled_files}개 파일, {elapsed:.1f}초): "
+                f"전체 호출 {estimate:.0f} [{low:.0f}, {high:.0f}]")
+
+def _stratum_key(file_path: Path, root_path: Path, directory_depth: int) -> Stratum:
+    language = get_language_by_extension(file_path.suffix) or "unknown"
+    try:
+        parts = file_path.relative_to(root_path).parent.parts[:max(1, directory_depth)]
+    except ValueError:
+        parts = ()
+    return language, "/".join(parts) or "."
+
+def _variance(values: List[float], mean: float) -> float:
+    if len(values) < 2:
+        return 0.0
+    return sum((value - mean) ** 2 for value in values) / (len(values) - 1)
+
+def _estimate_entry(estimate: float, low: Optional[float], high: Optional[float], method: str) -> Dict[str, Any]:
+    return {"estimate": estimate, "low": low, "high": high, "method": method}
+
+def _format_number(value: float) -> str:
+    return f"{value:.2f}" if isinstance(value, float) and not value.is_integer() else f"{value:.0f}"
@@ -0,0 +1,182 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+from .models import CallTree, FunctionInfo, FunctionCall, FunctionMetrics
+
+JSON_ENCODERS = ("auto", "orjson", "json")
+# 워커에서 함수별로 미리 인코딩할 수 있는 출력 형식
+FRAGMENT_FORMATS = ("json", "jsonl")
+
+class JsonEncoder:
+    """표준 json 모듈 인코더 (ensure_ascii=False)"""
+    name = "json"
+    
+    def dumps(self, data: Any, indent: bool = False) -> str:
+        """indent이면 2칸 들여쓰기, 아니면 공백 없는 한 줄로 인코딩"""
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+class OrjsonEncoder(JsonEncoder):
+    """orjson 인코더 (표준 json과 같은 형식의 텍스트 생성)"""
+    name = "orjson"
+    
+    def __init__(self, module):
+        self._orjson = module
+    
+    def dumps(self, data: Any, indent: bool = False) -> str:
+        option = self._orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= self._orjson.OPT_INDENT_2
+        return self._orjson.dumps(data, option=option).decode("utf-8")
+
+@lru_cache(maxsize=None)
+def get_json_encoder(backend: str = "auto") -> JsonEncoder:
+    """JSON 인코더 선택 (auto: orjson이 설치되어 있으면 사용, 없으면 표준 json)"""
+    if backend not in JSON_ENCODERS:
+        raise ValueError(f"지원하지 않는 JSON 인코더: {backend}")
+    if backend == "json":
+        return JsonEncoder()
+    
+    try:
+        import orjson
+    except ImportError:
+        if backend == "orjson":
+            raise ImportError("orjson이 설치되어 있지 않습니다 (pip install orjson)")
+        return JsonEncoder()
+    return OrjsonEncoder(orjson)
+
+def call_to_dict(call: FunctionCall) -> Dict[str, Any]:
+    """호출 정보를 JSON 직렬화 가능한 형태로 변환 (집계 필드는 있을 때만 포함)"""
+    data = {
+        "name": call.name,
+        "line": call.line,
+        "column": call.column,
+        "kind": call.kind
+    }
+    if call.count != 1 or call.sites is not None:
+        data["count"] = call.count
+    if call.sites is not None:
+        data["sites"] = [[line, column] for line, column in call.sites]
+    return data
+
+def call_from_dict(data: Dict[str, Any]) -> FunctionCall:
+    """직렬화된 호출 정보 복원"""
+    sites = data.get("sites")
+    return FunctionCall(
+        name=data["name"],
+        line=data["line"],
+        column=data.get("column"),
+        kind=data.get("kind", "internal"),
+        count=data.get("count", 1),
+        sites=[(line, column) for line, column in sites] if sites is not None else None
+    )
+
+def metrics_to_dict(metrics: FunctionMetrics) -> Dict[str, Any]:
+    """함수 지표를 JSON 직렬화 가능한 형태로 변환 (순환 복잡도 포함)"""
+    return {
+        "end_line": metrics.end_line,
+        "start_byte": metrics.start_byte,
+        "end_byte": metrics.end_byte,
+        "lines": metrics.lines,
+        "branches": metrics.branches,
+        "complexity": metrics.complexity,
+        "max_nesting": metrics.max_nesting,
+        "parameters": metrics.parameters
+    }
+
+def metrics_from_dict(data: Dict[str, Any]) -> FunctionMetrics:
+    """직렬화된 함수 지표 복원"""
+    return FunctionMetrics(
+        end_line=data["end_line"],
+        start_byte=data.get("start_byte", 0),
+        end_byte=data.get("end_byte", 0),
+        lines=data.get("lines", 0),
+        branches=data.get("branches", 0),
+        max_nesting=data.get("max_nesting", 0),
+        parameters=data.get("parameters", 0)
+    )
+
+def function_to_dict(func_info: FunctionInfo) -> Dict[str, Any]:
+    """함수 정보를 JSON 직렬화 가능한 형태로 변환 (지표는 계산한 경우에만 포함)"""
+    data = {
+        "name": func_info.name,
+        "file": str(func_info.file_path),
+        "line": func_info.line,
+        "column": func_info.column,
+        "calls": [call_to_dict(call) for call in func_info.calls]
+    }
+    if func_info.metrics is not None:
+        data["metrics"] = metrics_to_dict(func_info.metrics)
+    return data
+
+def function_from_dict(data: Dict[str, Any]) -> FunctionInfo:
+    """직렬화된 함수 정보 복원"""
+    metrics = data.get("metrics")
+    return FunctionInfo(
+        name=data["name"],
+        file_path=Path(data["file"]),
+        line=data["line"],
+        column=data.get("column"),
+        calls=[call_from_dict(call) for call in data.get("calls", [])],
+        metrics=metrics_from_dict(metrics) if metrics is not None else None
+    )
+
+def call_tree_to_dict(call_tree: CallTree) -> Dict[str, Any]:
+    """호출 트리를 JSON 직렬화 가능한 형태로 변환"""
+    return {
+        "functions": {
+            func_name: function_to_dict(func_info)
+            for func_name, func_info in call_tree.functions.items()
+        }
+    }
+
+def call_tree_from_dict(data: Dict[str, Any]) -> CallTree:
+    """format_output이 만든 JSON 데이터에서 호출 트리 복원"""
+    call_tree = CallTree()
+    for func_data in data.get("functions", {}).values():
+        call_tree.add_function(function_from_dict(func_data))
+    return call_tree
+
+def load_call_tree(path: str) -> CallTree:
+    """저장된 JSON 분석 결과 파일에서 호출 트리 로드"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return call_tree_from_dict(json.load(f))
+
+def function_fragment(full_name: str, func_info: FunctionInfo, format_type: str,
+                      encoder: Optional[JsonEncoder] = None) -> str:
+    """함수 하나를 출력 문서에 그대로 붙일 수 있는 텍스트 조각으로 인코딩
+    
+    json: format_output의 "functions" 객체 안의 항목 (들여쓰기 포함)
+    jsonl: 함수 레코드 한 줄
+    """
+    encoder = encoder or get_json_encoder()
+    data = function_to_dict(func_info)
+    if format_type == "jsonl":
+        return encoder.dumps({"type": "function", "id": full_name, **data})
+    if format_type == "json":
+        body = encoder.dumps(data, indent=True).replace("\n", "\n    ")
+        return f"    {encoder.dumps(full_name)}: {body}"
+    raise ValueError(f"조각으로 인코딩할 수 없는 출력 형식: {format_type}")
+
+def assemble_json_document(function_fragments: Optional[Iterable[str]], sections: Dict[str, Any],
+                           encoder: Optional[JsonEncoder] = None) -> str:
+    """함수 조각과 나머지 항목을 이어 붙여 JSON 문서 생성
+    
+    결과는 json.dumps(data, indent=2, ensure_ascii=False)와 같다. function_fragments가
+    None이면 "functions" 항목을 넣지 않는다.
+    """
+    encoder = encoder or get_json_encoder()
+    entries = []
+    if function_fragments is not None:
+        fragments = ",\n".join(function_fragments)
+        entries.append(f'  "functions": {{\n{fragments}\n  }}' if fragments else '  "functions": {}')
+    for key, value in sections.items():
+        body = encoder.dumps(value, indent=True).replace("\n", "\n  ")
+        entries.append(f"  {encoder.dumps(key)}: {body}")
+    
+    if not entries:
+        return "{}"
+    return "{\n" + ",\n".join(entries) + "\n}"
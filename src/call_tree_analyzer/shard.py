@@ -0,0 +1,215 @@
+import hashlib
+import heapq
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Iterable, Any
+
+from .models import CallTree, CallTreeBuilder, ProjectInfo, FileInfo
+from .config import ANALYSIS_CONFIG
+from .serialization import function_to_dict, function_from_dict
+
+logger = logging.getLogger(__name__)
+
+SHARD_STRATEGIES = ("hash", "size")
+PARTIAL_FORMAT = "call_tree_partial"
+PARTIAL_FORMAT_VERSION = 1
+
+# 샤드 간에 같아야 결과를 합칠 수 있는 분석 설정
+_SHARD_CONFIG_KEYS = ("include_builtin_calls", "include_external_calls", "edge_mode",
+                      "include_anonymous_functions", "function_metrics", "max_file_size_mb", "large_file_mode",
+                      "large_file_limit_mb", "deduplicate_files",
+                      "include_paths", "exclude_paths", "languages", "include_functions",
+                      "exclude_functions")
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """여러 머신에 나눠 분석할 때 이 실행이 맡는 파일 묶음 (index는 1부터)"""
+    index: int
+    count: int
+    strategy: str = "hash"
+    
+    def __post_init__(self):
+        if self.count < 1 or not 1 <= self.index <= self.count:
+            raise ValueError(f"잘못된 샤드 번호: {self.index}/{self.count}")
+        if self.strategy not in SHARD_STRATEGIES:
+            raise ValueError(f"지원하지 않는 샤드 분할 방식: {self.strategy}")
+    
+    @classmethod
+    def parse(cls, spec: str, strategy: str = "hash") -> "ShardSpec":
+        """"K/N" 형식의 샤드 지정 해석"""
+        try:
+            index, count = (int(part) for part in spec.split("/", 1))
+        except ValueError:
+            raise ValueError(f"샤드는 K/N 형식이어야 합니다: {spec}")
+        return cls(index=index, count=count, strategy=strategy)
+    
+    def select(self, files: List[Path], root_path: Path) -> List[Path]:
+        """전체 파일 목록 중 이 샤드가 분석할 파일 반환"""
+        return partition_files(files, root_path, self.count, self.strategy)[self.index - 1]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"index": self.index, "count": self.count, "strategy": self.strategy}
+
+def partition_files(files: Iterable[Path], root_path: Path, count: int,
+                    strategy: str = "hash") -> List[List[Path]]:
+    """파일 목록을 count개로 결정적으로 분할
+    
+    hash: 루트 기준 상대 경로의 해시로 분할 (파일이 추가/삭제되어도 나머지 배치는 유지)
+    size: 파일 크기 합이 비슷하도록 큰 파일부터 가장 가벼운 묶음에 배치
+    두 방식 모두 스캔 순서나 머신과 무관하게 같은 결과를 만든다.
+    """
+    keyed = sorted((_relative_key(path, root_path), path) for path in files)
+    shards: List[List[Path]] = [[] for _ in range(count)]
+    
+    if strategy == "hash":
+        for key, path in keyed:
+            digest = hashlib.blake2b(key.encode("utf-8", errors="surrogateescape"), digest_size=8).digest()
+            shards[int.from_bytes(digest, "big") % count].append(path)
+        return shards
+    
+    if strategy == "size":
+        sized = sorted(((-_file_size(path), key, path) for key, path in keyed))
+        bins = [(0, index) for index in range(count)]
+        for negative_size, _, path in sized:
+            total, index = heapq.heappop(bins)
+            shards[index].append(path)
+            heapq.heappush(bins, (total - negative_size, index))
+        return [sorted(shard, key=lambda path: _relative_key(path, root_path)) for shard in shards]
+    
+    raise ValueError(f"지원하지 않는 샤드 분할 방식: {strategy}")
+
+def write_partial(output_path: Optional[str], call_tree: CallTree, project_info: ProjectInfo,
+                  shard: ShardSpec) -> str:
+    """샤드 분석 결과를 부분 결과 파일(JSON)로 직렬화
+    
+    경로는 프로젝트 루트 기준 상대 경로로 기록하므로 체크아웃 위치가 다른
+    머신의 결과도 합칠 수 있다. output_path가 없으면 JSON 문자열만 반환한다.
+    """
+    root_path = project_info.root_path
+    data = {
+        "format": PARTIAL_FORMAT,
+        "version": PARTIAL_FORMAT_VERSION,
+        "shard": shard.to_dict(),
+        "root": str(root_path),
+        "config": {key: ANALYSIS_CONFIG.get(key) for key in _SHARD_CONFIG_KEYS},
+        "files": [
+            {
+                "path": _relative_key(info.path, root_path),
+                "language": info.language,
+                "line_count": info.line_count,
+                "function_count": info.function_count,
+                "errors": [list(error) for error in info.errors],
+                "duplicate_of": _relative_key(info.duplicate_of, root_path) if info.duplicate_of else None,
+                "truncated": info.truncated,
+                "skipped": info.skipped
+            }
+            for info in sorted(project_info.files.values(), key=lambda info: str(info.path))
+        ],
+        "functions": []
+    }
+    for func_info in call_tree.functions.values():
+        func_data = function_to_dict(func_info)
+        func_data["file"] = _relative_key(func_info.file_path, root_path)
+        data["functions"].append(func_data)
+    
+    content = json.dumps(data, ensure_ascii=False)
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    return content
+
+def load_partial(path: str) -> Dict[str, Any]:
+    """부분 결과 파일 로드 및 형식 확인"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    if data.get("format") != PARTIAL_FORMAT:
+        raise ValueError(f"샤드 부분 결과 파일이 아닙니다: {path}")
+    if data.get("version") != PARTIAL_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 부분 결과 버전: {data.get('version')} ({path})")
+    return data
+
+def merge_partials(paths: List[str], root_path: Optional[Path] = None) -> Tuple[CallTree, ProjectInfo]:
+    """N개의 부분 결과를 하나의 호출 트리와 프로젝트 정보로 병합
+    
+    모든 샤드(1..N)가 정확히 한 번씩 있어야 하며, 결과는 같은 설정으로 한 번에
+    분석한 것과 같다. root_path를 생략하면 첫 번째 부분 결과의 루트를 사용한다.
+    """
+    partials = [load_partial(path) for path in paths]
+    if not partials:
+        raise ValueError("병합할 부분 결과가 없습니다")
+    
+    _validate_partials(partials, paths)
+    
+    root_path = Path(root_path or partials[0]["root"]).resolve()
+    project_info = ProjectInfo(root_path=root_path)
+    builder = CallTreeBuilder()
+    
+    for data in sorted(partials, key=lambda data: data["shard"]["index"]):
+        functions_by_file = defaultdict(list)
+        for func_data in data["functions"]:
+            func_data = dict(func_data, file=str(root_path / func_data["file"]))
+            func_info = function_from_dict(func_data)
+            functions_by_file[func_info.file_path].append(func_info)
+        
+        for file_data in data["files"]:
+            file_path = root_path / file_data["path"]
+            file_info = FileInfo(
+                path=file_path,
+                language=file_data["language"],
+                line_count=file_data.get("line_count", 0),
+                function_count=file_data.get("function_count", 0),
+                errors=[tuple(error) for error in file_data.get("errors", [])],
+                truncated=file_data.get("truncated"),
+                skipped=file_data.get("skipped", False)
+            )
+            if file_data.get("duplicate_of"):
+                file_info.duplicate_of = root_path / file_data["duplicate_of"]
+                project_info.duplicate_files[file_path] = file_info.duplicate_of
+            project_info.add_file(file_info)
+            functions = functions_by_file.pop(file_path, [])
+            builder.add_functions(functions)
+            project_info.rollup.add_functions(file_path, file_info.language, functions)
+        
+        # 파일 정보 없이 함수만 있는 경우 (수동으로 만든 부분 결과 등)
+        for file_path, functions in functions_by_file.items():
+            builder.add_functions(functions)
+    
+    call_tree = builder.build()
+    call_tree.sort_functions()
+    logger.info(f"부분 결과 {len(partials)}개 병합: 파일 {len(project_info.files)}개, "
+                f"함수 {len(call_tree.functions)}개")
+    return call_tree, project_info
+
+def _validate_partials(partials: List[Dict[str, Any]], paths: List[str]):
+    counts = {data["shard"]["count"] for data in partials}
+    strategies = {data["shard"]["strategy"] for data in partials}
+    if len(counts) != 1 or len(strategies) != 1:
+        raise ValueError("샤드 수 또는 분할 방식이 다른 부분 결과는 병합할 수 없습니다")
+    
+    count = counts.pop()
+    indices = [data["shard"]["index"] for data in partials]
+    missing = sorted(set(range(1, count + 1)) - set(indices))
+    duplicated = sorted({index for index in indices if indices.count(index) > 1})
+    if missing or duplicated:
+        raise ValueError(f"샤드 구성이 올바르지 않습니다 (누락: {missing}, 중복: {duplicated})")
+    
+    first_config = partials[0].get("config")
+    for data, path in zip(partials[1:], paths[1:]):
+        if data.get("config") != first_config:
+            logger.warning(f"분석 설정이 다른 부분 결과: {path}")
+
+def _relative_key(path: Path, root_path: Path) -> str:
+    try:
+        return Path(path).relative_to(root_path).as_posix()
+    except ValueError:
+        return Path(path).as_posix()
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
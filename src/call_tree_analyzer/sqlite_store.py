@@ -0,0 +1,397 @@
+import sqlite3
+import json
+import logging
+from pathlib import Path
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Iterator, Iterable, Tuple, Any
+
+from .models import CallTree, FunctionInfo, FunctionCall, FunctionMetrics, ProjectInfo
+from .config import get_language_by_extension
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1  # 테이블이나 컬럼이 바뀌면 올림 (다른 버전의 데이터베이스는 열지 않음)
+
+_SCHEMA = """
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    language TEXT,
+    line_count INTEGER,
+    function_count INTEGER
+);
+CREATE TABLE functions (
+    id INTEGER PRIMARY KEY,
+    full_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    line INTEGER,
+    "column" INTEGER,
+    fan_out INTEGER NOT NULL DEFAULT 0,
+    end_line INTEGER,
+    start_byte INTEGER,
+    end_byte INTEGER,
+    lines INTEGER,
+    branches INTEGER,
+    complexity INTEGER,
+    max_nesting INTEGER,
+    parameters INTEGER
+);
+CREATE TABLE calls (
+    caller_id INTEGER NOT NULL REFERENCES functions(id),
+    callee_name TEXT NOT NULL,
+    line INTEGER,
+    "column" INTEGER,
+    kind TEXT NOT NULL DEFAULT 'internal',
+    count INTEGER NOT NULL DEFAULT 1,
+    sites TEXT
+);
+"""
+
+# 대량 삽입 후에 생성하는 인덱스
+_INDEXES = """
+CREATE UNIQUE INDEX idx_functions_full_name ON functions(full_name);
+CREATE INDEX idx_functions_name ON functions(name);
+CREATE INDEX idx_functions_file ON functions(file_id);
+CREATE INDEX idx_functions_fan_out ON functions(fan_out);
+CREATE INDEX idx_calls_callee ON calls(callee_name);
+CREATE INDEX idx_calls_caller ON calls(caller_id);
+CREATE INDEX idx_files_language ON files(language);
+"""
+
+_FUNCTION_COLUMNS = ('f.id, f.name, fi.path, f.line, f."column", '
+                     'f.end_line, f.start_byte, f.end_byte, f.lines, f.branches, f.max_nesting, f.parameters')
+
+class SQLiteStore:
+    """호출 그래프를 인덱스가 있는 SQLite 데이터베이스로 저장/조회"""
+    
+    def __init__(self, db_path: str, batch_size: int = 50000):
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        # 트랜잭션은 직접 관리 (대량 삽입을 하나의 트랜잭션으로 묶기 위해)
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False,
+                                          isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=OFF")
+    
+    def close(self):
+        """연결 종료"""
+        self.connection.close()
+    
+    def __enter__(self) -> "SQLiteStore":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    # ---- 쓰기 ----
+    
+    def write(self, call_tree: CallTree, project_info: Optional[ProjectInfo] = None):
+        """호출 트리 전체를 하나의 트랜잭션으로 기록 (기존 내용은 대체)"""
+        conn = self.connection
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("BEGIN")
+        
+        try:
+            for table in ("calls", "functions", "files", "metadata"):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+            _execute_statements(conn, _SCHEMA)
+            
+            file_ids = self._insert_files(call_tree, project_info)
+            self._insert_functions(call_tree, file_ids)
+            
+            metadata = {"schema_version": str(SCHEMA_VERSION)}
+            if project_info is not None:
+                metadata["root_path"] = str(project_info.root_path)
+            conn.executemany("INSERT INTO metadata (key, value) VALUES (?, ?)", metadata.items())
+            
+            # 인덱스는 데이터 삽입 후 한 번에 생성하는 편이 빠름
+            _execute_statements(conn, _INDEXES)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.execute("PRAGMA synchronous=NORMAL")
+        
+        conn.execute("ANALYZE")
+    
+    def _insert_files(self, call_tree: CallTree,
+                      project_info: Optional[ProjectInfo]) -> Dict[str, int]:
+        files: Dict[str, Tuple[Optional[str], int, int]] = {}
+        if project_info is not None:
+            for info in project_info.files.values():
+                files[str(info.path)] = (info.language, info.line_count, info.function_count)
+        
+        for func in call_tree.functions.values():
+            path = str(func.file_path)
+            if path not in files:
+                files[path] = (get_language_by_extension(func.file_path.suffix), 0, 0)
+        
+        file_ids = {}
+        rows = []
+        for file_id, (path, (language, line_count, function_count)) in enumerate(sorted(files.items()), 1):
+            file_ids[path] = file_id
+            rows.append((file_id, path, language, line_count, function_count))
+        
+        self.connection.executemany(
+            "INSERT INTO files (id, path, language, line_count, function_count) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+        return file_ids
+    
+    def _insert_functions(self, call_tree: CallTree, file_ids: Dict[str, int]):
+        function_rows = []
+        call_rows = []
+        
+        for func_id, func in enumerate(call_tree.functions.values(), 1):
+            fan_out = len({call.name for call in func.calls})
+            metrics = func.metrics
+            # 함수 지표는 function_metrics로 계산한 경우에만 기록 (아니면 NULL)
+            metric_values = ((metrics.end_line, metrics.start_byte, metrics.end_byte, metrics.lines,
+                              metrics.branches, metrics.complexity, metrics.max_nesting, metrics.parameters)
+                             if metrics is not None else (None,) * 8)
+            function_rows.append((func_id, func.full_name, func.name, file_ids[str(func.file_path)],
+                                  func.line, func.column, fan_out) + metric_values)
+            call_rows.extend((func_id, call.name, call.line, call.column, call.kind, call.count,
+                              _encode_sites(call.sites))
+                             for call in func.calls)
+            
+            if len(call_rows) >= self.batch_size:
+                self._flush(function_rows, call_rows)
+        
+        self._flush(function_rows, call_rows)
+    
+    def _flush(self, function_rows: List[tuple], call_rows: List[tuple]):
+        self.connection.executemany(
+            'INSERT INTO functions (id, full_name, name, file_id, line, "column", fan_out, '
+            'end_line, start_byte, end_byte, lines, branches, complexity, max_nesting, parameters) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            function_rows
+        )
+        self.connection.executemany(
+            'INSERT INTO calls (caller_id, callee_name, line, "column", kind, count, sites) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            call_rows
+        )
+        function_rows.clear()
+        call_rows.clear()
+    
+    # ---- 조회 ----
+    
+    def check_schema(self):
+        """저장된 스키마 버전이 현재 버전과 같은지 확인 (다르면 ValueError)"""
+        try:
+            rows = self.execute("SELECT value FROM metadata WHERE key = 'schema_version'")
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"호출 트리 SQLite 데이터베이스가 아닙니다: {self.db_path} ({e})") from e
+        
+        version = rows[0][0] if rows else None
+        if version != str(SCHEMA_VERSION):
+            raise ValueError(f"지원하지 않는 SQLite 스키마 버전: {version} (현재 {SCHEMA_VERSION}, "
+                             f"{self.db_path}을 --format sqlite로 다시 생성하세요)")
+    
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> List[tuple]:
+        """임의의 읽기 쿼리 실행"""
+        return self.connection.execute(sql, tuple(params)).fetchall()
+    
+    def count_functions(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM functions").fetchone()[0]
+    
+    def get_function(self, full_name: str) -> Optional[FunctionInfo]:
+        """전체 이름으로 함수 조회"""
+        row = self.connection.execute(
+            f"SELECT {_FUNCTION_COLUMNS} FROM functions f JOIN files fi ON fi.id = f.file_id "
+            "WHERE f.full_name = ?",
+            (full_name,)
+        ).fetchone()
+        return self._load_functions([row])[0] if row else None
+    
+    def iter_function_names(self) -> Iterator[str]:
+        for (full_name,) in self.connection.execute("SELECT full_name FROM functions ORDER BY id"):
+            yield full_name
+    
+    def iter_functions(self, chunk_size: int = 1000) -> Iterator[FunctionInfo]:
+        """모든 함수를 청크 단위로 로드하며 순회"""
+        cursor = self.connection.execute(
+            f"SELECT {_FUNCTION_COLUMNS} FROM functions f JOIN files fi ON fi.id = f.file_id ORDER BY f.id"
+        )
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from self._load_functions(rows)
+    
+    def get_callers(self, function_name: str, directory: Optional[str] = None,
+                    language: Optional[str] = None) -> List[FunctionInfo]:
+        """특정 함수를 호출하는 함수들 (디렉터리/언어로 제한 가능)"""
+        sql = (f"SELECT {_FUNCTION_COLUMNS} FROM functions f JOIN files fi ON fi.id = f.file_id "
+               "WHERE f.id IN (SELECT caller_id FROM calls WHERE callee_name = ?)")
+        params: List[Any] = [function_name]
+        sql, params = self._add_file_filters(sql, params, directory, language)
+        rows = self.connection.execute(sql + " ORDER BY f.id", params).fetchall()
+        return self._load_functions(rows)
+    
+    def get_callees(self, full_name: str) -> List[FunctionCall]:
+        """특정 함수가 호출하는 함수들"""
+        rows = self.connection.execute(
+            'SELECT c.callee_name, c.line, c."column", c.kind, c.count, c.sites FROM calls c '
+            "JOIN functions f ON f.id = c.caller_id WHERE f.full_name = ? ORDER BY c.rowid",
+            (full_name,)
+        ).fetchall()
+        return [FunctionCall(name=name, line=line, column=column, kind=kind, count=count,
+                             sites=_decode_sites(sites))
+                for name, line, column, kind, count, sites in rows]
+    
+    def find_functions(self, min_fan_out: Optional[int] = None, language: Optional[str] = None,
+                       directory: Optional[str] = None, name: Optional[str] = None) -> List[FunctionInfo]:
+        """조건으로 함수 검색 (예: C 파일 중 팬아웃 50 초과)"""
+        sql = f"SELECT {_FUNCTION_COLUMNS} FROM functions f JOIN files fi ON fi.id = f.file_id WHERE 1=1"
+        params: List[Any] = []
+        if min_fan_out is not None:
+            sql += " AND f.fan_out >= ?"
+            params.append(min_fan_out)
+        if name is not None:
+            sql += " AND f.name = ?"
+            params.append(name)
+        sql, params = self._add_file_filters(sql, params, directory, language)
+        rows = self.connection.execute(sql + " ORDER BY f.id", params).fetchall()
+        return self._load_functions(rows)
+    
+    def get_orphaned_functions(self) -> List[FunctionInfo]:
+        """호출되지 않는 함수들"""
+        rows = self.connection.execute(
+            f"SELECT {_FUNCTION_COLUMNS} FROM functions f JOIN files fi ON fi.id = f.file_id "
+            "WHERE NOT EXISTS (SELECT 1 FROM calls c WHERE c.callee_name = f.name) ORDER BY f.id"
+        ).fetchall()
+        return self._load_functions(rows)
+    
+    @staticmethod
+    def _add_file_filters(sql: str, params: List[Any], directory: Optional[str],
+                          language: Optional[str]) -> Tuple[str, List[Any]]:
+        if directory is not None:
+            # files.path의 UNIQUE 인덱스를 쓰는 범위 조건 ("dir/" 이상 "dir0" 미만)
+            prefix = str(directory).rstrip("/\\") + "/"
+            sql += " AND fi.path >= ? AND fi.path < ?"
+            params.extend([prefix, prefix[:-1] + chr(ord("/") + 1)])
+        if language is not None:
+            sql += " AND fi.language = ?"
+            params.append(language)
+        return sql, params
+    
+    def _load_functions(self, rows: List[tuple]) -> List[FunctionInfo]:
+        """함수 행과 해당 함수들의 호출 목록을 한 번의 쿼리로 로드 (지표 컬럼이 있으면 지표도 복원)"""
+        functions = {}
+        for func_id, name, path, line, column, end_line, *metric_values in rows:
+            metrics = FunctionMetrics(end_line, *metric_values) if end_line is not None else None
+            functions[func_id] = FunctionInfo(name=name, file_path=Path(path), line=line, column=column,
+                                              metrics=metrics)
+        
+        ids = list(functions)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for caller_id, callee, line, column, kind, count, sites in self.connection.execute(
+                f'SELECT caller_id, callee_name, line, "column", kind, count, sites FROM calls '
+                f"WHERE caller_id IN ({placeholders}) ORDER BY rowid",
+                chunk
+            ):
+                functions[caller_id].calls.append(
+                    FunctionCall(name=callee, line=line, column=column, kind=kind, count=count,
+                                 sites=_decode_sites(sites)))
+        
+        return list(functions.values())
+
+class _SQLiteFunctionMap(Mapping):
+    """CallTree.functions와 같은 형태의 읽기 전용 지연 로딩 매핑"""
+    
+    def __init__(self, store: SQLiteStore):
+        self._store = store
+    
+    def __getitem__(self, full_name: str) -> FunctionInfo:
+        func = self._store.get_function(full_name)
+        if func is None:
+            raise KeyError(full_name)
+        return func
+    
+    def __iter__(self) -> Iterator[str]:
+        return self._store.iter_function_names()
+    
+    def __len__(self) -> int:
+        return self._store.count_functions()
+    
+    def values(self):
+        return self._store.iter_functions()
+    
+    def items(self):
+        return ((func.full_name, func) for func in self._store.iter_functions())
+
+class SQLiteCallTree(CallTree):
+    """SQLite 저장소를 백엔드로 하는 읽기 전용 호출 트리
+    
+    전체 그래프를 메모리에 올리지 않고 get_callers/get_callees 등을 인덱스 쿼리로
+    처리한다. functions는 필요할 때마다 로드하는 매핑이다.
+    """
+    
+    def __init__(self, store: SQLiteStore):
+        self.store = store
+        self.functions = _SQLiteFunctionMap(store)
+    
+    @classmethod
+    def open(cls, db_path: str) -> "SQLiteCallTree":
+        """저장된 데이터베이스 열기 (없거나 스키마 버전이 다르면 오류)"""
+        if not Path(db_path).is_file():
+            raise FileNotFoundError(f"SQLite 데이터베이스가 존재하지 않습니다: {db_path}")
+        try:
+            store = SQLiteStore(db_path)
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"호출 트리 SQLite 데이터베이스가 아닙니다: {db_path} ({e})") from e
+        
+        try:
+            store.check_schema()
+        except ValueError:
+            store.close()
+            raise
+        return cls(store)
+    
+    def add_function(self, func_info: FunctionInfo):
+        raise TypeError("SQLiteCallTree는 읽기 전용입니다")
+    
+    def get_function(self, full_name: str) -> Optional[FunctionInfo]:
+        return self.store.get_function(full_name)
+    
+    def get_callers(self, function_name: str) -> List[FunctionInfo]:
+        return self.store.get_callers(function_name)
+    
+    def get_callees(self, function_name: str) -> List[FunctionCall]:
+        return self.store.get_callees(function_name)
+    
+    def get_all_functions(self) -> List[str]:
+        return list(self.store.iter_function_names())
+    
+    def get_orphaned_functions(self) -> List[FunctionInfo]:
+        return self.store.get_orphaned_functions()
+
+def _encode_sites(sites: Optional[List[Tuple[int, Optional[int]]]]) -> Optional[str]:
+    """집계 모드의 호출 위치 목록을 JSON 문자열로 변환 (위치를 기록하지 않았으면 NULL)"""
+    return json.dumps(sites, separators=(",", ":")) if sites is not None else None
+
+def _decode_sites(sites: Optional[str]) -> Optional[List[Tuple[int, Optional[int]]]]:
+    """_encode_sites()로 저장한 호출 위치 목록 복원"""
+    if sites is None:
+        return None
+    return [(line, column) for line, column in json.loads(sites)]
+
+def _execute_statements(conn: sqlite3.Connection, script: str):
+    for statement in script.split(";"):
+        if statement.strip():
+            conn.execute(statement)
+
+def write_sqlite(call_tree: CallTree, db_path: str, project_info: Optional[ProjectInfo] = None):
+    """호출 트리를 SQLite 파일로 저장"""
+    with SQLiteStore(db_path) as store:
+        store.write(call_tree, project_info)
@@ -1,98 +1,328 @@
 import os
+import re
+import sys
+import json
 import time
+import random
+import hashlib
 import logging
+import itertools
+import threading
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, Callable, TextIO, Iterable
 from dataclasses import dataclass, field
 from collections import defaultdict, Counter
 
-from .config import get_supported_extensions, should_ignore_path, ANALYSIS_CONFIG
+from .config import get_supported_extensions, get_ignore_engine, get_language_by_extension, ANALYSIS_CONFIG
+from .ignore import IgnoreEngine
+from .filters import AnalysisFilter
 
 logger = logging.getLogger(__name__)
 
 class FileScanner:
     """파일 시스템 스캐너"""
     
-    def __init__(self):
-        self.supported_extensions = set(get_supported_extensions())
+    def __init__(self, ignore_engine: Optional[IgnoreEngine] = None,
+                 analysis_filter: Optional[AnalysisFilter] = None):
+        self.ignore_engine = ignore_engine or get_ignore_engine()
+        self.analysis_filter = analysis_filter or AnalysisFilter.from_config(ANALYSIS_CONFIG)
+        
+        # 언어 필터는 확장자 집합으로 바꿔 stat 전에 적용
+        self.supported_extensions = {
+            ext for ext in get_supported_extensions()
+            if self.analysis_filter.allows_language(get_language_by_extension(ext))
+        }
+        self.max_file_size = get_max_source_size()
+        self.file_sizes: Dict[Path, int] = {}  # 마지막 스캔에서 찾은 파일의 크기 (바이트)
     
     def scan_directory(self, root_path: Path) -> List[Path]:
-        """디렉터리를 재귀적으로 스캔하여 소스 파일 찾기"""
-        source_files = []
+        """디렉터리를 재귀적으로 스캔하여 소스 파일 찾기
         
-        try:
-            for file_path in root_path.rglob("*"):
-                if self._is_valid_source_file(file_path):
-                    source_files.append(file_path)
+        무시 규칙은 디렉터리마다 한 번씩 각 항목 이름에 대해서만 평가하며,
+        무시된 디렉터리와 분석 필터의 포함 경로와 무관한 디렉터리는 하위로 내려가지 않는다.
+        """
+        source_files = []
+        self.file_sizes = {}
+        engine = self.ignore_engine
+        path_filter = self.analysis_filter
+        stack = [(root_path, (), engine.enter_directory(root_path, (), engine.root_chain()),
+                  path_filter.is_included((), True))]
         
-        except PermissionError as e:
-            logger.warning(f"권한 없음: {e}")
-        except Exception as e:
-            logger.error(f"디렉터리 스캔 중 오류: {e}")
+        while stack:
+            dir_path, rel_parts, chain, included = stack.pop()
+            
+            try:
+                entries = list(os.scandir(dir_path))
+            except PermissionError as e:
+                logger.warning(f"권한 없음: {e}")
+                continue
+            except OSError as e:
+                logger.error(f"디렉터리 스캔 중 오류: {e}")
+                continue
+            
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    entry_parts = rel_parts + (entry.name,)
+                    
+                    if engine.is_ignored(chain, entry.name, entry_parts, is_dir):
+                        continue
+                    if path_filter.is_excluded(entry.name, entry_parts, is_dir):
+                        continue
+                    
+                    if is_dir:
+                        sub_included = included or path_filter.is_included(entry_parts, True)
+                        if not sub_included and not path_filter.may_contain_included(entry_parts):
+                            continue
+                        sub_path = Path(entry.path)
+                        stack.append((sub_path, entry_parts, 
+                                      engine.enter_directory(sub_path, entry_parts, chain), sub_included))
+                    elif ((included or path_filter.is_included(entry_parts, False)) and
+                          self._is_valid_source_entry(entry)):
+                        file_path = Path(entry.path)
+                        source_files.append(file_path)
+                        # DirEntry는 stat 결과를 캐시하므로 추가 시스템 호출 없음
+                        self.file_sizes[file_path] = entry.stat().st_size
+                
+                except OSError:
+                    continue
         
         return sorted(source_files)
     
-    def _is_valid_source_file(self, file_path: Path) -> bool:
-        """유효한 소스 파일인지 확인"""
-        try:
-            # 파일인지 확인
-            if not file_path.is_file():
-                return False
-            
-            # 무시 패턴 확인
-            if should_ignore_path(file_path):
-                return False
-            
-            # 확장자 확인
-            if file_path.suffix.lower() not in self.supported_extensions:
-                return False
-            
-            # 파일 크기 확인
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
-            if file_size_mb > ANALYSIS_CONFIG["max_file_size_mb"]:
-                return False
-            
-            return True
-            
-        except (OSError, PermissionError):
+    def _is_valid_source_entry(self, entry: os.DirEntry) -> bool:
+        """스캔 중인 디렉터리 항목이 유효한 소스 파일인지 확인"""
+        # 확장자 확인 (stat 호출 전에 먼저)
+        if os.path.splitext(entry.name)[1].lower() not in self.supported_extensions:
+            return False
+        
+        if not entry.is_file():
             return False
+        
+        # 파일 크기 확인
+        return entry.stat().st_size <= self.max_file_size
+
+def get_max_source_size() -> int:
+    """분석 대상 파일의 최대 크기 (바이트, large_file_mode=stream이면 대용량 파일 상한)"""
+    if ANALYSIS_CONFIG.get("large_file_mode") == "stream":
+        limit_mb = max(ANALYSIS_CONFIG["max_file_size_mb"], ANALYSIS_CONFIG["large_file_limit_mb"])
+    else:
+        limit_mb = ANALYSIS_CONFIG["max_file_size_mb"]
+    return int(limit_mb * 1024 * 1024)
+
+def count_buffer_lines(buffer, chunk_size: int = 1024 * 1024) -> int:
+    """bytes로 복사하지 않고 버퍼(mmap 등)의 줄 수 계산 (마지막 줄의 줄바꿈은 없어도 됨)"""
+    size = len(buffer)
+    lines = 0
+    for offset in range(0, size, chunk_size):
+        lines += buffer[offset:offset + chunk_size].count(b"\n")
+    if size and buffer[size - 1:size] != b"\n":
+        lines += 1
+    return lines
+
+def get_peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 상주 메모리 (MB, 측정할 수 없는 플랫폼에서는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def hash_file_contents(file_path: Path, chunk_size: int = 1024 * 1024) -> Optional[bytes]:
+    """파일 내용의 blake2b 해시 (읽기 실패 시 None)"""
+    digest = hashlib.blake2b(digest_size=20)
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.digest()
+
+def find_duplicate_files(files: Iterable[Path], executor=None) -> Dict[Path, List[Path]]:
+    """내용이 같은 소스 파일 묶기 -> {대표 파일: [중복 파일들]}
+    
+    언어와 크기가 같은 파일만 해시하므로 중복 후보가 없는 파일은 읽지 않는다.
+    대표 파일은 경로 순으로 가장 앞선 파일이며, executor가 주어지면 해시를 병렬로 계산한다.
+    """
+    by_size = defaultdict(list)
+    for file_path in files:
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            continue
+        by_size[(get_language_by_extension(file_path.suffix), size)].append(file_path)
+    
+    candidates = [(key, path) for key, paths in by_size.items() if len(paths) > 1 for path in paths]
+    if not candidates:
+        return {}
+    
+    paths = [path for _, path in candidates]
+    digests = executor.map(hash_file_contents, paths) if executor else map(hash_file_contents, paths)
+    
+    by_content = defaultdict(list)
+    for (key, file_path), digest in zip(candidates, digests):
+        if digest is not None:
+            by_content[(key, digest)].append(file_path)
+    
+    duplicates = {}
+    for paths in by_content.values():
+        if len(paths) > 1:
+            paths.sort(key=str)
+            duplicates[paths[0]] = paths[1:]
+    
+    return duplicates
+
+@dataclass
+class ProgressEvent:
+    """구조화된 진행상황 이벤트"""
+    stage: str  # "start", "update", "finish"
+    current: int
+    total: int
+    elapsed: float
+    eta: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, object]:
+        """JSON 직렬화 가능한 형태로 변환"""
+        return {
+            "stage": self.stage,
+            "current": self.current,
+            "total": self.total,
+            "elapsed": round(self.elapsed, 3),
+            "eta": round(self.eta, 3) if self.eta is not None else None
+        }
 
 class ProgressTracker:
-    """진행상황 추적기"""
+    """진행상황 추적기
     
-    def __init__(self, show_progress: bool = True):
-        self.show_progress = show_progress
+    워커는 update()로 원자적 카운터만 증가시키고, 실제 출력과 이벤트 발행은
+    refresh_interval 간격으로만 수행한다. show_progress가 None이면 출력 스트림이
+    TTY일 때만 진행상황을 표시한다.
+    """
+    
+    def __init__(self, show_progress: Optional[bool] = None, 
+                 refresh_interval: float = 0.5, stream: Optional[TextIO] = None):
+        self.stream = stream if stream is not None else sys.stderr
+        self.is_tty = _is_tty(self.stream)
+        self.show_progress = self.is_tty if show_progress is None else show_progress
+        self.refresh_interval = refresh_interval
         self.total = 0
         self.current = 0
         self.start_time = 0
+        
+        # itertools.count의 next()는 GIL 하에서 원자적이므로 잠금 없이 증가 가능
+        self._counter = itertools.count(1)
+        self._last_refresh = 0.0
+        self._refresh_lock = threading.Lock()
+        self._listeners: List[Callable[[ProgressEvent], None]] = []
+    
+    def add_listener(self, listener: Callable[[ProgressEvent], None]):
+        """진행상황 이벤트 리스너 등록"""
+        self._listeners.append(listener)
     
     def start(self, total: int):
         """진행상황 추적 시작"""
         self.total = total
         self.current = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._counter = itertools.count(1)
+        self._last_refresh = self.start_time
         
         if self.show_progress:
-            print(f"분석 시작: {total}개 파일")
+            self._write(f"분석 시작: {total}개 파일\n")
+        
+        self._emit(ProgressEvent("start", 0, total, 0.0))
     
     def update(self, increment: int = 1):
-        """진행상황 업데이트"""
-        self.current += increment
+        """진행상황 업데이트 (워커 스레드에서 호출 가능)"""
+        if increment <= 0:
+            return
+        for _ in range(increment):
+            value = next(self._counter)
+        if value > self.current:
+            self.current = value
         
-        if self.show_progress and self.total > 0:
-            percentage = (self.current / self.total) * 100
-            elapsed = time.time() - self.start_time
-            
-            if self.current > 0:
-                eta = (elapsed / self.current) * (self.total - self.current)
-                print(f"\r진행: {self.current}/{self.total} ({percentage:.1f}%) "
-                      f"경과: {elapsed:.1f}s ETA: {eta:.1f}s", end="")
+        now = time.monotonic()
+        if now - self._last_refresh < self.refresh_interval:
+            return
+        
+        # 다른 스레드가 이미 갱신 중이면 건너뜀
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            if now - self._last_refresh < self.refresh_interval:
+                return
+            self._last_refresh = now
+            self._refresh(value, now)
+        finally:
+            self._refresh_lock.release()
     
     def finish(self):
         """진행상황 추적 완료"""
+        # 카운터에서 다음 값을 뽑아 지금까지의 정확한 완료 수를 구함
+        self.current = next(self._counter) - 1
+        elapsed = time.monotonic() - self.start_time
+        
         if self.show_progress:
-            elapsed = time.time() - self.start_time
-            print(f"\n완료: {elapsed:.1f}초")
+            if self.is_tty and self.total > 0:
+                self._write(f"\r{self._format_line(self.current, elapsed)}")
+            self._write(f"\n완료: {elapsed:.1f}초\n")
+        
+        self._emit(ProgressEvent("finish", self.current, self.total, elapsed, 0.0))
+    
+    def _refresh(self, current: int, now: float):
+        """진행 표시줄 갱신 및 이벤트 발행"""
+        elapsed = now - self.start_time
+        eta = (elapsed / current) * max(self.total - current, 0) if current > 0 else None
+        
+        if self.show_progress and self.total > 0:
+            line = self._format_line(current, elapsed, eta)
+            if self.is_tty:
+                self._write(f"\r{line}")
+            else:
+                self._write(f"{line}\n")
+        
+        self._emit(ProgressEvent("update", current, self.total, elapsed, eta))
+    
+    def _format_line(self, current: int, elapsed: float, eta: Optional[float] = None) -> str:
+        percentage = (current / self.total) * 100 if self.total > 0 else 100.0
+        line = f"진행: {current}/{self.total} ({percentage:.1f}%) 경과: {elapsed:.1f}s"
+        if eta is not None:
+            line += f" ETA: {eta:.1f}s"
+        return line
+    
+    def _write(self, text: str):
+        try:
+            self.stream.write(text)
+            self.stream.flush()
+        except (OSError, ValueError):
+            # 닫힌 스트림 등은 분석 결과에 영향을 주지 않도록 무시
+            pass
+    
+    def _emit(self, event: ProgressEvent):
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.debug(f"진행상황 리스너 오류: {e}")
+
+class ProgressEventWriter:
+    """진행상황 이벤트를 JSON Lines로 기록하는 리스너"""
+    
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+    
+    def __call__(self, event: ProgressEvent):
+        self.stream.write(json.dumps(event.to_dict(), ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+def _is_tty(stream) -> bool:
+    """스트림이 대화형 터미널인지 확인"""
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
 
 @dataclass
 class ErrorInfo:
@@ -102,12 +332,39 @@ class ErrorInfo:
     context: str = ""
     timestamp: float = field(default_factory=time.time)
 
+# 메시지 템플릿 추출용 치환 규칙 (순서 중요)
+_TEMPLATE_RULES = [
+    (re.compile(r"'[^']*'|\"[^\"]*\""), "<str>"),
+    (re.compile(r"(?:[A-Za-z]:)?[\w.-]*(?:[\\/][^\s\\/:]+)+[\\/]?"), "<path>"),
+    (re.compile(r"0x[0-9a-fA-F]+"), "<hex>"),
+    (re.compile(r"\d+"), "<n>"),
+]
+
+def message_template(message: str) -> str:
+    """오류 메시지에서 경로, 숫자, 문자열 리터럴을 치환한 템플릿 반환"""
+    for pattern, replacement in _TEMPLATE_RULES:
+        message = pattern.sub(replacement, message)
+    return message
+
 class ErrorHandler:
-    """오류 처리 및 수집기"""
+    """오류 처리 및 수집기
+    
+    모든 오류를 보관하지 않고 카테고리별 카운터, 메시지 템플릿별 카운터,
+    카테고리별 표본(reservoir sampling)만 유지한다. 개별 오류는 DEBUG로만
+    기록하고, 분석 종료 시 log_summary()로 한 번만 요약을 남긴다.
+    """
     
-    def __init__(self):
-        self.errors: List[ErrorInfo] = []
+    OVERFLOW_TEMPLATE = "<기타>"
+    
+    def __init__(self, max_samples: int = 5, max_templates: int = 200):
+        self.max_samples = max_samples
+        self.max_templates = max_templates
         self.error_counts: Counter = Counter()
+        self.template_counts: Counter = Counter()  # (category, template) -> count
+        self._exemplars: Dict[Tuple[str, str], ErrorInfo] = {}
+        self._samples: Dict[str, List[ErrorInfo]] = defaultdict(list)
+        self._random = random.Random(0)
+        self._lock = threading.Lock()
     
     def log_error(self, category: str, message: str, context: str = ""):
         """오류 로깅"""
@@ -117,22 +374,103 @@ class ErrorHandler:
             context=context
         )
         
-        self.errors.append(error_info)
-        self.error_counts[category] += 1
+        with self._lock:
+            self._record(error_info, message_template(message))
+        
+        logger.debug(f"[{category}] {message} {context}")
+    
+    def record_file_errors(self, file_info):
+        """파일 분석 결과에 담긴 오류들을 수집"""
+        for category, message in file_info.errors:
+            self.log_error(category, message, str(file_info.path))
+    
+    def _record(self, error_info: ErrorInfo, template: str):
+        self._count(error_info, template, 1)
+        
+        # 카테고리별 reservoir sampling
+        samples = self._samples[error_info.category]
+        if len(samples) < self.max_samples:
+            samples.append(error_info)
+        else:
+            index = self._random.randrange(self.error_counts[error_info.category])
+            if index < self.max_samples:
+                samples[index] = error_info
+    
+    def _count(self, error_info: ErrorInfo, template: str, count: int):
+        category = error_info.category
+        self.error_counts[category] += count
+        
+        key = (category, template)
+        if key not in self.template_counts and len(self.template_counts) >= self.max_templates:
+            key = (category, self.OVERFLOW_TEMPLATE)
+        self.template_counts[key] += count
+        self._exemplars.setdefault(key, error_info)
+    
+    def merge(self, other: "ErrorHandler"):
+        """다른 수집기(다른 스레드/프로세스)의 결과 병합"""
+        with other._lock:
+            templates = list(other.template_counts.items())
+            exemplars = dict(other._exemplars)
+            samples = {cat: list(items) for cat, items in other._samples.items()}
         
-        logger.error(f"[{category}] {message} {context}")
+        with self._lock:
+            for (category, template), count in templates:
+                self._count(exemplars[(category, template)], template, count)
+            for category, items in samples.items():
+                merged = self._samples[category]
+                merged.extend(items[:max(self.max_samples - len(merged), 0)])
     
     def has_errors(self) -> bool:
         """오류가 있는지 확인"""
-        return len(self.errors) > 0
+        return sum(self.error_counts.values()) > 0
     
     def get_summary(self) -> Dict[str, int]:
         """오류 요약 반환"""
         return dict(self.error_counts)
     
+    def get_template_summary(self, limit: int = 10) -> List[Dict[str, object]]:
+        """메시지 템플릿별 오류 요약 (빈도순)"""
+        with self._lock:
+            items = self.template_counts.most_common(limit)
+            return [
+                {
+                    "category": category,
+                    "template": template,
+                    "count": count,
+                    "example": self._exemplars[(category, template)].message,
+                    "context": self._exemplars[(category, template)].context
+                }
+                for (category, template), count in items
+            ]
+    
     def get_errors_by_category(self, category: str) -> List[ErrorInfo]:
-        """카테고리별 오류 목록"""
-        return [error for error in self.errors if error.category == category]
+        """카테고리별 오류 표본 목록"""
+        return list(self._samples.get(category, []))
+    
+    @property
+    def errors(self) -> List[ErrorInfo]:
+        """보관 중인 모든 오류 표본"""
+        return [error for samples in self._samples.values() for error in samples]
+    
+    def log_summary(self, limit: int = 5):
+        """수집된 오류를 한 번에 요약 로깅"""
+        if not self.has_errors():
+            return
+        
+        total = sum(self.error_counts.values())
+        logger.warning(f"분석 중 오류 {total}건 발생: {self.get_summary()}")
+        for item in self.get_template_summary(limit):
+            logger.warning(f"  - [{item['category']}] {item['count']}건: {item['template']} "
+                           f"(예: {item['example']} {item['context']})")
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
 class StatisticsCalculator:
     """통계 계산기"""
@@ -145,22 +483,31 @@ class StatisticsCalculator:
         if not functions:
             return {}
         
-        # 기본 통계
+        # 기본 통계 (호출 수는 호출 위치 기준이므로 호출 관계 모드와 무관)
         total_functions = len(functions)
-        total_calls = sum(len(func.calls) for func in functions.values())
+        total_calls = sum(func.get_call_count() for func in functions.values())
         
         # 호출 복잡도 (함수당 평균 호출 수)
         avg_calls_per_function = total_calls / total_functions if total_functions > 0 else 0
         
-        # 팬인/팬아웃 분석
+        # 팬인/팬아웃 분석 (서로 다른 호출자/피호출 함수 기준)
         caller_counts = defaultdict(int)  # 각 함수를 호출하는 함수의 수
         callee_counts = {}  # 각 함수가 호출하는 함수의 수
         
         for func_name, func_info in functions.items():
-            callee_counts[func_name] = len(func_info.calls)
+            callee_names = func_info.get_callee_names()
+            callee_counts[func_name] = len(callee_names)
             
+            for callee_name in callee_names:
+                caller_counts[callee_name] += 1
+        
+        total_edges = sum(callee_counts.values())
+        
+        # 호출 종류별 호출 위치 수 (카탈로그 분류)
+        kind_counts = defaultdict(int)
+        for func_info in functions.values():
             for call in func_info.calls:
-                caller_counts[call.name] += 1
+                kind_counts[call.kind] += call.count
         
         # 최대/평균 팬인/팬아웃
         max_fan_in = max(caller_counts.values()) if caller_counts else 0
@@ -168,44 +515,90 @@ class StatisticsCalculator:
         avg_fan_in = sum(caller_counts.values()) / len(caller_counts) if caller_counts else 0
         avg_fan_out = sum(callee_counts.values()) / len(callee_counts) if callee_counts else 0
         
-        return {
+        stats = {
             "total_functions": total_functions,
             "total_calls": total_calls,
+            "total_edges": total_edges,
+            "internal_calls": kind_counts["internal"],
+            "external_calls": kind_counts["external"],
+            "builtin_calls": kind_counts["builtin"],
             "avg_calls_per_function": avg_calls_per_function,
             "max_fan_in": max_fan_in,
             "max_fan_out": max_fan_out,
             "avg_fan_in": avg_fan_in,
             "avg_fan_out": avg_fan_out
         }
+        
+        # 함수 지표 (function_metrics로 계산한 함수가 있을 때만)
+        measured = [func.metrics for func in functions.values() if func.metrics is not None]
+        if measured:
+            stats.update({
+                "measured_functions": len(measured),
+                "avg_lines_per_function": sum(m.lines for m in measured) / len(measured),
+                "max_lines_per_function": max(m.lines for m in measured),
+                "avg_complexity": sum(m.complexity for m in measured) / len(measured),
+                "max_complexity": max(m.complexity for m in measured),
+                "max_nesting": max(m.max_nesting for m in measured),
+                "avg_parameters": sum(m.parameters for m in measured) / len(measured),
+                "max_parameters": max(m.parameters for m in measured)
+            })
+        
+        return stats
     
     @staticmethod
-    def find_hotspots(call_tree) -> Dict[str, List[str]]:
-        """핫스팟 분석 (많이 호출되는 함수, 많이 호출하는 함수 등)"""
+    def find_hotspots(call_tree, include_centrality: bool = False, profile=None) -> Dict[str, List[str]]:
+        """핫스팟 분석 (많이 호출되는 함수, 많이 호출하는 함수 등)
+        
+        include_centrality이면 호출 그래프 중심성(PageRank, 매개 중심성, k-core) 기준
+        항목도 추가한다. profile(ProfileOverlay)이 주어지면 측정 비용 순위도 추가한다.
+        함수 지표가 있으면 순환 복잡도와 줄 수 기준 순위도 추가한다.
+        """
         functions = call_tree.functions
         
-        # 호출 빈도 계산
+        # 호출 빈도 계산 (라이브러리/내장 호출은 프로젝트 핫스팟에서 제외)
         call_frequency = defaultdict(int)
         for func_info in functions.values():
             for call in func_info.calls:
-                call_frequency[call.name] += 1
+                if call.kind == "internal":
+                    call_frequency[call.name] += call.count
         
         # 상위 호출되는 함수들
         most_called = sorted(call_frequency.items(), key=lambda x: x[1], reverse=True)[:10]
         
         # 가장 많이 호출하는 함수들
         most_calling = sorted(
-            [(name, len(info.calls)) for name, info in functions.items()],
+            [(name, info.get_call_count()) for name, info in functions.items()],
             key=lambda x: x[1], reverse=True
         )[:10]
         
         # 고아 함수들 (호출되지 않는 함수)
         orphaned = call_tree.get_orphaned_functions()
         
-        return {
+        hotspots = {
             "most_called_functions": [name for name, count in most_called],
             "most_calling_functions": [name for name, count in most_calling],
             "orphaned_functions": [func.full_name for func in orphaned[:10]]
         }
+        
+        measured = [(name, info.metrics) for name, info in functions.items() if info.metrics is not None]
+        if measured:
+            hotspots["most_complex_functions"] = [
+                name for name, metrics in sorted(measured, key=lambda item: (-item[1].complexity, item[0]))[:10]
+                if metrics.branches
+            ]
+            hotspots["largest_functions"] = [
+                name for name, metrics in sorted(measured, key=lambda item: (-item[1].lines, item[0]))[:10]
+            ]
+        
+        if include_centrality:
+            from .centrality import CentralityEngine
+            hotspots.update(CentralityEngine(call_tree).hotspots())
+        
+        if profile is not None:
+            hotspots["costliest_functions"] = profile.ranked_functions("self", 10)
+            hotspots["costliest_cumulative_functions"] = profile.ranked_functions("cumulative", 10)
+        
+        return hotspots
 
 class CodeFormatter:
     """코드 출력 포매터"""
@@ -218,10 +611,18 @@ class CodeFormatter:
         
         for func_name, func_info in sorted(call_tree.functions.items()):
             lines.append(f"{func_name} ({func_info.file_path}:{func_info.line})")
+            metrics = func_info.metrics
+            if metrics is not None:
+                lines.append(f"  [lines {metrics.lines}, complexity {metrics.complexity}, "
+                             f"nesting {metrics.max_nesting}, params {metrics.parameters}, "
+                             f"end line {metrics.end_line}]")
             
             if func_info.calls:
                 for call in func_info.calls:
-                    lines.append(f"  └─ {call.name} (line {call.line})")
+                    suffix = f" x{call.count}" if call.count > 1 else ""
+                    if call.kind != "internal":
+                        suffix += f" [{call.kind}]"
+                    lines.append(f"  └─ {call.name} (line {call.line}){suffix}")
             else:
                 lines.append("  └─ (no calls)")
             
@@ -0,0 +1,333 @@
+"""여러 저장소를 한 번에 분석하는 작업 공간(workspace) 모드
+
+매니페스트에 나열한 저장소들을 하나의 프로세스에서 분석한다. 워커 풀, 파서 캐시,
+대용량 파일 슬롯은 모든 저장소가 공유하고, 모든 저장소의 파일을 한 작업 큐로
+스케줄하므로 저장소 경계에서 워커가 쉬지 않는다. 함수/호출 이름은 공용 intern 표로
+합쳐 저장소 사이에 같은 문자열을 한 번만 보관한다. 저장소별 결과는 그 저장소의
+파일이 모두 끝나는 대로 반환하며, 원하면 전체를 합친 그래프도 만들 수 있다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Set, Tuple, Optional, Iterable, Iterator
+
+from .models import CallTree, CallTreeBuilder, ProjectInfo, FileResult, FunctionInfo, RollupGraph
+from .analyzer import CallTreeAnalyzer
+from .config import ANALYSIS_CONFIG
+from .utils import FileScanner, ProgressTracker, find_duplicate_files
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class Repository:
+    """작업 공간의 저장소 하나 (name은 출력 파일 이름과 저장소 단위 그래프의 노드 이름)"""
+    name: str
+    path: Path
+
+@dataclass
+class RepositoryResult:
+    """저장소 하나의 분석 결과"""
+    repository: Repository
+    call_tree: CallTree
+    project_info: ProjectInfo
+
+def load_manifest(manifest_path: str) -> List[Repository]:
+    """작업 공간 매니페스트 로드
+    
+    JSON이면 저장소 목록 또는 {"repositories": [...]} 형식이며, 각 항목은 경로 문자열이나
+    {"name": ..., "path": ...}이다. 그 외에는 한 줄에 경로 하나인 텍스트로 읽는다 (#은 주석).
+    상대 경로는 매니페스트 파일 위치 기준이며, 이름을 생략하면 디렉터리 이름을 사용한다.
+    """
+    manifest_path = Path(manifest_path)
+    content = manifest_path.read_text(encoding='utf-8')
+    base_dir = manifest_path.resolve().parent
+    
+    try:
+        data = json.loads(content)
+    except ValueError:
+        data = [line.strip() for line in content.splitlines()
+                if line.strip() and not line.strip().startswith("#")]
+    if isinstance(data, dict):
+        data = data.get("repositories", [])
+    if not isinstance(data, list):
+        raise ValueError(f"매니페스트 형식이 올바르지 않습니다: {manifest_path}")
+    
+    repositories = []
+    for entry in data:
+        if isinstance(entry, str):
+            entry = {"path": entry}
+        if not isinstance(entry, dict) or not entry.get("path"):
+            raise ValueError(f"매니페스트 항목에 경로가 없습니다: {entry}")
+        path = (base_dir / Path(entry["path"]).expanduser()).resolve()
+        if not path.is_dir():
+            raise ValueError(f"저장소 경로가 디렉터리가 아닙니다: {path}")
+        repositories.append(Repository(name=str(entry.get("name") or path.name), path=path))
+    
+    _validate_repositories(repositories)
+    return repositories
+
+class StringTable:
+    """여러 저장소의 결과가 공유하는 문자열 intern 표
+    
+    파서는 파일마다 새 문자열을 만들므로 같은 함수/호출 이름이 저장소 수만큼 복제된다.
+    병합할 때 이 표의 문자열로 바꾸면 같은 이름은 객체 하나만 남는다.
+    """
+    
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+        self.lookups = 0
+    
+    def __len__(self) -> int:
+        return len(self._strings)
+    
+    def intern(self, value: str) -> str:
+        self.lookups += 1
+        return self._strings.setdefault(value, value)
+    
+    def intern_functions(self, functions: Iterable[FunctionInfo]):
+        """함수 이름과 호출 대상 이름을 표의 문자열로 교체"""
+        strings = self._strings
+        count = 0
+        for func in functions:
+            func.name = strings.setdefault(func.name, func.name)
+            count += 1
+            for call in func.calls:
+                call.name = strings.setdefault(call.name, call.name)
+                count += 1
+        self.lookups += count
+
+class _RepositoryState:
+    """분석 중인 저장소의 분석기와 남은 파일 수"""
+    
+    def __init__(self, repository: Repository, analyzer: CallTreeAnalyzer):
+        self.repository = repository
+        self.analyzer = analyzer
+        self.source_files: List[Path] = []
+        self.remaining = 0
+
+class WorkspaceAnalyzer:
+    """여러 저장소를 워커 풀과 캐시를 공유하며 분석하는 분석기"""
+    
+    def __init__(self, max_workers: int = 4, progress_tracker: Optional[ProgressTracker] = None):
+        self.max_workers = max_workers
+        self.progress_tracker = progress_tracker or ProgressTracker()
+        self.strings = StringTable()
+        
+        # 모든 저장소의 분석기가 공유하는 파서 캐시와 대용량 파일 슬롯
+        self._parser_cache: Dict[str, object] = {}
+        self._large_file_slots = threading.BoundedSemaphore(max(1, ANALYSIS_CONFIG["large_file_workers"]))
+    
+    def create_analyzer(self) -> CallTreeAnalyzer:
+        """저장소별 분석기 생성 (파서 캐시, 진행상황, 대용량 파일 슬롯 공유)"""
+        analyzer = CallTreeAnalyzer(max_workers=self.max_workers, progress_tracker=self.progress_tracker,
+                                    parser_cache=self._parser_cache)
+        analyzer._large_file_slots = self._large_file_slots
+        return analyzer
+    
+    def iter_repositories(self, repositories: List[Repository]) -> Iterator[RepositoryResult]:
+        """저장소들을 분석하며 파일이 모두 끝난 저장소부터 결과 반환
+        
+        파일은 매니페스트 순서대로 한 작업 큐에 제출하므로 앞 저장소의 마지막 파일을
+        분석하는 동안 다음 저장소의 파일이 이미 실행된다. 내용이 같은 파일은 저장소가
+        달라도 한 번만 분석하며, 다른 저장소의 사본에는 결과를 복제한다 (collapse는
+        같은 저장소 안의 사본에만 적용). deadline_seconds는 작업 공간 전체에 적용된다.
+        """
+        _validate_repositories(repositories)
+        start = time.perf_counter()
+        deadline = ANALYSIS_CONFIG["deadline_seconds"]
+        deadline_at = start + deadline if deadline is not None else None
+        states = [_RepositoryState(repository, self.create_analyzer()) for repository in repositories]
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # 1. 저장소 스캔 (병렬)
+                scanned = executor.map(lambda state: FileScanner().scan_directory(state.repository.path), states)
+                owner: Dict[Path, int] = {}
+                for index, (state, source_files) in enumerate(zip(states, scanned)):
+                    analyzer = state.analyzer
+                    analyzer.project_info = ProjectInfo(root_path=state.repository.path)
+                    analyzer._deadline = deadline_at
+                    analyzer._build_project_info(source_files)
+                    state.source_files = source_files
+                    state.remaining = len(source_files)
+                    for file_path in source_files:
+                        owner[file_path] = index
+                
+                all_files = [path for state in states for path in state.source_files]
+                logger.info(f"작업 공간: 저장소 {len(states)}개, 소스 파일 {len(all_files)}개")
+                
+                # 파일이 없는 저장소는 바로 반환
+                for state in states:
+                    if not state.remaining:
+                        yield self._finish(state)
+                if not all_files:
+                    return
+                
+                # 2. 모든 저장소에 필요한 언어의 파서만 한 번씩 로드
+                languages = set().union(*(state.analyzer.project_info.supported_languages for state in states))
+                states[0].analyzer._preload_parsers(languages)
+                
+                # 3. 내용이 같은 파일은 작업 공간 전체에서 대표 파일만 파싱
+                dedup_mode = ANALYSIS_CONFIG["deduplicate_files"]
+                duplicates = find_duplicate_files(all_files, executor) if dedup_mode != "off" else {}
+                skipped = {path for paths in duplicates.values() for path in paths}
+                if skipped:
+                    logger.info(f"중복 내용 파일 {len(skipped)}개 파싱 생략 (고유 내용 {len(duplicates)}개)")
+                
+                # 4. 모든 저장소의 파일을 하나의 큐로 분석
+                self.progress_tracker.start(len(all_files))
+                items = [(path, owner[path]) for path in all_files if path not in skipped]
+                analyzed = states[0].analyzer._bounded_map(
+                    executor, lambda item: states[item[1]].analyzer._analyze_file_tracked(item[0]), items
+                )
+                for (file_path, index), result in analyzed:
+                    finished = [self._accept(states[index], result)]
+                    duplicate_paths = duplicates.get(file_path, ())
+                    self.progress_tracker.update(len(duplicate_paths))
+                    for duplicate_path in duplicate_paths:
+                        target = states[owner[duplicate_path]]
+                        duplicate = None
+                        if result is not None:
+                            collapse = dedup_mode == "collapse" and target is states[index]
+                            duplicate = target.analyzer._duplicate_result(result, duplicate_path, collapse)
+                        finished.append(self._accept(target, duplicate))
+                    
+                    for state in finished:
+                        if state is not None:
+                            yield self._finish(state)
+        finally:
+            for state in states:
+                state.analyzer._deadline = None
+            self.progress_tracker.finish()
+        
+        logger.info(f"작업 공간 분석 완료: {time.perf_counter() - start:.1f}초, "
+                    f"intern 문자열 {len(self.strings)}개 (조회 {self.strings.lookups}회)")
+    
+    def analyze(self, repositories: List[Repository]) -> List[RepositoryResult]:
+        """모든 저장소를 분석하여 매니페스트 순서대로 결과 반환"""
+        results = {result.repository.name: result for result in self.iter_repositories(repositories)}
+        return [results[repository.name] for repository in repositories]
+    
+    def _accept(self, state: _RepositoryState, result: Optional[FileResult]) -> Optional[_RepositoryState]:
+        """파일 결과를 저장소 분석기에 병합하고, 저장소의 마지막 파일이면 상태 반환"""
+        if result is not None:
+            analyzer = state.analyzer
+            file_info = result.file_info
+            analyzer.project_info.files[file_info.path] = file_info
+            if file_info.duplicate_of is not None:
+                analyzer.project_info.duplicate_files[file_info.path] = file_info.duplicate_of
+            else:
+                self.strings.intern_functions(result.functions)
+                analyzer._merge_result(result)
+        
+        state.remaining -= 1
+        return state if not state.remaining else None
+    
+    def _finish(self, state: _RepositoryState) -> RepositoryResult:
+        analyzer = state.analyzer
+        call_tree = analyzer.builder.build()
+        if analyzer.project_info.files:
+            analyzer._post_process(call_tree)
+        logger.info(f"저장소 분석 완료: {state.repository.name} (파일 {len(analyzer.project_info.files)}개, "
+                    f"함수 {len(call_tree.functions)}개)")
+        return RepositoryResult(repository=state.repository, call_tree=call_tree,
+                                project_info=analyzer.project_info)
+
+class WorkspaceCombiner:
+    """저장소별 결과를 하나의 호출 트리로 합침
+    
+    함수 이름은 절대 경로를 포함하므로 저장소 사이에 겹치지 않고, 호출 대상은 이름으로
+    찾으므로 합친 그래프의 집계/중심성에는 저장소를 넘는 호출이 포함된다.
+    """
+    
+    def __init__(self, root_path: Optional[Path] = None):
+        self.root_path = root_path
+        self._results: List[RepositoryResult] = []
+    
+    def add(self, result: RepositoryResult):
+        self._results.append(result)
+    
+    def build(self) -> Tuple[CallTree, ProjectInfo]:
+        """합친 호출 트리와 프로젝트 정보 (루트는 모든 저장소의 공통 상위 디렉터리)"""
+        root_path = self.root_path
+        if root_path is None:
+            paths = [str(result.repository.path) for result in self._results]
+            root_path = Path(os.path.commonpath(paths)) if paths else Path(".")
+        
+        project_info = ProjectInfo(root_path=root_path)
+        builder = CallTreeBuilder()
+        for result in self._results:
+            functions_by_file = defaultdict(list)
+            for func_info in result.call_tree.functions.values():
+                functions_by_file[func_info.file_path].append(func_info)
+            
+            for file_info in result.project_info.files.values():
+                project_info.add_file(file_info)
+                functions = functions_by_file.pop(file_info.path, [])
+                builder.add_functions(functions)
+                project_info.rollup.add_functions(file_info.path, file_info.language, functions)
+            for functions in functions_by_file.values():
+                builder.add_functions(functions)
+            project_info.duplicate_files.update(result.project_info.duplicate_files)
+            project_info.output_fragments.update(result.project_info.output_fragments)
+        
+        call_tree = builder.build()
+        call_tree.sort_functions()
+        return call_tree, project_info
+    
+    def repository_graph(self) -> RollupGraph:
+        """저장소 단위 의존성 그래프
+        
+        파일 단위 집계와 같은 규칙으로, 호출한 저장소에 같은 이름이 정의되어 있으면
+        저장소 내부 호출로, 아니면 그 이름을 정의한 모든 저장소로 호출 수를 나눠 배분한다.
+        """
+        definitions: Dict[str, Set[str]] = defaultdict(set)
+        calls: Dict[str, Counter] = {}
+        graph = RollupGraph(granularity="repository")
+        
+        for result in self._results:
+            name = result.repository.name
+            graph.nodes[name] = len(result.call_tree.functions)
+            counter = calls.setdefault(name, Counter())
+            for func_info in result.call_tree.functions.values():
+                definitions[func_info.name].add(name)
+                for call in func_info.calls:
+                    if call.kind == "internal":
+                        counter[call.name] += call.count
+        
+        edges = Counter()
+        for source, counter in calls.items():
+            for callee_name, count in counter.items():
+                targets = definitions.get(callee_name)
+                if not targets:
+                    graph.unresolved_calls += count
+                elif source in targets:
+                    edges[(source, source)] += count
+                else:
+                    share = count / len(targets)
+                    for target in targets:
+                        edges[(source, target)] += share
+        graph.edges = dict(edges)
+        return graph
+
+def _validate_repositories(repositories: List[Repository]):
+    names = [repository.name for repository in repositories]
+    duplicated = sorted({name for name in names if names.count(name) > 1})
+    if duplicated:
+        raise ValueError(f"저장소 이름이 중복됩니다 (매니페스트에 name 지정 필요): {', '.join(duplicated)}")
+    invalid = [name for name in names if not name or name in (".", "..") or "/" in name or os.sep in name]
+    if invalid:
+        raise ValueError(f"저장소 이름으로 사용할 수 없습니다: {', '.join(map(repr, invalid))}")
+    
+    # 한 파일이 두 저장소에 속하면 저장소별 결과가 겹치므로 중첩된 저장소는 허용하지 않음
+    paths = sorted(repository.path for repository in repositories)
+    for parent, child in zip(paths, paths[1:]):
+        if child == parent or parent in child.parents:
+            raise ValueError(f"저장소 경로가 겹칩니다: {parent}, {child}")